@@ -8,10 +8,12 @@ Bu Flask uygulaması, C fonksiyonları için otomatik test üretimi sağlar.
 import os
 import sys
 import json
+import queue
 import tempfile
+import threading
 from pathlib import Path
-from typing import List, Dict, Any
-from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for
+from typing import List, Dict, Any, Iterator
+from flask import Flask, Response, render_template, request, jsonify, send_file, flash, redirect, url_for, stream_with_context
 from werkzeug.utils import secure_filename
 import zipfile
 import io
@@ -23,7 +25,9 @@ load_dotenv()
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from src.parser.doxygen_parser import DoxygenParser, DoxygenFunction
+from src.parser.symbol_index import SymbolIndex
 from src.analyzer.llm_analyzer import LLMAnalyzer, FunctionAnalysis
+from src.analyzer.scheduler import PRIORITY_INTERACTIVE
 from src.generator.test_generator import TestGenerator, GeneratedTestSuite
 from src.utils.config import config
 from src.utils.logger import get_logger, setup_logger
@@ -54,8 +58,10 @@ class WebTestGenerator:
     
     def __init__(self):
         self.logger = get_logger(__name__)
-        self.doxygen_parser = DoxygenParser()
-        self.llm_analyzer = LLMAnalyzer()
+        self.symbol_index = SymbolIndex(Path(config.parser.index_path)) if config.parser.use_index else None
+        self.doxygen_parser = DoxygenParser(index=self.symbol_index)
+        # Kullanıcı istekleri, aynı süreçteki toplu analizler kapasiteyi doldurmuşken de beklemesin
+        self.llm_analyzer = LLMAnalyzer(reserved_interactive=max(1, config.llm.interactive_reserved))
         self.test_generator = TestGenerator()
     
     def analyze_file_content(self, content: str) -> Dict[str, Any]:
@@ -70,11 +76,15 @@ class WebTestGenerator:
                     'error': 'Dosyada Doxygen formatında fonksiyon bulunamadı'
                 }
             
-            # Her fonksiyon için LLM analizi yap
+            # Fonksiyonları eşzamanlı olarak LLM ile analiz et
+            analyses = self.llm_analyzer.analyze_many(functions, concurrency=config.llm.concurrency,
+                                                      priority=PRIORITY_INTERACTIVE)
+            
             analyzed_functions = []
-            for func in functions:
+            for func, analysis in zip(functions, analyses):
                 try:
-                    analysis = self.llm_analyzer.analyze_function(func)
+                    if isinstance(analysis, Exception):
+                        raise analysis
                     analyzed_functions.append({
                         'name': func.name,
                         'signature': func.signature,
@@ -132,13 +142,45 @@ class WebTestGenerator:
                 'error': f'Dosya analizi hatası: {str(e)}'
             }
     
+    def get_function_info(self, name: str) -> Dict[str, Any]:
+        """Sembol indeksinden tek bir fonksiyonun bilgilerini al (parse etmeden)"""
+        if self.symbol_index is None:
+            return {'success': False, 'error': 'Sembol indeksi devre dışı'}
+        
+        entries = self.symbol_index.lookup(name)
+        if not entries:
+            return {'success': False, 'error': f'Fonksiyon bulunamadı: {name}'}
+        
+        function = self.symbol_index.get_function(name, Path(entries[0].path))
+        if function is None:
+            return {'success': False, 'error': f'Fonksiyon bulunamadı: {name}'}
+        info = self.doxygen_parser.get_function_info(function)
+        info['locations'] = [
+            {
+                'path': entry.path,
+                'signature': entry.signature,
+                'doc_hash': entry.doc_hash,
+                'code_hash': entry.code_hash
+            }
+            for entry in entries
+        ]
+        
+        return {'success': True, 'function': info}
+    
     def generate_tests(self, content: str, framework: str = 'custom', 
                       include_ep: bool = True, include_bva: bool = True) -> Dict[str, Any]:
         """Test dosyaları üret"""
         try:
-            # Test üret
-            test_suite = self.test_generator.generate_from_content(
-                content=content,
+            functions = self.doxygen_parser.parse_content(content)
+            if not functions:
+                return {'success': False, 'error': 'Dosyada Doxygen formatında fonksiyon bulunamadı'}
+            
+            # İlk fonksiyon, ortak analyzer ve zamanlayıcı üzerinden etkileşimli öncelikle analiz edilir
+            function_info = self.doxygen_parser.get_function_info(functions[0])
+            analysis = self.llm_analyzer.analyze_function(function_info, priority=PRIORITY_INTERACTIVE)
+            
+            test_suite = self.test_generator.generate_from_analysis(
+                analysis,
                 framework=framework,
                 include_ep=include_ep,
                 include_bva=include_bva
@@ -159,6 +201,68 @@ class WebTestGenerator:
                 'error': f'Test üretimi hatası: {str(e)}'
             }
 
+    def generate_tests_stream(self, content: str, framework: str = 'custom',
+                              include_ep: bool = True, include_bva: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Test kodunu LLM yanıtı geldikçe parça parça üret
+        
+        Yields:
+            {'type': 'chunk', 'text': ...} olayları, ardından generate_tests
+            sonucunu içeren {'type': 'done', ...} veya {'type': 'error', ...}
+        """
+        try:
+            functions = self.doxygen_parser.parse_content(content)
+            if not functions:
+                yield {'type': 'error', 'success': False, 'error': 'Dosyada Doxygen formatında fonksiyon bulunamadı'}
+                return
+            
+            # generate_tests ile aynı şekilde ilk fonksiyon kullanılır
+            function_info = self.doxygen_parser.get_function_info(functions[0])
+            
+            # Analiz ayrı iş parçacığında çalışır, parçalar kuyruk üzerinden aktarılır
+            chunks = queue.Queue()
+            outcome = {}
+            
+            def analyze():
+                try:
+                    outcome['analysis'] = self.llm_analyzer.analyze_function(function_info, on_chunk=chunks.put,
+                                                                             priority=PRIORITY_INTERACTIVE)
+                except Exception as e:
+                    outcome['error'] = e
+                finally:
+                    chunks.put(None)
+            
+            threading.Thread(target=analyze, name="llm-stream", daemon=True).start()
+            
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                yield {'type': 'chunk', 'text': chunk}
+            
+            if 'error' in outcome:
+                raise outcome['error']
+            
+            test_suite = self.test_generator.generate_from_analysis(
+                outcome['analysis'],
+                framework=framework,
+                include_ep=include_ep,
+                include_bva=include_bva
+            )
+            
+            yield {
+                'type': 'done',
+                'success': True,
+                'test_code': test_suite.test_code,
+                'framework': framework,
+                'ep_tests': test_suite.ep_tests,
+                'bva_tests': test_suite.bva_tests
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Test üretimi hatası: {e}")
+            yield {'type': 'error', 'success': False, 'error': f'Test üretimi hatası: {str(e)}'}
+
 # Global test generator instance
 test_generator = WebTestGenerator()
 
@@ -240,6 +344,32 @@ def generate_tests():
         logger.error(f"Traceback: {traceback.format_exc()}")
         return jsonify({'success': False, 'error': f'Beklenmeyen hata: {str(e)}'})
 
+@app.route('/generate/stream', methods=['POST'])
+def generate_tests_stream():
+    """Test üretimi endpoint'i (Server-Sent Events, kod geldikçe gönderilir)"""
+    data = request.get_json()
+    
+    if not data or 'content' not in data:
+        logger.error("İçerik bulunamadı")
+        return jsonify({'success': False, 'error': 'İçerik bulunamadı'})
+    
+    events = test_generator.generate_tests_stream(
+        content=data['content'],
+        framework=data.get('framework', 'custom'),
+        include_ep=data.get('include_ep', True),
+        include_bva=data.get('include_bva', True)
+    )
+    
+    def sse():
+        for event in events:
+            yield f"data: {app.json.dumps(event)}\n\n"
+    
+    return Response(
+        stream_with_context(sse()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/download', methods=['POST'])
 def download_tests():
     """Test dosyalarını indir"""
@@ -337,6 +467,27 @@ def api_examples():
     
     return jsonify({'success': True, 'examples': example_files})
 
+@app.route('/api/functions/<name>')
+def api_function(name):
+    """Sembol indeksindeki fonksiyon bilgisi API endpoint'i"""
+    try:
+        return jsonify(test_generator.get_function_info(name))
+    except Exception as e:
+        logger.error(f"Fonksiyon bilgisi hatası: {name} - {e}")
+        return jsonify({'success': False, 'error': f'Beklenmeyen hata: {str(e)}'})
+
+@app.route('/api/scheduler')
+def api_scheduler():
+    """LLM istek zamanlayıcısının sınıf başına kuyruk bekleme süreleri"""
+    analyzer = test_generator.llm_analyzer
+    stats = analyzer.scheduler.snapshot()
+    if analyzer.limiter is not None:
+        stats['limiter'] = analyzer.limiter.snapshot()
+    stats['breaker'] = analyzer.breaker.snapshot()
+    if analyzer.quota is not None:
+        stats['quota'] = analyzer.quota.snapshot()
+    return jsonify({'success': True, 'scheduler': stats})
+
 @app.errorhandler(413)
 def too_large(e):
     """Dosya boyutu çok büyük hatası"""
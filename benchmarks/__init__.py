@@ -0,0 +1,3 @@
+"""
+Benchmark modülü - Parser ve test üretim hattı performans ölçümleri
+"""
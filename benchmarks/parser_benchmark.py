@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+DoxygenParser throughput benchmark'ı
+
+Sentetik, Doxygen formatında belgelenmiş C kaynakları üretir ve
+parse_content, _extract_doxygen_blocks ve _extract_function_code
+aşamalarının fonksiyon/sn, MB/sn ve tepe bellek değerlerini ölçer.
+Sonuçlar JSON olarak kaydedilip sonraki çalıştırmalarla karşılaştırılabilir.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Callable, Dict, Any, List, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.parser.doxygen_parser import DoxygenParser
+from src.utils.logger import setup_logger
+
+# Sentetik fonksiyonlarda kullanılan Doxygen tag'leri
+_OPTIONAL_TAGS = [
+    " * @details Ayrıntılı açıklama {index}; değer 0 ile 100 arasında olmalıdır.",
+    " * @pre value >= 0",
+    " * @post Sonuç önbelleğe yazılır",
+    " * @note Not {index}: \"tırnak\" ve // yorum benzeri metin içerir",
+    " * @warning NULL pointer verilmemelidir",
+    " * @throws Hata durumunda -1 döner",
+]
+
+_RETURN_TYPES = ['int', 'void', 'long', 'unsigned', 'double']
+
+
+@dataclass
+class CorpusConfig:
+    """Sentetik korpus ayarları"""
+    functions: int = 5000
+    tag_density: float = 0.5    # opsiyonel tag'lerin eklenme olasılığı
+    body_size: int = 8          # gövde başına ifade sayısı
+    nesting_depth: int = 2      # iç içe blok derinliği
+    seed: int = 42
+
+
+@dataclass
+class StageResult:
+    """Tek aşamanın ölçüm sonucu"""
+    stage: str
+    seconds: float
+    functions_per_sec: float
+    mb_per_sec: float
+    peak_memory_mb: float
+
+
+def generate_corpus(corpus: CorpusConfig) -> str:
+    """
+    Doxygen formatında belgelenmiş sentetik C kaynağı üret
+
+    Args:
+        corpus: Korpus ayarları
+
+    Returns:
+        C kaynak metni
+    """
+    rng = random.Random(corpus.seed)
+    parts = ['/**\n * @file synthetic.c\n * @brief Sentetik benchmark korpusu\n */\n\n#include <stdio.h>\n\n']
+
+    for index in range(corpus.functions):
+        param_count = rng.randint(0, 4)
+        params = [f"p{i}" for i in range(param_count)]
+
+        lines = ['/**', f' * @brief Sentetik fonksiyon {index}']
+        for param in params:
+            lines.append(f' * @param [in] {param} {param} parametresi, 0 to {rng.randint(1, 1000)}')
+        for tag in _OPTIONAL_TAGS:
+            if rng.random() < corpus.tag_density:
+                lines.append(tag.format(index=index))
+        lines.append(' * @return Hesaplanan değer')
+        lines.append(' */')
+
+        return_type = rng.choice(_RETURN_TYPES)
+        arguments = ', '.join(f"int {param}" for param in params) or 'void'
+        lines.append(f'{return_type} synthetic_{index}({arguments}) {{')
+        lines.append(_generate_body(rng, corpus.body_size, corpus.nesting_depth, 1))
+        lines.append('}\n')
+
+        parts.append('\n'.join(lines) + '\n')
+
+    return ''.join(parts)
+
+
+def _generate_body(rng: random.Random, size: int, depth: int, indent: int) -> str:
+    """Rastgele ifadelerden ve iç içe bloklardan oluşan gövde üret"""
+    pad = '    ' * indent
+    statements = []
+
+    for i in range(size):
+        choice = rng.random()
+        if depth > 0 and choice < 0.2:
+            inner = _generate_body(rng, max(1, size // 2), depth - 1, indent + 1)
+            statements.append(f'{pad}if (x{i} > {rng.randint(0, 100)}) {{\n{inner}\n{pad}}}')
+        elif choice < 0.4:
+            statements.append(f'{pad}const char *s{i} = "{{ string }}";  // }} yorum')
+        else:
+            statements.append(f'{pad}int x{i} = {rng.randint(0, 1000)} + {i};')
+
+    return '\n'.join(statements)
+
+
+def measure(stage: str, func: Callable[[], int], size_bytes: int, repeat: int) -> StageResult:
+    """
+    Aşamayı ölç (en iyi süre ve tepe bellek)
+
+    Args:
+        stage: Aşama adı
+        func: Çalıştırılacak fonksiyon; işlenen fonksiyon sayısını döndürür
+        size_bytes: Girdi boyutu
+        repeat: Tekrar sayısı
+
+    Returns:
+        Ölçüm sonucu
+    """
+    best = float('inf')
+    count = 0
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return StageResult(
+        stage=stage,
+        seconds=best,
+        functions_per_sec=count / best if best else 0.0,
+        mb_per_sec=size_bytes / 1e6 / best if best else 0.0,
+        peak_memory_mb=peak / 1e6
+    )
+
+
+def run_benchmark(corpus: CorpusConfig, repeat: int = 3) -> Dict[str, Any]:
+    """
+    Korpusu üret ve parser aşamalarını ölç
+
+    Args:
+        corpus: Korpus ayarları
+        repeat: Her aşama için tekrar sayısı
+
+    Returns:
+        Makine tarafından okunabilir sonuç sözlüğü
+    """
+    content = generate_corpus(corpus)
+    size_bytes = len(content.encode('utf-8'))
+    parser = DoxygenParser()
+    blocks = parser._extract_doxygen_blocks(content)
+
+    def extract_code() -> int:
+        count = 0
+        for block in blocks:
+            span = parser._extract_function_code(block)
+            if span:
+                content[span[0]:span[0] + span[1]]
+                count += 1
+        return count
+
+    results: List[StageResult] = [
+        measure('parse_content', lambda: len(parser.parse_content(content)), size_bytes, repeat),
+        measure('_extract_doxygen_blocks', lambda: len(parser._extract_doxygen_blocks(content)), size_bytes, repeat),
+        measure('_extract_function_code', extract_code, size_bytes, repeat),
+    ]
+
+    return {
+        'corpus': asdict(corpus),
+        'size_mb': size_bytes / 1e6,
+        'python': sys.version.split()[0],
+        'results': {result.stage: asdict(result) for result in results}
+    }
+
+
+def compare_with_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """
+    Sonuçları baseline ile karşılaştır
+
+    Args:
+        report: Güncel sonuçlar
+        baseline: Kaydedilmiş sonuçlar
+        tolerance: İzin verilen throughput düşüşü (0.2 = %20)
+
+    Returns:
+        Gerileme mesajları (boşsa gerileme yok)
+    """
+    regressions = []
+
+    for stage, result in report['results'].items():
+        reference = baseline.get('results', {}).get(stage)
+        if not reference:
+            continue
+
+        floor = reference['functions_per_sec'] * (1 - tolerance)
+        if result['functions_per_sec'] < floor:
+            regressions.append(
+                f"{stage}: {result['functions_per_sec']:.0f} fonksiyon/sn "
+                f"(baseline {reference['functions_per_sec']:.0f}, alt sınır {floor:.0f})"
+            )
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark komut satırı arayüzü"""
+    parser = argparse.ArgumentParser(description="DoxygenParser throughput benchmark'ı")
+    parser.add_argument('--functions', type=int, default=CorpusConfig.functions, help='Fonksiyon sayısı')
+    parser.add_argument('--tag-density', type=float, default=CorpusConfig.tag_density,
+                        help='Opsiyonel tag olasılığı (0-1)')
+    parser.add_argument('--body-size', type=int, default=CorpusConfig.body_size, help='Gövde başına ifade sayısı')
+    parser.add_argument('--nesting-depth', type=int, default=CorpusConfig.nesting_depth, help='İç içe blok derinliği')
+    parser.add_argument('--seed', type=int, default=CorpusConfig.seed, help='Rastgelelik tohumu')
+    parser.add_argument('--repeat', type=int, default=3, help='Aşama başına tekrar sayısı')
+    parser.add_argument('--output', type=Path, help='Sonuçları JSON olarak kaydet')
+    parser.add_argument('--baseline', type=Path, help='Karşılaştırılacak baseline JSON dosyası')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='İzin verilen throughput düşüşü (varsayılan: 0.2)')
+    parser.add_argument('--write-corpus', type=Path, help='Üretilen korpusu dosyaya yaz ve çık')
+    args = parser.parse_args(argv)
+
+    setup_logger(level='WARNING')
+
+    corpus = CorpusConfig(
+        functions=args.functions,
+        tag_density=args.tag_density,
+        body_size=args.body_size,
+        nesting_depth=args.nesting_depth,
+        seed=args.seed
+    )
+
+    if args.write_corpus:
+        args.write_corpus.write_text(generate_corpus(corpus), encoding='utf-8')
+        return 0
+
+    report = run_benchmark(corpus, repeat=args.repeat)
+
+    print(f"Korpus: {corpus.functions} fonksiyon, {report['size_mb']:.2f} MB")
+    for stage, result in report['results'].items():
+        print(f"  {stage:<26} {result['seconds']:8.3f} sn  {result['functions_per_sec']:>12,.0f} fonksiyon/sn  "
+              f"{result['mb_per_sec']:8.2f} MB/sn  tepe bellek {result['peak_memory_mb']:.1f} MB")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+        regressions = compare_with_baseline(report, baseline, args.tolerance)
+        for message in regressions:
+            print(f"GERİLEME: {message}")
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Uçtan uca test üretim hattı benchmark'ı
+
+main.py'deki BlackBoxTestGenerator'ı kaydedilmiş LLM kasetleriyle (replay
+modu) ağ ve API anahtarı olmadan çalıştırır; dosya başına gecikmenin
+p50/p95/p99 değerlerini ve fonksiyon/sn throughput'unu ölçer. Kasetler önce
+--llm-mode record ile gerçek API'ye karşı kaydedilmelidir.
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.utils.config import config
+from src.utils.logger import setup_logger
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    En yakın sıra yöntemiyle yüzdelik değer
+
+    Args:
+        values: Ölçümler
+        fraction: 0-1 arası yüzdelik (ör. 0.95)
+
+    Returns:
+        Yüzdelik değer (liste boşsa 0)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def run_benchmark(inputs: List[Path], runs: int = 3) -> Dict[str, Any]:
+    """
+    Girdi dosyalarını runs kez işle ve gecikme/throughput ölç
+
+    Args:
+        inputs: C kaynak dosyaları
+        runs: Tekrar sayısı
+
+    Returns:
+        Ölçüm raporu
+    """
+    from main import BlackBoxTestGenerator
+
+    generator = BlackBoxTestGenerator()
+    latencies = []
+    functions = 0
+    failures = 0
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        start = time.perf_counter()
+        for run in range(runs):
+            for index, input_file in enumerate(inputs):
+                parsed = generator.doxygen_parser.parse_file(input_file)
+                output_file = Path(output_dir) / f"{run}_{index}_{input_file.stem}_tests.c"
+
+                file_start = time.perf_counter()
+                if not generator.generate_tests_from_file(input_file, output_file, functions=parsed):
+                    failures += 1
+                latencies.append(time.perf_counter() - file_start)
+                functions += len(parsed)
+        total = time.perf_counter() - start
+
+    cassettes = generator.llm_analyzer.cassettes
+    return {
+        'mode': config.llm.mode,
+        'replay_latency': config.llm.replay_latency,
+        'concurrency': config.llm.concurrency,
+        'files': len(latencies),
+        'functions': functions,
+        'failures': failures,
+        'seconds': total,
+        'functions_per_sec': functions / total if total else 0.0,
+        'p50': percentile(latencies, 0.50),
+        'p95': percentile(latencies, 0.95),
+        'p99': percentile(latencies, 0.99),
+        'max': max(latencies, default=0.0),
+        'backend': generator.llm_analyzer.backend.metrics.snapshot(),
+        'limiter': generator.llm_analyzer.limiter.snapshot() if generator.llm_analyzer.limiter else None,
+        'routes': generator.llm_analyzer.router.snapshot() if generator.llm_analyzer.router else None,
+        'hedging': generator.llm_analyzer.hedge_stats.snapshot() if config.llm.hedge else None,
+        'dedup_saved': generator.llm_analyzer.dedup.saved if generator.llm_analyzer.dedup else 0,
+        'replayed': cassettes.replayed if cassettes else None,
+        'cassette_misses': cassettes.misses if cassettes else None
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Benchmark komut satırı arayüzü"""
+    parser = argparse.ArgumentParser(description="Uçtan uca test üretim hattı benchmark'ı")
+    parser.add_argument('inputs', type=Path, nargs='+', help='C dosyaları veya klasörleri')
+    parser.add_argument('--runs', type=int, default=3, help='Tekrar sayısı')
+    parser.add_argument('--cassette-dir', default=config.llm.cassette_dir, help='Kaset klasörü')
+    parser.add_argument('--latency', default='recorded',
+                        help='Simüle edilen gecikme: none, recorded, fixed:S, uniform:A,B, normal:M,S, lognormal:MEDYAN,SIGMA')
+    parser.add_argument('--concurrency', type=int, default=config.llm.concurrency, help='Eşzamanlı analiz sayısı')
+    parser.add_argument('--adaptive-concurrency', action='store_true',
+                        help='Eşzamanlılık sınırını 429/gecikmeye göre uyarla (--concurrency başlangıç değeri olur)')
+    parser.add_argument('--hedge', action='store_true',
+                        help='Gecikmenin p95 değerini aşan isteklerin kopyasını gönder (%%5 bütçeyle)')
+    parser.add_argument('--api-url', help='Kasetler yerine bu uç noktayı kullan (ör. yerel sunucu)')
+    parser.add_argument('--output', type=Path, help='Sonuçları JSON olarak kaydet')
+    args = parser.parse_args(argv)
+
+    setup_logger(level='WARNING')
+
+    config.llm.use_cache = False
+    config.parser.use_cache = False
+    config.parser.use_index = False
+    config.llm.concurrency = args.concurrency
+    config.llm.adaptive_concurrency = args.adaptive_concurrency
+    config.llm.hedge = args.hedge
+    if args.api_url:
+        config.llm.mode = 'live'
+        config.llm.api_url = args.api_url
+    else:
+        config.llm.mode = 'replay'
+        config.llm.cassette_dir = args.cassette_dir
+        config.llm.replay_latency = args.latency
+
+    inputs = []
+    for path in args.inputs:
+        inputs.extend(sorted(path.rglob('*.c')) if path.is_dir() else [path])
+
+    report = run_benchmark(inputs, runs=args.runs)
+
+    print(f"{report['files']} dosya, {report['functions']} fonksiyon, {report['seconds']:.2f} sn "
+          f"({report['functions_per_sec']:.2f} fonksiyon/sn, başarısız: {report['failures']})")
+    print(f"  dosya gecikmesi  p50 {report['p50']:.3f} sn  p95 {report['p95']:.3f} sn  "
+          f"p99 {report['p99']:.3f} sn  max {report['max']:.3f} sn")
+    backend = report['backend']
+    print(f"  {config.llm.backend} backend'i: {backend['requests']} istek, ortalama {backend['mean_latency']:.3f} sn, "
+          f"p95 {backend['p95_latency']:.3f} sn, {backend['requests_per_sec']:.2f} istek/sn")
+    for name, route in (report['routes'] or {}).items():
+        print(f"  {name} rotası ({route['model']}): {route['requests']} istek, {route['failures']} hata, "
+              f"ortalama {route['mean_latency']:.3f} sn, p95 {route['p95_latency']:.3f} sn")
+    if report['limiter'] is not None:
+        limiter = report['limiter']
+        print(f"  uyarlanır eşzamanlılık: sınır {limiter['limit']} (en düşük {limiter['lowest_limit']}, "
+              f"en yüksek {limiter['highest_limit']}, aynı anda en fazla {limiter['peak_in_flight']} istek)")
+    if report['hedging'] is not None:
+        hedging = report['hedging']
+        print(f"  istek kopyalama: {hedging.get('requests', 0)} istek, {hedging.get('hedged', 0)} kopya, "
+              f"{hedging.get('hedge_wins', 0)} kopya kazandı, {hedging.get('budget_denied', 0)} bütçe, "
+              f"{hedging.get('capacity_denied', 0)} kapasite nedeniyle gönderilmedi")
+    if report['replayed'] is not None:
+        print(f"  {report['replayed']} yanıt kasetten oynatıldı, {report['cassette_misses']} kaset bulunamadı")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
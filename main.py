@@ -16,7 +16,10 @@ from typing import List, Optional
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from src.parser.doxygen_parser import DoxygenParser, DoxygenFunction
+from src.parser.parse_cache import ParseCache
+from src.parser.symbol_index import SymbolIndex
 from src.analyzer.llm_analyzer import LLMAnalyzer, FunctionAnalysis
+from src.analyzer.scheduler import PRIORITIES
 from src.generator.test_generator import TestGenerator, GeneratedTestSuite
 from src.utils.config import config
 from src.utils.logger import get_logger, setup_logger
@@ -29,7 +32,9 @@ class BlackBoxTestGenerator:
     
     def __init__(self):
         self.logger = get_logger(__name__)
-        self.doxygen_parser = DoxygenParser()
+        parse_cache = ParseCache(Path(config.parser.cache_dir)) if config.parser.use_cache else None
+        self.symbol_index = SymbolIndex(Path(config.parser.index_path)) if config.parser.use_index else None
+        self.doxygen_parser = DoxygenParser(cache=parse_cache, index=self.symbol_index)
         self.llm_analyzer = LLMAnalyzer()
         self.test_generator = TestGenerator()
     
@@ -57,26 +62,26 @@ class BlackBoxTestGenerator:
             self.logger.error(f"Examples klasörü bulunamadı: {examples_dir}")
             return False
         
-        # Examples klasöründeki tüm .c dosyalarını bul
-        c_files = list(examples_dir.glob("*.c"))
+        # Examples klasöründeki (alt klasörler dahil) tüm .c dosyalarını paralel parse et
+        parsed_files = self.doxygen_parser.parse_tree(examples_dir)
         
-        if not c_files:
+        if not parsed_files:
             self.logger.warning(f"Examples klasöründe C dosyası bulunamadı: {examples_dir}")
             return False
         
-        self.logger.info(f"{len(c_files)} C dosyası bulundu: {examples_dir}")
+        self.logger.info(f"{len(parsed_files)} C dosyası bulundu: {examples_dir}")
         
         success_count = 0
         
-        for c_file in c_files:
+        for c_file, functions in parsed_files.items():
             try:
                 self.logger.info(f"İşleniyor: {c_file.name}")
                 
-                # Test dosyası adını oluştur
-                test_file = tests_dir / f"{c_file.stem}_tests.c"
+                # Test dosyası adını oluştur (klasör yapısını koru)
+                test_file = tests_dir / c_file.relative_to(examples_dir).parent / f"{c_file.stem}_tests.c"
                 
                 # Test üret
-                success = self.generate_tests_from_file(c_file, test_file)
+                success = self.generate_tests_from_file(c_file, test_file, functions=functions)
                 
                 if success:
                     success_count += 1
@@ -87,16 +92,18 @@ class BlackBoxTestGenerator:
             except Exception as e:
                 self.logger.error(f"Dosya işlenirken hata: {c_file.name} - {e}")
         
-        self.logger.info(f"Toplam {success_count}/{len(c_files)} dosya başarıyla işlendi")
+        self.logger.info(f"Toplam {success_count}/{len(parsed_files)} dosya başarıyla işlendi")
         return success_count > 0
     
-    def generate_tests_from_file(self, input_file: Path, output_file: Optional[Path] = None) -> bool:
+    def generate_tests_from_file(self, input_file: Path, output_file: Optional[Path] = None,
+                                 functions: Optional[List[DoxygenFunction]] = None) -> bool:
         """
         Dosyadan test üret
         
         Args:
             input_file: Giriş C dosyası
             output_file: Çıkış test dosyası
+            functions: Önceden parse edilmiş fonksiyonlar (verilmezse dosya parse edilir)
             
         Returns:
             Başarı durumu
@@ -104,35 +111,46 @@ class BlackBoxTestGenerator:
         try:
             self.logger.info(f"Test üretimi başlatılıyor: {input_file}")
             
-            # 1. Doxygen fonksiyonlarını parse et
-            functions = self.doxygen_parser.parse_file(input_file)
+            # 1-2. Doxygen fonksiyonlarını bulundukça eşzamanlı analiz et ve test üret
+            all_test_suites = []
             
-            if not functions:
-                self.logger.error("Doxygen fonksiyonu bulunamadı")
-                return False
+            if functions is None:
+                functions = self.doxygen_parser.iter_file(input_file)
+            
+            if output_file is None:
+                output_file = input_file.parent / f"{input_file.stem}_tests.c"
             
-            self.logger.info(f"{len(functions)} fonksiyon bulundu")
+            # Akış modunda yanıtlar geldikçe dosyaya yazılır
+            if config.llm.stream:
+                return self._stream_test_file(functions, output_file)
             
-            # 2. Her fonksiyon için test üret
-            all_test_suites = []
+            names = []
             
-            for function in functions:
-                self.logger.info(f"Fonksiyon analiz ediliyor: {function.name}")
-                
-                # Fonksiyon bilgilerini al
-                function_info = self.doxygen_parser.get_function_info(function)
-                
-                # LLM ile analiz et
-                llm_response = self.llm_analyzer.analyze_function(function_info)
+            def function_infos():
+                for function in functions:
+                    names.append(function.name)
+                    yield self.doxygen_parser.get_function_info(function)
+            
+            # LLM ile (veya yerel aralık çıkarımıyla) analiz et
+            analyses = self.llm_analyzer.analyze_many(function_infos(), concurrency=config.llm.concurrency,
+                                                      priority=config.llm.priority)
+            
+            for name, analysis in zip(names, analyses):
+                if isinstance(analysis, Exception):
+                    self.logger.error(f"Fonksiyon analizi başarısız, atlanıyor: {name} - {analysis}")
+                    continue
                 
                 # Test suite'i üret
-                test_suite = self.test_generator.generate_tests(llm_response)
-                all_test_suites.append((test_suite, llm_response))
+                test_suite = self._generate_suite(analysis)
+                all_test_suites.append((test_suite, analysis))
             
-            # 3. C kodu üret
-            if output_file is None:
-                output_file = input_file.parent / f"{input_file.stem}_tests.c"
+            if not all_test_suites:
+                self.logger.error("Doxygen fonksiyonu bulunamadı")
+                return False
             
+            self.logger.info(f"{len(all_test_suites)} fonksiyon işlendi")
+            
+            # 3. C kodu üret
             self._write_test_file(all_test_suites, output_file)
             
             self.logger.info(f"Test dosyası oluşturuldu: {output_file}")
@@ -142,6 +160,43 @@ class BlackBoxTestGenerator:
             self.logger.error(f"Test üretimi başarısız: {e}")
             return False
     
+    def generate_tests_for_function(self, function_name: str, output_file: Optional[Path] = None) -> bool:
+        """
+        Sembol indeksindeki tek bir fonksiyon için test üret
+        
+        Fonksiyon bilgisi dosya parse edilmeden indeksten okunur.
+        
+        Args:
+            function_name: Fonksiyon adı
+            output_file: Çıkış test dosyası (varsayılan: <fonksiyon>_tests.c)
+            
+        Returns:
+            Başarı durumu
+        """
+        if self.symbol_index is None:
+            self.logger.error("Sembol indeksi devre dışı")
+            return False
+        
+        entries = self.symbol_index.lookup(function_name)
+        if not entries:
+            self.logger.error(f"Fonksiyon sembol indeksinde bulunamadı: {function_name} "
+                              f"(önce --examples veya --input ile dosyaları işleyin)")
+            return False
+        
+        if len(entries) > 1:
+            self.logger.warning(f"{function_name} {len(entries)} dosyada tanımlı, ilki kullanılıyor: {entries[0].path}")
+        
+        input_file = Path(entries[0].path)
+        function = self.symbol_index.get_function(function_name, input_file)
+        if function is None:
+            self.logger.error(f"Fonksiyon artık dosyada bulunamadı: {function_name} ({input_file})")
+            return False
+        
+        if output_file is None:
+            output_file = input_file.parent / f"{function_name}_tests.c"
+        
+        return self.generate_tests_from_file(input_file, output_file, functions=[function])
+    
     def generate_tests_from_content(self, content: str, function_name: str = "test_function") -> str:
         """
         İçerikten test üret
@@ -168,13 +223,10 @@ class BlackBoxTestGenerator:
             function_info = self.doxygen_parser.get_function_info(function)
             
             # 3. LLM ile analiz et
-            llm_response = self.llm_analyzer.analyze_function(function_info)
-            
-            # 4. Test suite'i üret
-            test_suite = self.test_generator.generate_tests(llm_response)
+            analysis = self.llm_analyzer.analyze_function(function_info, priority=config.llm.priority)
             
-            # 5. C kodu üret
-            c_code = self.test_generator.generate_c_code(test_suite, llm_response)
+            # 4-5. Test suite'i ve C kodunu üret
+            c_code = self._generate_suite(analysis).test_code
             
             self.logger.info("Test kodu üretildi")
             return c_code
@@ -183,12 +235,89 @@ class BlackBoxTestGenerator:
             self.logger.error(f"Test üretimi başarısız: {e}")
             return ""
     
+    def _generate_suite(self, analysis: FunctionAnalysis) -> GeneratedTestSuite:
+        """
+        Analizden test suite'i üret
+        
+        Args:
+            analysis: Fonksiyon analizi
+            
+        Returns:
+            Test kodu doldurulmuş test suite'i
+        """
+        return self.test_generator.generate_from_analysis(
+            analysis,
+            framework=config.test.framework,
+            include_ep=config.test.include_ep,
+            include_bva=config.test.include_bva
+        )
+    
+    def _stream_test_file(self, functions, output_file: Path) -> bool:
+        """
+        Fonksiyonları sırayla analiz et ve LLM yanıtını geldikçe dosyaya yaz
+        
+        Yerel analiz veya hata sonrası varsayılan analiz kullanılırsa ya da
+        üretilen kod akıştan farklıysa (ör. main çıkarıldıysa) o fonksiyonun
+        bölümü son haliyle yeniden yazılır.
+        
+        Args:
+            functions: DoxygenFunction objeleri
+            output_file: Çıkış dosyası
+            
+        Returns:
+            Başarı durumu
+        """
+        function_infos = [self.doxygen_parser.get_function_info(function) for function in functions]
+        
+        if not function_infos:
+            self.logger.error("Doxygen fonksiyonu bulunamadı")
+            return False
+        
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        combined = len(function_infos) > 1
+        test_suites = []
+        
+        with open(output_file, 'w', encoding='utf-8') as f:
+            if combined:
+                f.write(self._combined_header())
+            
+            for function_info in function_infos:
+                start = f.tell()
+                streamed = []
+                
+                def write_chunk(chunk: str) -> None:
+                    streamed.append(chunk)
+                    f.write(chunk)
+                    f.flush()
+                
+                analysis = self.llm_analyzer.analyze_function(function_info, on_chunk=write_chunk,
+                                                              priority=config.llm.priority)
+                test_suite = self._generate_suite(analysis)
+                test_code = self._strip_main(test_suite.test_code) if combined else test_suite.test_code
+                
+                if ''.join(streamed) != test_code:
+                    f.seek(start)
+                    f.truncate()
+                    f.write(test_code)
+                
+                if combined:
+                    f.write("\n\n")
+                f.flush()
+                test_suites.append((test_suite, analysis))
+            
+            if combined:
+                f.write(self._combined_main(test_suites))
+        
+        self.logger.info(f"{len(test_suites)} fonksiyon işlendi")
+        self.logger.info(f"Test dosyası oluşturuldu: {output_file}")
+        return True
+    
     def _write_test_file(self, test_suites: List[tuple], output_file: Path) -> None:
         """
         Test dosyasını yaz
         
         Args:
-            test_suites: (test_suite, llm_response) tuple'ları listesi
+            test_suites: (test_suite, analysis) tuple'ları listesi
             output_file: Çıkış dosyası
         """
         # Çıkış dizinini oluştur
@@ -206,60 +335,79 @@ class BlackBoxTestGenerator:
         Test suite'lerini birleştir
         
         Args:
-            test_suites: (test_suite, llm_response) tuple'ları listesi
+            test_suites: (test_suite, analysis) tuple'ları listesi
             
         Returns:
             Birleştirilmiş C kodu
         """
         if len(test_suites) == 1:
-            test_suite, llm_response = test_suites[0]
-            return self.test_generator.generate_c_code(test_suite, llm_response)
+            test_suite, analysis = test_suites[0]
+            return test_suite.test_code
         
         # Birden fazla test suite varsa birleştir
-        combined_code = """// Otomatik üretilmiş Black Box test suite'i
+        combined_code = self._combined_header()
+        
+        # Her test suite için ayrı test fonksiyonları
+        for test_suite, analysis in test_suites:
+            combined_code += self._strip_main(test_suite.test_code) + "\n\n"
+        
+        combined_code += self._combined_main(test_suites)
+        
+        return combined_code
+    
+    def _combined_header(self) -> str:
+        """Birleştirilmiş test dosyasının başlığı ve ortak include'ları"""
+        return """// Otomatik üretilmiş Black Box test suite'i
 // Birden fazla fonksiyon için testler
 
-"""
-        
-        # Ortak include'lar
-        combined_code += """#include <stdio.h>
+#include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
 #include <assert.h>
 
 """
+    
+    def _strip_main(self, c_code: str) -> str:
+        """
+        Test kodundaki main fonksiyonunu çıkar
         
-        # Her test suite için ayrı test fonksiyonları
-        for test_suite, llm_response in test_suites:
-            c_code = self.test_generator.generate_c_code(test_suite, llm_response)
-            
-            # Main fonksiyonunu çıkar
-            lines = c_code.split('\n')
-            main_start = -1
-            main_end = -1
-            
-            for i, line in enumerate(lines):
-                if 'int main(' in line:
-                    main_start = i
-                elif main_start != -1 and line.strip() == '}':
-                    main_end = i + 1
-                    break
-            
-            if main_start != -1 and main_end != -1:
-                # Main fonksiyonunu çıkar
-                test_code = '\n'.join(lines[:main_start])
-            else:
-                test_code = c_code
+        Args:
+            c_code: Tek fonksiyonun test kodu
             
-            combined_code += test_code + "\n\n"
+        Returns:
+            main fonksiyonu (ve sonrası) çıkarılmış kod
+        """
+        lines = c_code.split('\n')
+        main_start = -1
+        main_end = -1
+        
+        for i, line in enumerate(lines):
+            if 'int main(' in line:
+                main_start = i
+            elif main_start != -1 and line.strip() == '}':
+                main_end = i + 1
+                break
         
-        # Birleştirilmiş main fonksiyonu
-        combined_code += """int main(void) {
+        if main_start != -1 and main_end != -1:
+            return '\n'.join(lines[:main_start])
+        return c_code
+    
+    def _combined_main(self, test_suites: List[tuple]) -> str:
+        """
+        Tüm test fonksiyonlarını çağıran birleştirilmiş main fonksiyonu
+        
+        Args:
+            test_suites: (test_suite, analysis) tuple'ları listesi
+            
+        Returns:
+            main fonksiyonunun C kodu
+        """
+        combined_code = """int main(void) {
     printf("Black Box Test Suite Başlatılıyor\\n\\n");
     
 """
         
-        for test_suite, llm_response in test_suites:
+        for test_suite, analysis in test_suites:
             for test_func in test_suite.test_functions:
                 combined_code += f"    {test_func.name}();\n"
         
@@ -281,6 +429,7 @@ def main():
 Örnekler:
   python main.py --examples                    # Examples klasöründeki tüm dosyalar için test üret
   python main.py --input function.c --output tests.c
+  python main.py --function add_numbers        # İndeksteki tek fonksiyon için test üret
   python main.py --input src/math.c --framework unity
   python main.py --input examples/calculator.c --config config.yaml
         """
@@ -298,6 +447,11 @@ def main():
         help='Giriş C dosyası (Doxygen formatında)'
     )
     
+    parser.add_argument(
+        '--function', '-F',
+        help='Sembol indeksindeki tek bir fonksiyon için test üret'
+    )
+    
     parser.add_argument(
         '--output', '-o',
         type=Path,
@@ -317,6 +471,151 @@ def main():
         help='Konfigürasyon dosyası'
     )
     
+    parser.add_argument(
+        '--concurrency', '-j',
+        type=int,
+        help=f'Aynı anda yapılacak en fazla LLM analizi (varsayılan: {config.llm.concurrency})'
+    )
+    
+    parser.add_argument(
+        '--adaptive-concurrency',
+        action='store_true',
+        help='Eşzamanlı LLM isteği sınırını --concurrency ile başlatıp 429 ve gecikmeye göre uyarla (AIMD)'
+    )
+    
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        help=f'Uyarlanır eşzamanlılıkta çıkılabilecek en yüksek sınır (varsayılan: {config.llm.max_concurrency})'
+    )
+    
+    parser.add_argument(
+        '--priority',
+        choices=PRIORITIES,
+        help=f'LLM isteklerinin öncelik sınıfı; gece çalışan yeniden üretim işleri için background (varsayılan: {config.llm.priority})'
+    )
+    
+    parser.add_argument(
+        '--shared-quota',
+        type=int,
+        help='Web arayüzü ve diğer çalıştırmalarla paylaşılan toplam eşzamanlı LLM isteği; tüm süreçlerde aynı '
+             'değer verilmeli (LLM_SHARED_QUOTA, varsayılan: kapalı)'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        help='Aynı dosyadan tek istekte analiz edilecek en fazla fonksiyon (varsayılan: 1, toplu analiz kapalı)'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='LLM yanıtlarını akış olarak al ve çıkış dosyasına geldikçe yaz (fonksiyonlar sırayla işlenir)'
+    )
+    
+    parser.add_argument(
+        '--backend',
+        choices=['openrouter', 'openai'],
+        help=f'LLM backend\'i: openrouter veya OpenAI uyumlu yerel/uzak sunucu (varsayılan: {config.llm.backend})'
+    )
+    
+    parser.add_argument(
+        '--model',
+        help=f'LLM modeli (varsayılan: {config.llm.model})'
+    )
+    
+    parser.add_argument(
+        '--small-model',
+        help='Basit fonksiyonlar için küçük ve hızlı model; karmaşık fonksiyonlar --model ile analiz edilir (varsayılan: kapalı)'
+    )
+    
+    parser.add_argument(
+        '--route-threshold',
+        type=float,
+        help=f'Bu karmaşıklık puanına kadar olan fonksiyonlar --small-model\'e gider (varsayılan: {config.llm.route_threshold})'
+    )
+    
+    parser.add_argument(
+        '--hedge',
+        action='store_true',
+        help='Gözlenen gecikmenin --hedge-percentile yüzdeliğinde yanıtlanmayan isteğin kopyasını gönder, ilk geçerli yanıtı kullan'
+    )
+    
+    parser.add_argument(
+        '--hedge-percentile',
+        type=float,
+        help=f'Kopya isteğin gönderileceği gecikme yüzdeliği (varsayılan: {config.llm.hedge_percentile})'
+    )
+    
+    parser.add_argument(
+        '--hedge-model',
+        help='Kopya isteğin gönderileceği model (varsayılan: aynı model)'
+    )
+    
+    parser.add_argument(
+        '--hedge-budget',
+        type=float,
+        help=f'Kopya isteklerin toplam isteklere oranı için üst sınır (varsayılan: {config.llm.hedge_budget})'
+    )
+    
+    parser.add_argument(
+        '--temperature',
+        type=float,
+        help=f'Örnekleme sıcaklığı (varsayılan: {config.llm.temperature})'
+    )
+    
+    parser.add_argument(
+        '--max-tokens',
+        type=int,
+        help=f'Yanıt başına üretilecek en fazla token (varsayılan: {config.llm.max_tokens})'
+    )
+    
+    parser.add_argument(
+        '--llm-mode',
+        choices=['live', 'record', 'replay'],
+        help='live: API\'ye git, record: yanıtları kasete kaydet, replay: API anahtarı olmadan kasetlerden oynat'
+    )
+    
+    parser.add_argument(
+        '--cassette-dir',
+        help=f'Kaset klasörü (varsayılan: {config.llm.cassette_dir})'
+    )
+    
+    parser.add_argument(
+        '--replay-latency',
+        help='Oynatmada simüle edilen gecikme: none, recorded, fixed:S, uniform:A,B, normal:M,S, lognormal:MEDYAN,SIGMA'
+    )
+    
+    parser.add_argument(
+        '--api-url',
+        help='Chat completions uç noktası (ör. yerel sunucu: http://127.0.0.1:8089/v1/chat/completions)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Parse önbelleğini kullanma, tüm dosyaları yeniden parse et'
+    )
+    
+    parser.add_argument(
+        '--no-dedup',
+        action='store_true',
+        help='Kopya fonksiyonları tekilleştirme, her birini ayrı analiz et'
+    )
+    
+    parser.add_argument(
+        '--local-ranges',
+        action='store_true',
+        help='@param açıklamalarındaki aralıklar tüm parametreleri kapsıyorsa LLM\'i atla, analizi yerel kurallarla yap'
+    )
+    
+    parser.add_argument(
+        '--no-llm-cache',
+        action='store_true',
+        help='LLM yanıt önbelleğini kullanma, tüm fonksiyonlar için yeniden istek gönder'
+    )
+    
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -342,6 +641,81 @@ def main():
     if args.framework:
         config.test.framework = args.framework
     
+    if args.no_cache:
+        config.parser.use_cache = False
+    
+    if args.no_llm_cache:
+        config.llm.use_cache = False
+    
+    if args.no_dedup:
+        config.llm.deduplicate = False
+    
+    if args.local_ranges:
+        config.llm.local_ranges = True
+    
+    if args.concurrency:
+        config.llm.concurrency = args.concurrency
+    
+    if args.adaptive_concurrency:
+        config.llm.adaptive_concurrency = True
+    
+    if args.max_concurrency:
+        config.llm.max_concurrency = args.max_concurrency
+    
+    if args.batch_size:
+        config.llm.batch_size = args.batch_size
+    
+    if args.priority:
+        config.llm.priority = args.priority
+    
+    if args.shared_quota is not None:
+        config.llm.shared_quota = args.shared_quota
+    
+    if args.stream:
+        config.llm.stream = True
+    
+    if args.backend:
+        config.llm.backend = args.backend
+    
+    if args.model:
+        config.llm.model = args.model
+    
+    if args.small_model:
+        config.llm.small_model = args.small_model
+    
+    if args.route_threshold is not None:
+        config.llm.route_threshold = args.route_threshold
+    
+    if args.hedge:
+        config.llm.hedge = True
+    
+    if args.hedge_percentile is not None:
+        config.llm.hedge_percentile = args.hedge_percentile
+    
+    if args.hedge_model:
+        config.llm.hedge_model = args.hedge_model
+    
+    if args.hedge_budget is not None:
+        config.llm.hedge_budget = args.hedge_budget
+    
+    if args.temperature is not None:
+        config.llm.temperature = args.temperature
+    
+    if args.max_tokens:
+        config.llm.max_tokens = args.max_tokens
+    
+    if args.llm_mode:
+        config.llm.mode = args.llm_mode
+    
+    if args.cassette_dir:
+        config.llm.cassette_dir = args.cassette_dir
+    
+    if args.replay_latency:
+        config.llm.replay_latency = args.replay_latency
+    
+    if args.api_url:
+        config.llm.api_url = args.api_url
+    
     # Konfigürasyon dosyasını yükle (eğer belirtilmişse)
     if args.config and args.config.exists():
         # TODO: Konfigürasyon dosyası yükleme
@@ -361,6 +735,7 @@ def main():
     if args.examples:
         logger.info("Examples klasöründeki tüm C dosyaları için test üretimi başlatılıyor...")
         success = generator.generate_tests_from_examples()
+        generator.llm_analyzer.log_summary()
         
         if success:
             logger.info("Examples klasörü işlemi başarıyla tamamlandı")
@@ -369,6 +744,18 @@ def main():
             logger.error("Examples klasörü işlemi başarısız")
             sys.exit(1)
     
+    # Tek fonksiyon için test üret
+    if args.function:
+        success = generator.generate_tests_for_function(args.function, args.output)
+        generator.llm_analyzer.log_summary()
+        
+        if success:
+            logger.info("Test üretimi başarıyla tamamlandı")
+            sys.exit(0)
+        else:
+            logger.error("Test üretimi başarısız")
+            sys.exit(1)
+    
     # Tek dosya için test üret
     if args.input:
         # Giriş dosyasını kontrol et
@@ -378,6 +765,7 @@ def main():
         
         # Test üret
         success = generator.generate_tests_from_file(args.input, args.output)
+        generator.llm_analyzer.log_summary()
         
         if success:
             logger.info("Test üretimi başarıyla tamamlandı")
@@ -387,7 +775,7 @@ def main():
             sys.exit(1)
     
     # Hiçbir argüman verilmemişse yardım göster
-    if not args.examples and not args.input:
+    if not args.examples and not args.input and not args.function:
         parser.print_help()
         sys.exit(1)
 
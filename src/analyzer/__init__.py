@@ -3,5 +3,7 @@ Analyzer modülü - Fonksiyon analizi yapan araçlar
 """
 
 from .llm_analyzer import LLMAnalyzer, FunctionAnalysis, ParameterAnalysis
+from .range_extractor import RangeExtractor
+from .response_cache import ResponseCache
 
-__all__ = ['LLMAnalyzer', 'FunctionAnalysis', 'ParameterAnalysis'] 
\ No newline at end of file
+__all__ = ['LLMAnalyzer', 'FunctionAnalysis', 'ParameterAnalysis', 'RangeExtractor', 'ResponseCache']
@@ -0,0 +1,215 @@
+"""
+LLM sağlayıcı (backend) tanımları ve ölçümleri
+
+Her backend; uç nokta adresini, kimlik doğrulama başlıklarını ve chat
+completions istek gövdesini (model, temperature, max_tokens) belirler.
+HTTP oturumu, yeniden deneme ve akış işleme LLMAnalyzer'da kalır.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional, Type
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class BackendMetrics:
+    """Backend başına iş parçacığı güvenli gecikme ve throughput ölçümleri"""
+
+    def __init__(self, window: int = 1000):
+        """
+        Args:
+            window: Yüzdelikler için saklanan son gecikme sayısı
+        """
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=window)
+        self._started = time.monotonic()
+        self.requests = 0
+        self.failures = 0
+        self.busy_seconds = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def record(self, latency: float, prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+        """
+        Başarılı isteği kaydet
+
+        Args:
+            latency: İstek süresi (saniye)
+            prompt_tokens: Gönderilen token sayısı
+            completion_tokens: Üretilen token sayısı
+        """
+        with self._lock:
+            self.requests += 1
+            self.busy_seconds += latency
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+            self._latencies.append(latency)
+
+    def record_censored(self, latency: float) -> None:
+        """
+        Sonucu beklenmeden iptal edilen isteğin o ana kadarki süresini
+        yüzdeliklere ekle (gerçek gecikme en az bu kadardır)
+
+        Args:
+            latency: İptal anına kadar geçen süre (saniye)
+        """
+        with self._lock:
+            self._latencies.append(latency)
+
+    def record_failure(self) -> None:
+        """Başarısız isteği kaydet"""
+        with self._lock:
+            self.failures += 1
+
+    def latency_percentile(self, fraction: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Son gecikmelerin yüzdelik değeri
+
+        Args:
+            fraction: 0-1 arası yüzdelik (ör. 0.95)
+            min_samples: Gereken en az ölçüm sayısı
+
+        Returns:
+            Yüzdelik gecikme (saniye) veya yeterli ölçüm yoksa None
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+
+        if not latencies or len(latencies) < min_samples:
+            return None
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Ölçümlerin anlık özeti
+
+        Returns:
+            İstek/hata sayıları, ortalama ve p50/p95 gecikme, saniyedeki
+            istek ve üretilen token sayısı
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            elapsed = time.monotonic() - self._started
+            requests = self.requests
+
+            def pct(fraction: float) -> float:
+                if not latencies:
+                    return 0.0
+                return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))]
+
+            return {
+                'requests': requests,
+                'failures': self.failures,
+                'mean_latency': self.busy_seconds / requests if requests else 0.0,
+                'p50_latency': pct(0.50),
+                'p95_latency': pct(0.95),
+                'requests_per_sec': requests / elapsed if elapsed else 0.0,
+                'prompt_tokens': self.prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+                'completion_tokens_per_sec': self.completion_tokens / self.busy_seconds if self.busy_seconds else 0.0
+            }
+
+
+class LLMBackend:
+    """OpenAI chat completions formatını kullanan backend'lerin temel sınıfı"""
+
+    name = 'base'
+    default_url = ''
+    requires_key = True
+
+    def __init__(self, model: str, temperature: Optional[float] = None, max_tokens: Optional[int] = None,
+                 api_url: Optional[str] = None, api_key: Optional[str] = None):
+        """
+        Args:
+            model: Model adı
+            temperature: Örnekleme sıcaklığı (None ise gönderilmez)
+            max_tokens: Üretilecek en fazla token (None veya 0 ise gönderilmez)
+            api_url: Chat completions uç noktası (boşsa backend varsayılanı)
+            api_key: API anahtarı
+        """
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.api_url = api_url or self.default_url
+        self.api_key = api_key
+        self.metrics = BackendMetrics()
+
+    def headers(self) -> Dict[str, str]:
+        """HTTP oturumuna eklenecek başlıklar"""
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def build_request(self, messages: List[Dict[str, str]], model: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Chat completions istek gövdesi oluştur
+
+        Args:
+            messages: system/user mesajları
+            model: Backend modeli yerine kullanılacak model (ör. yönlendiriciden)
+
+        Returns:
+            İstek gövdesi
+        """
+        data = {"model": model or self.model, "messages": messages}
+        if self.temperature is not None:
+            data["temperature"] = self.temperature
+        if self.max_tokens:
+            data["max_tokens"] = self.max_tokens
+        return data
+
+
+class OpenRouterBackend(LLMBackend):
+    """openrouter.ai"""
+
+    name = 'openrouter'
+    default_url = "https://openrouter.ai/api/v1/chat/completions"
+
+    def headers(self) -> Dict[str, str]:
+        headers = super().headers()
+        headers.update({
+            "HTTP-Referer": "https://github.com/c-ai-test",
+            "X-Title": "C-AI-Test"
+        })
+        return headers
+
+
+class OpenAICompatibleBackend(LLMBackend):
+    """OpenAI uyumlu sunucular (vLLM, llama.cpp, Ollama, LM Studio ...); anahtar opsiyonel"""
+
+    name = 'openai'
+    default_url = "http://localhost:8000/v1/chat/completions"
+    requires_key = False
+
+
+BACKENDS: Dict[str, Type[LLMBackend]] = {
+    OpenRouterBackend.name: OpenRouterBackend,
+    OpenAICompatibleBackend.name: OpenAICompatibleBackend,
+}
+
+
+def create_backend(name: str, model: str, temperature: Optional[float] = None,
+                   max_tokens: Optional[int] = None, api_url: Optional[str] = None,
+                   api_key: Optional[str] = None) -> LLMBackend:
+    """
+    Ada göre backend oluştur
+
+    Args:
+        name: BACKENDS anahtarlarından biri
+        model: Model adı
+        temperature: Örnekleme sıcaklığı
+        max_tokens: Üretilecek en fazla token
+        api_url: Uç nokta (boşsa backend varsayılanı)
+        api_key: API anahtarı
+
+    Returns:
+        LLMBackend objesi
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Geçersiz LLM backend'i: {name} (geçerli: {', '.join(BACKENDS)})")
+    return BACKENDS[name](model, temperature=temperature, max_tokens=max_tokens, api_url=api_url, api_key=api_key)
@@ -0,0 +1,383 @@
+"""
+LLM isteklerini kaydedip yeniden oynatan kaset modülü
+
+Kayıt modunda her chat completions isteği ve yanıtı, ölçülen gecikmeyle
+birlikte kaset klasörüne yazılır. Oynatma modunda yanıtlar ağa çıkmadan
+kasetlerden verilir; istenirse gerçekçi gecikme dağılımları simüle edilir.
+Modül ayrıca kasetleri OpenAI uyumlu bir HTTP uç noktası olarak sunan yerel
+bir sunucu içerir:
+
+    python -m src.analyzer.cassette --port 8089 --latency lognormal:0.5,0.4
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .response_cache import ResponseCache
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Kaset formatı değiştiğinde artırılmalı
+CASSETTE_VERSION = 1
+
+# LLMAnalyzer çalışma modları
+LLM_MODES = ('live', 'record', 'replay')
+
+# Sentetik modda kaseti olmayan isteklere verilen yanıt
+_SYNTHETIC_RESPONSE = "void test_placeholder(void) {\n    TEST_ASSERT_TRUE(1);\n}\n"
+
+
+class CassetteMissError(LookupError):
+    """İstek için kayıtlı kaset bulunamadı"""
+
+
+@dataclass
+class LatencyModel:
+    """
+    Oynatma sırasında simüle edilen gecikme dağılımı
+
+    Desteklenen tanımlar:
+        none                 gecikme yok
+        recorded             kayıt sırasında ölçülen gecikme
+        fixed:S              sabit S saniye
+        uniform:A,B          A ile B arasında düzgün dağılım
+        normal:MEAN,STD      normal dağılım (negatifler 0'a yuvarlanır)
+        lognormal:MEDIAN,SIGMA  log-normal dağılım (uzun kuyruklu API gecikmeleri için)
+    """
+    kind: str = 'none'
+    a: float = 0.0
+    b: float = 0.0
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def parse(cls, spec: Optional[str], seed: Optional[int] = None) -> 'LatencyModel':
+        """
+        Metin tanımından gecikme modeli oluştur
+
+        Args:
+            spec: Ör. "fixed:0.8", "lognormal:1.2,0.5"
+            seed: Rastgelelik tohumu (tekrarlanabilir ölçümler için)
+
+        Returns:
+            LatencyModel objesi
+        """
+        if not spec:
+            return cls(seed=seed)
+
+        kind, _, args = spec.partition(':')
+        kind = kind.strip().lower()
+        values = [float(value) for value in args.split(',') if value.strip()]
+
+        expected = {'none': 0, 'recorded': 0, 'fixed': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2}
+        if kind not in expected or len(values) != expected[kind]:
+            raise ValueError(f"Geçersiz gecikme tanımı: {spec}")
+
+        if kind == 'lognormal' and values[0] <= 0:
+            raise ValueError(f"Log-normal medyanı pozitif olmalı: {spec}")
+
+        values += [0.0] * (2 - len(values))
+        return cls(kind=kind, a=values[0], b=values[1], seed=seed)
+
+    def sample(self, recorded: Optional[float] = None) -> float:
+        """
+        Bir gecikme değeri üret
+
+        Args:
+            recorded: Kayıt sırasında ölçülen gecikme
+
+        Returns:
+            Saniye cinsinden gecikme
+        """
+        with self._lock:
+            if self.kind == 'recorded':
+                return recorded or 0.0
+            if self.kind == 'fixed':
+                return self.a
+            if self.kind == 'uniform':
+                return self._rng.uniform(self.a, self.b)
+            if self.kind == 'normal':
+                return max(0.0, self._rng.gauss(self.a, self.b))
+            if self.kind == 'lognormal':
+                return self._rng.lognormvariate(math.log(self.a), self.b)
+            return 0.0
+
+
+class CassetteStore:
+    """
+    İstek gövdesi -> kayıtlı yanıt deposu
+
+    Anahtar, stream alanı çıkarılmış istek gövdesinin ResponseCache ile aynı
+    şekilde üretilen özetidir; böylece akışlı ve akışsız istekler aynı
+    kaseti paylaşır. Her kaset ayrı bir JSON dosyasıdır ve istek gövdesini
+    de içerdiğinden okunabilir/diff'lenebilir.
+    """
+
+    def __init__(self, cassette_dir: Path, latency: Optional[LatencyModel] = None):
+        """
+        Args:
+            cassette_dir: Kaset klasörü
+            latency: Oynatmada kullanılacak gecikme modeli
+        """
+        self.logger = get_logger(__name__)
+        self.cassette_dir = Path(cassette_dir)
+        self.latency = latency or LatencyModel()
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """
+        İstekten kaset anahtarı üret
+
+        Args:
+            request: Chat completions istek gövdesi
+
+        Returns:
+            SHA-256 hex özeti
+        """
+        return ResponseCache.make_key({k: v for k, v in request.items() if k != 'stream'})
+
+    def record(self, request: Dict[str, Any], response: Dict[str, Any], latency: float) -> None:
+        """
+        İstek/yanıt çiftini kasete atomik olarak yaz
+
+        Args:
+            request: Chat completions istek gövdesi
+            response: JSON yanıt
+            latency: Ölçülen istek süresi (saniye)
+        """
+        request = {k: v for k, v in request.items() if k != 'stream'}
+        path = self._cassette_path(self.make_key(request))
+        entry = {
+            'version': CASSETTE_VERSION,
+            'recorded_at': time.time(),
+            'latency': latency,
+            'request': request,
+            'response': response
+        }
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self.logger.warning(f"Kaset yazılamadı: {path} - {e}")
+            return
+
+        self.recorded += 1
+        self.logger.debug(f"Kaset kaydedildi: {path.name} ({latency:.2f} sn)")
+
+    def load(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        İsteğin kasetini oku
+
+        Args:
+            request: Chat completions istek gövdesi
+
+        Returns:
+            Kaset kaydı (latency, request, response)
+
+        Raises:
+            CassetteMissError: Kaset yoksa veya okunamıyorsa
+        """
+        path = self._cassette_path(self.make_key(request))
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError) as e:
+            self.misses += 1
+            raise CassetteMissError(f"İstek için kaset bulunamadı: {path.name}") from e
+
+        if entry.get('version') != CASSETTE_VERSION:
+            self.misses += 1
+            raise CassetteMissError(f"Kaset sürümü uyumsuz: {path.name}")
+
+        return entry
+
+    def replay(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Kayıtlı yanıtı simüle edilen gecikmeyle döndür
+
+        Args:
+            request: Chat completions istek gövdesi
+
+        Returns:
+            JSON yanıt
+        """
+        entry = self.load(request)
+        delay = self.latency.sample(entry.get('latency'))
+        if delay > 0:
+            time.sleep(delay)
+
+        self.replayed += 1
+        return entry['response']
+
+    def _cassette_path(self, key: str) -> Path:
+        """Anahtarın kaset dosyası yolu"""
+        return self.cassette_dir / f"{key}.json"
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Kasetleri /chat/completions olarak sunan istek işleyici"""
+
+    protocol_version = 'HTTP/1.1'
+    server: '_StandInServer'
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+    def do_HEAD(self):
+        # Bağlantı ön ısıtması için
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_POST(self):
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send_json(404, {'error': {'code': 404, 'message': f"Bilinmeyen yol: {self.path}"}})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length))
+        except ValueError as e:
+            self._send_json(400, {'error': {'code': 400, 'message': f"Geçersiz istek: {e}"}})
+            return
+
+        store = self.server.store
+        try:
+            response = store.replay(request)
+        except CassetteMissError as e:
+            if not self.server.synthetic:
+                self._send_json(404, {'error': {'code': 404, 'message': str(e)}})
+                return
+            time.sleep(store.latency.sample())
+            response = {'choices': [{'message': {'role': 'assistant', 'content': _SYNTHETIC_RESPONSE}}]}
+
+        if request.get('stream'):
+            self._send_stream(response)
+        else:
+            self._send_json(200, response)
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_stream(self, response: Dict[str, Any]) -> None:
+        """Yanıt içeriğini SSE olayları olarak parça parça gönder"""
+        content = response['choices'][0]['message']['content']
+        chunk_size = self.server.chunk_size
+        events = [
+            {'choices': [{'index': 0, 'delta': {'content': content[i:i + chunk_size]}}]}
+            for i in range(0, len(content), chunk_size)
+        ]
+        if response.get('usage'):
+            events.append({'choices': [], 'usage': response['usage']})
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        for event in events:
+            self._write_chunk(f"data: {json.dumps(event, ensure_ascii=False)}\n\n")
+        self._write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b'0\r\n\r\n')
+
+    def _write_chunk(self, text: str) -> None:
+        data = text.encode('utf-8')
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b'\r\n')
+        self.wfile.flush()
+
+
+class _StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, store: CassetteStore, synthetic: bool, chunk_size: int):
+        super().__init__(address, _StandInHandler)
+        self.store = store
+        self.synthetic = synthetic
+        self.chunk_size = chunk_size
+
+
+def create_stand_in_server(store: CassetteStore, host: str = '127.0.0.1', port: int = 8089,
+                           synthetic: bool = False, chunk_size: int = 64) -> ThreadingHTTPServer:
+    """
+    Kasetleri sunan yerel chat completions sunucusu oluştur
+
+    Args:
+        store: Yanıtların okunacağı kaset deposu
+        host: Dinlenecek adres
+        port: Dinlenecek port (0: rastgele boş port)
+        synthetic: Kaseti olmayan isteklere 404 yerine sabit bir yanıt ver
+        chunk_size: Akışlı yanıtlarda parça başına karakter sayısı
+
+    Returns:
+        serve_forever ile çalıştırılabilecek sunucu
+    """
+    return _StandInServer((host, port), store, synthetic, chunk_size)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Yerel chat completions sunucusunu başlat"""
+    from ..utils.logger import setup_logger
+
+    parser = argparse.ArgumentParser(description="Kayıtlı LLM yanıtlarını sunan yerel chat completions sunucusu")
+    parser.add_argument('--host', default='127.0.0.1', help='Dinlenecek adres (varsayılan: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8089, help='Dinlenecek port (varsayılan: 8089)')
+    parser.add_argument('--cassette-dir', type=Path, default=Path('cassettes'), help='Kaset klasörü')
+    parser.add_argument('--latency', default='recorded',
+                        help='Gecikme modeli: none, recorded, fixed:S, uniform:A,B, normal:M,S, lognormal:MEDYAN,SIGMA')
+    parser.add_argument('--seed', type=int, help='Gecikme örneklemesi için rastgelelik tohumu')
+    parser.add_argument('--synthetic', action='store_true',
+                        help='Kaseti olmayan isteklere sabit bir test kodu döndür')
+    parser.add_argument('--chunk-size', type=int, default=64, help='Akış parçası başına karakter sayısı')
+    args = parser.parse_args(argv)
+
+    setup_logger()
+    store = CassetteStore(args.cassette_dir, LatencyModel.parse(args.latency, seed=args.seed))
+    server = create_stand_in_server(store, args.host, args.port, args.synthetic, args.chunk_size)
+
+    logger.info(f"Yerel LLM sunucusu: http://{args.host}:{server.server_port}/v1/chat/completions "
+                f"(kasetler: {args.cassette_dir}, gecikme: {args.latency})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    logger.info(f"{store.replayed} yanıt oynatıldı, {store.misses} kaset bulunamadı")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
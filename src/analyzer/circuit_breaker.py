@@ -0,0 +1,175 @@
+"""
+LLM backend'i için devre kesici (circuit breaker) modülü
+
+Art arda belirli sayıda istek başarısız olunca devre açılır ve sonraki
+istekler backend'e gitmeden hemen reddedilir. Bekleme süresi dolduğunda tek
+bir deneme (probe) isteğine izin verilir; başarılı olursa devre kapanır,
+başarısız olursa bekleme süresi yeniden başlar.
+"""
+
+import threading
+import time
+from collections import Counter
+from typing import Dict, Any
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(RuntimeError):
+    """Devre açıkken yapılan istek backend'e gönderilmeden reddedildi"""
+
+
+class CircuitBreaker:
+    """İş parçacığı güvenli, art arda hata sayısına dayalı devre kesici"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, name: str = 'llm'):
+        """
+        Args:
+            failure_threshold: Devreyi açan art arda hata sayısı (0: devre kesici kapalı)
+            reset_timeout: Devre açıldıktan sonra deneme isteğine kadar beklenecek süre (saniye)
+            name: Loglarda kullanılacak ad
+        """
+        self.logger = get_logger(__name__)
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._counters = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self.failure_threshold > 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """
+        İsteğin backend'e gönderilip gönderilmeyeceğine karar ver
+
+        Devre açıksa ve bekleme süresi dolduysa çağıran deneme isteğini
+        yapar; deneme sürerken diğer istekler reddedilmeye devam eder.
+
+        Returns:
+            True ise istek gönderilmeli ve sonucu record_success/record_failure
+            ile bildirilmeli
+        """
+        if not self.enabled:
+            return True
+
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+
+            if (self._state == OPEN and not self._probe_in_flight
+                    and time.monotonic() - self._opened_at >= self.reset_timeout):
+                self._state = HALF_OPEN
+                self._probe_in_flight = True
+                self._counters['probes'] += 1
+                self.logger.info(f"{self.name} devre kesicisi yarı açık: deneme isteği gönderiliyor")
+                return True
+
+            self._counters['short_circuited'] += 1
+            return False
+
+    def check(self) -> None:
+        """
+        allow() False ise CircuitOpenError yükselt
+
+        Raises:
+            CircuitOpenError: Devre açık
+        """
+        if not self.allow():
+            raise CircuitOpenError(f"{self.name} devre kesicisi açık, istek gönderilmedi")
+
+    def reject_if_open(self) -> None:
+        """
+        Devre açıksa ve deneme isteği yapılamıyorsa hemen CircuitOpenError yükselt
+
+        Kuyruğa girmeden önce çağrılır; durumu değiştirmez, bekleme süresi
+        dolmuşsa deneme hakkı sonraki check() çağrısında alınır.
+
+        Raises:
+            CircuitOpenError: Devre açık
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            if (self._state == OPEN and not self._probe_in_flight
+                    and time.monotonic() - self._opened_at >= self.reset_timeout):
+                return
+            self._counters['short_circuited'] += 1
+
+        raise CircuitOpenError(f"{self.name} devre kesicisi açık, istek gönderilmedi")
+
+    def record_success(self) -> None:
+        """Backend'e ulaşıldı; devreyi kapat ve hata sayacını sıfırla"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            if self._state != CLOSED:
+                self._state = CLOSED
+                self._counters['closed'] += 1
+                self.logger.info(f"{self.name} devre kesicisi kapandı, backend yeniden erişilebilir")
+
+    def record_failure(self) -> None:
+        """Backend'e ulaşılamadı; eşik aşıldıysa veya deneme başarısızsa devreyi aç"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._consecutive_failures += 1
+            probe_failed = self._state == HALF_OPEN
+            self._probe_in_flight = False
+
+            if probe_failed or (self._state == CLOSED and self._consecutive_failures >= self.failure_threshold):
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                if probe_failed:
+                    self.logger.warning(f"{self.name} devre kesicisi denemesi başarısız, devre "
+                                        f"{self.reset_timeout:g} sn daha açık kalacak")
+                else:
+                    self._counters['opened'] += 1
+                    self.logger.warning(f"{self.name} devre kesicisi açıldı: art arda {self._consecutive_failures} hata, "
+                                        f"istekler {self.reset_timeout:g} sn boyunca gönderilmeyecek")
+
+    def release(self) -> None:
+        """
+        İstek backend'in durumu hakkında bilgi vermeden bitti (ör. kaset
+        bulunamadı); deneme isteğiyse bir sonraki istek yeniden denesin
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._state = OPEN
+            self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Durumun anlık özeti
+
+        Returns:
+            state, consecutive_failures ve opened/closed/probes/short_circuited sayaçları
+        """
+        with self._lock:
+            return dict(self._counters, state=self._state, consecutive_failures=self._consecutive_failures)
@@ -0,0 +1,167 @@
+"""
+LLM istekleri için uyarlanır eşzamanlılık sınırlayıcı (AIMD)
+
+Eşzamanlı istek sınırı, gecikme ve hata oranı sağlıklı kaldıkça toplamsal
+olarak artırılır (her başarılı istekte 1/sınır, yani yaklaşık her tur başına
++1). 429 yanıtı, zaman aşımı veya son isteklerin medyan gecikmesine göre
+belirgin bir gecikme artışı görüldüğünde sınır çarpımsal olarak düşürülür.
+"""
+
+import statistics
+import threading
+import time
+from collections import deque
+from typing import Dict, Any
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AdaptiveLimiter:
+    """İş parçacığı güvenli AIMD eşzamanlılık sınırlayıcı"""
+
+    def __init__(self, initial: int = 4, min_limit: int = 1, max_limit: int = 32,
+                 backoff_ratio: float = 0.5, latency_tolerance: float = 3.0,
+                 window: int = 50, min_samples: int = 10):
+        """
+        Args:
+            initial: Başlangıç sınırı
+            min_limit: Sınırın inebileceği en düşük değer
+            max_limit: Sınırın çıkabileceği en yüksek değer
+            backoff_ratio: Aşırı yük görüldüğünde sınırın çarpılacağı oran
+            latency_tolerance: Gecikme son isteklerin medyanının bu katını
+                aşarsa gecikme artışı sayılır
+            window: Medyan gecikme için saklanan son ölçüm sayısı
+            min_samples: Gecikme artışı kontrolü için gereken en az ölçüm
+        """
+        self.logger = get_logger(__name__)
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.min_samples = min_samples
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial)))
+        self._condition = threading.Condition()
+        self._latencies = deque(maxlen=window)
+        self._last_decrease = 0.0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self.lowest_limit = int(self._limit)
+        self.highest_limit = int(self._limit)
+
+    @property
+    def limit(self) -> int:
+        """Şu anki eşzamanlı istek sınırı"""
+        with self._condition:
+            return int(self._limit)
+
+    def acquire(self) -> None:
+        """Sınırın altında yer açılana kadar bekle ve isteği say"""
+        with self._condition:
+            while self.in_flight >= int(self._limit):
+                self._condition.wait()
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def try_acquire(self) -> bool:
+        """
+        Sınırın altında yer varsa beklemeden isteği say
+
+        Returns:
+            Yer alındıysa True (release ile bırakılmalı)
+        """
+        with self._condition:
+            if self.in_flight >= int(self._limit):
+                return False
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            return True
+
+    def release(self) -> None:
+        """Biten isteğin yerini serbest bırak"""
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def on_success(self, latency: float) -> None:
+        """
+        Başarılı isteği bildir
+
+        Gecikme son isteklerin medyanının latency_tolerance katını aşıyorsa
+        sınır düşürülür, aksi halde toplamsal olarak artırılır. İstek yeri
+        serbest bırakılmadan önce çağrılmalıdır.
+
+        Args:
+            latency: İstek süresi (saniye)
+        """
+        with self._condition:
+            spike = (len(self._latencies) >= self.min_samples
+                     and latency > statistics.median(self._latencies) * self.latency_tolerance)
+            self._latencies.append(latency)
+
+            if spike:
+                self._decrease(f"gecikme artışı ({latency:.2f} sn)")
+                return
+
+            # Sınırın yarısı bile kullanılmıyorsa artış ölçüme dayanmaz
+            if self.in_flight * 2 < int(self._limit):
+                return
+
+            previous = int(self._limit)
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            if int(self._limit) > previous:
+                self.increases += 1
+                self.highest_limit = max(self.highest_limit, int(self._limit))
+                self.logger.debug(f"Eşzamanlılık sınırı artırıldı: {int(self._limit)}")
+                self._condition.notify_all()
+
+    def on_overload(self, reason: str) -> None:
+        """
+        Aşırı yük işaretini (429, zaman aşımı) bildir
+
+        Args:
+            reason: Log için neden etiketi
+        """
+        with self._condition:
+            self._decrease(reason)
+
+    def _decrease(self, reason: str) -> None:
+        """
+        Sınırı çarpımsal olarak düşür (kilit tutulurken çağrılmalı)
+
+        Aynı aşırı yük dalgasındaki eşzamanlı istekler sınırı art arda
+        düşürmesin diye medyan gecikme kadar süre içinde tek azaltma yapılır.
+        """
+        now = time.monotonic()
+        cooldown = statistics.median(self._latencies) if self._latencies else 1.0
+        if now - self._last_decrease < cooldown:
+            return
+
+        previous = int(self._limit)
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        self._last_decrease = now
+        self.decreases += 1
+        self.lowest_limit = min(self.lowest_limit, int(self._limit))
+        self.logger.info(f"Eşzamanlılık sınırı düşürüldü: {previous} -> {int(self._limit)} ({reason})")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Sınırlayıcının anlık özeti
+
+        Returns:
+            limit, in_flight, peak_in_flight, en düşük/en yüksek sınır ve
+            artırma/azaltma sayıları
+        """
+        with self._condition:
+            return {
+                'limit': int(self._limit),
+                'in_flight': self.in_flight,
+                'peak_in_flight': self.peak_in_flight,
+                'lowest_limit': self.lowest_limit,
+                'highest_limit': self.highest_limit,
+                'increases': self.increases,
+                'decreases': self.decreases
+            }
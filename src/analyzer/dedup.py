@@ -0,0 +1,250 @@
+"""
+Aynı fonksiyonun kopyalarını tek analizde birleştiren tekilleştirme modülü
+
+Farklı modüllere veya vendor klasörlerine kopyalanmış yardımcı fonksiyonlar
+imza, Doxygen alanları ve yorum/boşluktan arındırılmış gövde üzerinden
+normalize edilir. Fonksiyon adı normalizasyonda yer tutucuyla değiştirildiği
+için yalnızca adı farklı kopyalar da eşleşir; paylaşılan sonuç her kopyanın
+kendi adına çevrilir.
+"""
+
+import dataclasses
+import hashlib
+import json
+import re
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Dict, Any, Callable
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Normalizasyonda fonksiyon adının yerine konan işaret
+_NAME_PLACEHOLDER = "__FUNCTION__"
+
+# String/karakter sabitleri korunur, yorumlar silinir
+_CODE_TOKEN_PATTERN = re.compile(
+    r'(?P<string>"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\')'
+    r'|(?P<comment>//[^\n]*|/\*.*?\*/)',
+    re.DOTALL
+)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_PUNCT_SPACE_PATTERN = re.compile(r'\s*([^\w\s])\s*')
+
+# Fingerprint'e giren Doxygen alanları
+_DOC_FIELDS = ('brief', 'details', 'params', 'return', 'preconditions', 'postconditions',
+               'notes', 'warnings', 'throws')
+
+
+def normalize_code(code: str) -> str:
+    """
+    C kodunu yorumlardan ve biçim farklarından arındır
+
+    Args:
+        code: Fonksiyon kodu
+
+    Returns:
+        Yorumları silinmiş, boşlukları tek boşluğa indirilmiş ve noktalama
+        çevresindeki boşlukları kaldırılmış kod
+    """
+    def strip_comment(match):
+        return match.group('string') or ' '
+
+    code = _CODE_TOKEN_PATTERN.sub(strip_comment, code or '')
+    code = _WHITESPACE_PATTERN.sub(' ', code).strip()
+    return _PUNCT_SPACE_PATTERN.sub(r'\1', code)
+
+
+def _normalize_text(value: Any, name_pattern: re.Pattern) -> Any:
+    """Doxygen alanlarındaki metinleri boşluk ve fonksiyon adından bağımsız hale getir"""
+    if isinstance(value, str):
+        return name_pattern.sub(_NAME_PLACEHOLDER, _WHITESPACE_PATTERN.sub(' ', value).strip())
+    if isinstance(value, dict):
+        return {key: _normalize_text(item, name_pattern) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize_text(item, name_pattern) for item in value]
+    return value
+
+
+def function_fingerprint(function_dict: Dict[str, Any]) -> str:
+    """
+    Fonksiyonun normalize edilmiş özeti
+
+    Args:
+        function_dict: Fonksiyon bilgileri (DoxygenParser.get_function_info formatı)
+
+    Returns:
+        SHA-256 hex özeti; adı dışında aynı olan kopyalar için eşittir
+    """
+    name_pattern = re.compile(rf"\b{re.escape(function_dict['name'])}\b")
+    # İmza bazen açılış parantezini içerir ("int f(int x) {")
+    signature = normalize_code(function_dict.get('signature', '')).rstrip('{;')
+    payload = {
+        'signature': name_pattern.sub(_NAME_PLACEHOLDER, signature),
+        'doc': {field: _normalize_text(function_dict.get(field), name_pattern) for field in _DOC_FIELDS},
+        'code': name_pattern.sub(_NAME_PLACEHOLDER, normalize_code(function_dict.get('code', '')))
+    }
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def rename_analysis(analysis, old_name: str, new_name: str):
+    """
+    Paylaşılan analizi yerel fonksiyon adına çevir
+
+    Args:
+        analysis: Kopyası ilk analiz edilen fonksiyonun FunctionAnalysis objesi
+        old_name: Analiz edilen fonksiyonun adı
+        new_name: Kopyanın adı
+
+    Returns:
+        Adı, açıklaması ve üretilmiş test kodu yeni ada göre güncellenmiş kopya
+    """
+    if old_name == new_name:
+        return dataclasses.replace(analysis)
+
+    # Tek başına geçen ad ve test_<ad>__<senaryo> biçimindeki test adları
+    escaped = re.escape(old_name)
+    pattern = re.compile(rf"\b{escaped}\b|(?<=test_){escaped}(?=_)")
+
+    def rename(value):
+        return pattern.sub(new_name, value) if isinstance(value, str) else value
+
+    return dataclasses.replace(
+        analysis,
+        name=new_name,
+        description=rename(analysis.description),
+        test_scenarios=[
+            {key: rename(value) for key, value in scenario.items()}
+            for scenario in analysis.test_scenarios
+        ]
+    )
+
+
+@dataclass
+class DedupClaim:
+    """Bir fingerprint için analiz sahipliği veya bekleme kaydı"""
+    key: str
+    canonical_name: str
+    future: Future
+    owner: bool
+
+
+class DedupRegistry:
+    """
+    Fingerprint -> analiz sonucu kaydı
+
+    Bir fingerprint'i ilk talep eden çağrı analizin sahibi olur; aynı
+    fingerprint'e sahip sonraki çağrılar (eşzamanlı olsalar bile) sahibin
+    sonucunu bekler ve yeniden kullanır. Talep yalnızca analiz fiilen
+    başlarken yapılmalıdır; böylece bekleyenler her zaman çalışmakta olan
+    bir analizi bekler.
+    """
+
+    def __init__(self):
+        self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, DedupClaim] = {}
+        self.saved = 0
+
+    def claim(self, function_dict: Dict[str, Any]) -> DedupClaim:
+        """
+        Fonksiyonun fingerprint'ini talep et
+
+        Args:
+            function_dict: Fonksiyon bilgileri
+
+        Returns:
+            owner=True ise çağıran analiz edip resolve/fail çağırmalı,
+            aksi halde wait ile sonucu almalı
+        """
+        key = function_fingerprint(function_dict)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return DedupClaim(key, entry.canonical_name, entry.future, owner=False)
+
+            claim = DedupClaim(key, function_dict['name'], Future(), owner=True)
+            self._entries[key] = claim
+            return claim
+
+    def resolve(self, claim: DedupClaim, analysis, keep: bool = True) -> None:
+        """
+        Sahip olunan analizin sonucunu yayınla
+
+        Args:
+            claim: owner=True talep
+            analysis: FunctionAnalysis objesi
+            keep: False ise sonuç yalnızca bekleyenlere verilir, sonraki
+                çağrılar yeniden analiz eder (ör. LLM başarısız olduysa)
+        """
+        if not keep:
+            self._forget(claim)
+        claim.future.set_result(analysis)
+
+    def fail(self, claim: DedupClaim, error: BaseException) -> None:
+        """Sahip olunan analiz hata verdi; bekleyenler kendi analizini yapar"""
+        self._forget(claim)
+        if not claim.future.done():
+            claim.future.set_exception(error)
+
+    def wait(self, claim: DedupClaim, function_dict: Dict[str, Any]):
+        """
+        Sahibin sonucunu bekle ve yerel ada çevir
+
+        Args:
+            claim: owner=False talep
+            function_dict: Kopyanın fonksiyon bilgileri
+
+        Returns:
+            FunctionAnalysis objesi veya sahip hata verdiyse None
+        """
+        try:
+            analysis = claim.future.result()
+        except Exception:
+            return None
+
+        with self._lock:
+            self.saved += 1
+
+        self.logger.info(f"Fonksiyon {claim.canonical_name} ile aynı, analiz yeniden kullanıldı: {function_dict['name']}")
+        return rename_analysis(analysis, claim.canonical_name, function_dict['name'])
+
+    def run(self, function_dict: Dict[str, Any], analyze: Callable[[], Any],
+            keep: Callable[[Any], bool] = lambda analysis: True):
+        """
+        Fonksiyonu tekilleştirerek analiz et
+
+        Args:
+            function_dict: Fonksiyon bilgileri
+            analyze: Sahip olunduğunda çağrılacak analiz fonksiyonu
+            keep: Sonucun sonraki çağrılar için saklanıp saklanmayacağı
+
+        Returns:
+            FunctionAnalysis objesi
+        """
+        claim = self.claim(function_dict)
+
+        if not claim.owner:
+            analysis = self.wait(claim, function_dict)
+            if analysis is not None:
+                return analysis
+            return analyze()
+
+        try:
+            analysis = analyze()
+        except BaseException as e:
+            self.fail(claim, e)
+            raise
+
+        self.resolve(claim, analysis, keep=keep(analysis))
+        return analysis
+
+    def _forget(self, claim: DedupClaim) -> None:
+        """Kaydı sil (sonraki çağrılar yeniden analiz eder)"""
+        with self._lock:
+            if self._entries.get(claim.key) is claim:
+                del self._entries[claim.key]
@@ -2,10 +2,30 @@
 LLM kullanarak fonksiyon analizi yapan modül
 """
 
+import asyncio
+import json
+import re
 import requests
-from typing import Dict, List, Any, Optional
+import socket
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from requests.adapters import HTTPAdapter
+from pathlib import Path
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Union
 from dataclasses import dataclass
 
+from .backends import create_backend
+from .cassette import LLM_MODES, CassetteStore, LatencyModel
+from .circuit_breaker import CLOSED, CircuitBreaker, CircuitOpenError
+from .concurrency import AdaptiveLimiter
+from .dedup import DedupRegistry
+from .quota import SharedQuota
+from .response_cache import ResponseCache
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_BATCH, PRIORITY_INTERACTIVE, PRIORITIES, RequestScheduler
+from .retry import RetryPolicy, RetryStats, classify_error, parse_retry_after
 from ..utils.config import config
 from ..utils.logger import get_logger
 from dotenv import load_dotenv
@@ -15,6 +35,194 @@ load_dotenv()
 
 logger = get_logger(__name__)
 
+# Toplu analizde fonksiyon yanıtlarını ayıran satırlar
+_BATCH_BEGIN = "// ==== TESTS BEGIN {index}: {name} ===="
+_BATCH_END = "// ==== TESTS END {index}: {name} ===="
+_BATCH_BLOCK_PATTERN = re.compile(
+    r'//\s*=+\s*TESTS BEGIN (?P<index>\d+):\s*(?P<name>\w+)\s*=+[^\n]*\n'
+    # Bitiş ayracı eksik bir blok sonraki fonksiyonun bloğunu yutmamalı
+    r'(?P<code>(?:(?!//\s*=+\s*TESTS BEGIN ).)*?)'
+    r'//\s*=+\s*TESTS END (?P=index):\s*(?P=name)\s*=+',
+    re.DOTALL
+)
+_CODE_FENCE_PATTERN = re.compile(r'^\s*```\w*\s*$', re.MULTILINE)
+
+# Tüm isteklerde birebir aynı kalan sabit önek (system mesajı). Sağlayıcı
+# tarafındaki prompt önbelleğinin çalışması için bu metin fonksiyona göre
+# DEĞİŞMEMELİ; fonksiyona özgü her şey user mesajına yazılır.
+ANALYSIS_SYSTEM_PROMPT = """Sen bir C fonksiyon analiz uzmanısın. Black Box test teknikleri konusunda uzman olarak, fonksiyonları analiz edip test senaryoları üretirsin.
+
+Senin görevin, verilen C fonksiyonlarına yönelik Ceedling test çerçeveleriyle uyumlu C birim test kodu üretmektir. Kurallara kesinlikle uymalısın:
+
+1. Sadece geçerli, çalıştırılabilir ve derlenebilir C test kodu üret
+2. Kod dışında yorum, açıklama veya başka içerik EKLEME
+3. Tüm test fonksiyonlarını tek bir dosyada grupla
+4. Test fonksiyonlarını şu formatta adlandır: test_<orijinal_fonksiyon_adı>__<senaryo>
+5. Unity test makrolarını kullan: TEST_ASSERT_TRUE, TEST_ASSERT_FALSE, TEST_ASSERT_EQUAL_INT, TEST_ASSERT_EQUAL_STRING, TEST_ASSERT_NULL, TEST_ASSERT_NOT_NULL vb.
+6. Fonksiyon enum parametresi alıyorsa, geçersiz değerler için açık cast kullan: (enum_t)(...)
+7. Fonksiyonun dönüş değeri varsa mutlaka test et
+8. Doxygen açıklamalarındaki parametre aralıklarını, sınır değerlerini ve eşdeğer sınıfları temel al
+9. Fonksiyon void ise, global değişken, output parametresi gibi yan etkileri test et.
+
+TEST KALİTESİ KURALLARI:
+- Test edilen fonksiyon isimleri gerçek fonksiyonlarla tam uyumlu olmalı.
+- Beklenen çıktılar fonksiyonların gerçek çıktılarıyla birebir eşleşmeli.
+- String veya sabit değerlerde küçük farklılıklar olmamalı.
+- Sınır değerler ve geçersiz girişler mutlaka test edilmeli.
+- Gereksiz tekrarlar önlenmeli, odaklanmış test fonksiyonları kullanılmalı.
+- Taşma, belirsiz veya tanımsız davranış gösteren durumlar test edilmemeli.
+- Testler sade ve anlaşılır olmalı.
+
+Aşağıdaki teknikleri kullanarak test fonksiyonlarını oluştur:
+
+Equivalence Partitioning (EP):
+- Her parametre için geçerli ve geçersiz eşdeğer sınıflar oluştur.
+- Her sınıftan en az bir test vakası yaz
+- Sınıflar arasında gereksiz tekrarlar olmamalı.
+
+Boundary Value Analysis (BVA):
+- Sayısal ve sıralı parametrelerde:
+  * Minimum geçerli değer
+  * Minimum geçersiz değer (bir önceki değer)
+  * Maksimum geçerli değer
+  * Maksimum geçersiz değer (bir sonraki değer)
+- Enum parametrelerde enumun sınır değerleri kullanılarak test yapılmalı.
+- Sınır değerler için ayrı test fonksiyonları oluştur.
+
+Error Handling:
+- Geçersiz girişler için hata durumları test edilmeli.
+- NULL pointer durumları kontrol edilmeli.
+- Taşma/underflow durumları sadece fonksiyon bunları handle ediyorsa test edilmeli.
+
+Test Organizasyonu:
+- Her test senaryosu için ayrı test fonksiyonu
+- Benzer testler gruplandırılmalı
+- Test fonksiyon isimleri açıklayıcı olmalı
+- Gereksiz tekrarlar önlenmeli
+
+Doxygen formatında tanımlanan parametre açıklamaları, test değerlerinin belirlenmesinde temel alınmalıdır. Parametre aralıkları belirtilmemişse, C veri tipinin sınırları (örn. INT_MIN, INT_MAX) kullanılarak analiz yapılmalıdır.
+Yalnızca C dilinde, Ceedling ile uyumlu, test dosyası formatında sadece test fonksiyonu üret. Hiçbir yorum satırı ekleme ve kodlarda asla tekrara düşme.
+
+ÖNEMLİ KURALLAR:
+- Sadece C test kodunu döndür. JSON, açıklama veya başka hiçbir şey ekleme.
+- Test edilen fonksiyonun adını ve parametrelerini ASLA değiştirme
+- Test fonksiyon isimlerinde MUTLAKA orijinal fonksiyon adını kullan
+- Fonksiyon adını çevirme (Türkçe'ye veya İngilizce'ye), değiştirme veya farklı bir isimle yazma
+- Test fonksiyonlarında fonksiyonu orijinal adıyla ve imzasındaki parametrelerle çağır
+- Fonksiyon imzasını aynen koru
+- Include dosyası: #include "<fonksiyon_adı>.h" şeklinde olmalı
+
+TEST KODU ÜRETME TALİMATLARI:
+1. Fonksiyonun gerçek mantığını ve amacını anla.
+2. Her parametre için Doxygen açıklamasını detaylı analiz et: parametre aralığı (min, max), geçerli ve geçersiz değer sınıfları, sınır değerleri ve özel kısıtlamalar.
+3. Parametre aralıklarını, kısıtlamalarını ve sınır değerlerini çıkar.
+4. Equivalence Partitioning için geçerli ve geçersiz değer sınıflarını belirle.
+5. Boundary Value Analysis için sınır değerlerini belirle.
+6. Hata durumlarını ve özel durumları tespit et.
+7. Her test senaryosu için beklenen sonucu hesapla (fonksiyon mantığına göre).
+8. Sadece C test kodunu üret, başka hiçbir şey ekleme.
+
+KALİTE KONTROL:
+1. Test fonksiyon isimleri açıklayıcı ve anlamlı olmalı (Test fonksiyonları `test_<fonksiyon_adı>__<senaryo>` biçiminde olmalı.).
+2. Beklenen çıktılar fonksiyonun gerçek davranışıyla tam uyumlu olmalı.
+3. String değerler birebir eşleşmeli (büyük/küçük harf, boşluk, noktalama).
+4. Sınır değerler doğru test edilmeli.
+5. Üretilen test fonksiyonlarında gereksiz tekrarlar olmamalı.
+6. Her test senaryosu için ayrı test fonksiyonu.
+7. Testler sade ve anlaşılır olmalı.
+8. Taşma/underflow gibi belirsiz durumlar test edilmemeli.
+
+Fonksiyon bilgileri kullanıcı mesajında verilir."""
+
+
+class _HedgeCancelled(Exception):
+    """Yarışan istek, diğeri kazandığı için iptal edildi"""
+
+
+class _HedgeAttempt:
+    """Kopyalanan isteklerden biri; iptal edildiğinde bağlantısı hemen kapatılır"""
+    
+    def __init__(self, data: Dict[str, Any], label: str, slot: ExitStack,
+                 on_attempt: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            data: Chat completions istek gövdesi
+            label: 'primary' (akışsız) veya 'hedge' (akış olarak alınır)
+            slot: İsteğin zamanlayıcı ve sınırlayıcıdaki yeri; istek bitip
+                bağlantısı kapandığında isteğin iş parçacığında bırakılır
+            on_attempt: Her HTTP denemesinin başında çağrılacak fonksiyon
+        """
+        self.data = data
+        self.label = label
+        self.slot = slot
+        self.on_attempt = on_attempt
+        self.started = time.perf_counter()
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._response = None
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+    
+    def wait_cancelled(self, timeout: float) -> bool:
+        """
+        En fazla timeout saniye iptal edilmesini bekle
+        
+        Returns:
+            İstek iptal edildiyse True
+        """
+        return self._cancelled.wait(timeout)
+    
+    def attach(self, response: requests.Response) -> None:
+        """
+        İsteğin yanıtını iptal için sakla
+        
+        Raises:
+            _HedgeCancelled: İstek yanıt başlıkları gelmeden iptal edildi
+        """
+        with self._lock:
+            self._response = response
+            cancelled = self.cancelled
+        
+        if cancelled:
+            response.close()
+            raise _HedgeCancelled()
+    
+    def cancel(self) -> float:
+        """
+        İsteği iptal et
+        
+        Yanıtı okuyan iş parçacığı bir sonraki parçayı beklerken kalmasın diye
+        soket kapatılır (Response.close okuma bitene kadar bekler). Başlıklar
+        henüz gelmediyse bağlantı attach() içinde kapatılır.
+        
+        Returns:
+            İsteğin başlangıcından iptale kadar geçen süre (saniye)
+        """
+        with self._lock:
+            self._cancelled.set()
+            response = self._response
+        
+        sock = self._socket(response) if response is not None else None
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        return time.perf_counter() - self.started
+    
+    @staticmethod
+    def _socket(response: requests.Response) -> Optional[socket.socket]:
+        """Yanıtın okunduğu soket (bulunamazsa None)"""
+        sock = getattr(getattr(response.raw, 'connection', None), 'sock', None)
+        if sock is None:
+            # Bağlantı yanıttan sonra kapanacaksa (HTTP/1.0, Connection: close)
+            # http.client soketi bağlantıdan alıp yanıtın dosya nesnesine bırakır
+            fp = getattr(getattr(response.raw, '_fp', None), 'fp', None)
+            sock = getattr(getattr(fp, 'raw', None), '_sock', None)
+        return sock
+
 
 @dataclass
 class ParameterAnalysis:
@@ -51,6 +259,7 @@ class FunctionAnalysis:
     postconditions: List[str]
     error_conditions: List[str]
     test_scenarios: List[Dict[str, Any]] = None
+    needs_regeneration: bool = False  # LLM'e ulaşılamadı, yerel/varsayılan analizle üretildi
     
     def __post_init__(self):
         if self.return_constraints is None:
@@ -68,61 +277,272 @@ class FunctionAnalysis:
 class LLMAnalyzer:
     """LLM kullanarak fonksiyon analizi yapan sınıf"""
     
-    def __init__(self):
+    def __init__(self, reserved_interactive: Optional[int] = None):
+        """
+        Args:
+            reserved_interactive: Yalnızca interactive isteklerin kullanabileceği
+                yer sayısı (varsayılan: config.llm.interactive_reserved)
+        """
         self.logger = get_logger(__name__)
-        self.api_key = os.getenv('OPENAI_API_KEY')
-        self.api_url = "https://openrouter.ai/api/v1/chat/completions"
+        self.api_key = os.getenv(config.llm.api_key)
+        
+        # Sağlayıcıya özgü uç nokta, başlıklar ve istek parametreleri
+        self.backend = create_backend(
+            config.llm.backend,
+            config.llm.model,
+            temperature=config.llm.temperature,
+            max_tokens=config.llm.max_tokens,
+            api_url=config.llm.api_url,
+            api_key=self.api_key
+        )
+        self.api_url = self.backend.api_url
+        
+        # live: API'ye git, record: API'ye git ve kasete yaz, replay: yalnızca kasetlerden oku
+        self.mode = config.llm.mode
+        if self.mode not in LLM_MODES:
+            raise ValueError(f"Geçersiz LLM modu: {self.mode} (geçerli: {', '.join(LLM_MODES)})")
+        
+        self.cassettes = None
+        if self.mode != 'live':
+            self.cassettes = CassetteStore(
+                Path(config.llm.cassette_dir),
+                latency=LatencyModel.parse(config.llm.replay_latency)
+            )
+        
+        # LLM API key zorunlu (kaset oynatma, yerel sunucular ve anahtarsız backend'ler hariç)
+        if (not self.api_key and self.backend.requires_key and self.mode != 'replay'
+                and not self._is_local_url(self.api_url)):
+            raise ValueError(f"LLM analizi için {self.backend.name} API key zorunludur! "
+                             f"({config.llm.api_key} ortam değişkeni)")
+        
+        # Basit fonksiyonlar için yerel aralık çıkarımı (LLM çağrısı yapılmaz)
+        self.range_extractor = None
+        if config.llm.local_ranges:
+            from .range_extractor import RangeExtractor
+            self.range_extractor = RangeExtractor()
+        
+        # Basit fonksiyonları küçük modele, karmaşıkları config.llm.model'e gönder
+        self.router = None
+        if config.llm.small_model:
+            from .router import ModelRouter, Route
+            self.router = ModelRouter([
+                Route('small', config.llm.small_model, config.llm.route_threshold),
+                Route('large', config.llm.model, float('inf'))
+            ])
+        
+        # Kopyalanmış fonksiyonları (ad farkı dahil) tek kez analiz et
+        self.dedup = DedupRegistry() if config.llm.deduplicate else None
+        
+        # Aynı istek için yanıtı diskten kullan
+        self.response_cache = None
+        if config.llm.use_cache:
+            ttl_hours = config.llm.cache_ttl_hours
+            self.response_cache = ResponseCache(
+                Path(config.llm.cache_dir),
+                max_bytes=config.llm.cache_max_mb * 1024 * 1024,
+                ttl=ttl_hours * 3600 if ttl_hours else None
+            )
+        
+        # Keep-alive bağlantı havuzu ve ayrı bağlantı/okuma zaman aşımları
+        self.timeout = (config.llm.connect_timeout, config.llm.read_timeout)
+        # Uyarlanır sınırlayıcı eşzamanlı isteği max_concurrency'ye kadar
+        # çıkarabilir; kopyalanan istekler de bağlantı kullanır. Havuz küçük
+        # kalırsa fazla bağlantılar kapatılır ve keep-alive kaybedilir.
+        pool_size = config.llm.pool_size
+        if config.llm.adaptive_concurrency:
+            pool_size = max(pool_size, config.llm.max_concurrency)
+        if config.llm.hedge:
+            pool_size *= 2
+        self.session = self._create_session(pool_size)
         
-        # LLM API key zorunlu
-        if not self.api_key:
-            raise ValueError("LLM analizi için OpenRouter API key zorunludur!")
+        # Geçici hatalar (429, 5xx, zaman aşımı) için yeniden deneme
+        self.retry_policy = RetryPolicy(
+            max_retries=config.llm.max_retries,
+            base_delay=config.llm.retry_base_delay,
+            max_delay=config.llm.retry_max_delay,
+            deadline=config.llm.call_deadline
+        )
+        self.retry_stats = RetryStats()
+        
+        # Backend erişilemezken istekleri beklemeden yerel analize yönlendir
+        self.breaker = CircuitBreaker(
+            failure_threshold=config.llm.breaker_threshold,
+            reset_timeout=config.llm.breaker_reset_timeout,
+            name=self.backend.name
+        )
+        
+        # Eşzamanlı istek sınırını 429 ve gecikmeye göre uyarla (AIMD)
+        self.limiter = None
+        if config.llm.adaptive_concurrency:
+            self.limiter = AdaptiveLimiter(
+                initial=config.llm.concurrency,
+                min_limit=config.llm.min_concurrency,
+                max_limit=config.llm.max_concurrency,
+                latency_tolerance=config.llm.latency_tolerance
+            )
+        
+        # Backend'e giden istekler öncelik sınıflarına göre sıraya girer
+        limiter = self.limiter
+        self.scheduler = RequestScheduler(
+            capacity=lambda: limiter.limit if limiter is not None else config.llm.concurrency,
+            weights={
+                PRIORITY_INTERACTIVE: config.llm.weight_interactive,
+                PRIORITY_BATCH: config.llm.weight_batch,
+                PRIORITY_BACKGROUND: config.llm.weight_background
+            },
+            reserved_interactive=(config.llm.interactive_reserved if reserved_interactive is None
+                                  else reserved_interactive)
+        )
         
-        self.logger.info("OpenRouter API client başarıyla oluşturuldu")
+        # Zamanlayıcı süreç içindedir; aynı API kotasını kullanan diğer
+        # süreçlerle (web arayüzü, toplu işler) yerler kilit dosyalarıyla paylaşılır
+        self.quota = None
+        if config.llm.shared_quota > 0:
+            if SharedQuota.available():
+                self.quota = SharedQuota(
+                    Path(config.llm.shared_quota_dir),
+                    config.llm.shared_quota,
+                    reserved_interactive=config.llm.shared_quota_reserved
+                )
+            else:
+                self.logger.warning("Süreçler arası kota bu platformda desteklenmiyor (fcntl yok), kapatıldı")
         
-    def analyze_function(self, function_info) -> FunctionAnalysis:
+        # Kuyruk gecikmesini (p99) kısaltmak için yavaş isteklerin kopyası
+        self.hedge_stats = RetryStats()
+        self._hedge_executor = None
+        if config.llm.hedge:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=2 * max(config.llm.concurrency, config.llm.max_concurrency if self.limiter else 0),
+                thread_name_prefix="llm-hedge"
+            )
+        
+        if config.llm.prewarm_connections > 0 and self.mode != 'replay':
+            threading.Thread(
+                target=self.prewarm,
+                args=(config.llm.prewarm_connections,),
+                name="llm-prewarm",
+                daemon=True
+            ).start()
+        
+        if self.mode == 'replay':
+            self.logger.info(f"LLM yanıtları kasetlerden oynatılacak: {config.llm.cassette_dir} "
+                             f"(gecikme: {config.llm.replay_latency})")
+        else:
+            self.logger.info(f"LLM client başarıyla oluşturuldu: {self.backend.name} "
+                             f"({self.backend.model} @ {self.api_url})")
+    
+    @staticmethod
+    def _is_local_url(url: str) -> bool:
+        """URL yerel makinedeki bir sunucuyu mu gösteriyor"""
+        from urllib.parse import urlparse
+        return urlparse(url).hostname in ('localhost', '127.0.0.1', '::1')
+    
+    def _create_session(self, pool_size: int) -> requests.Session:
+        """
+        Bağlantı havuzlu HTTP oturumu oluştur
+        
+        Args:
+            pool_size: Host başına açık tutulacak en fazla bağlantı sayısı
+            
+        Returns:
+            requests.Session objesi
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(self.backend.headers())
+        return session
+    
+    def prewarm(self, connections: int = 1) -> int:
+        """
+        API sunucusuna bağlantıları önceden aç (TCP + TLS el sıkışması)
+        
+        Açılan bağlantılar havuzda kalır ve ilk analiz istekleri el sıkışma
+        maliyeti ödemeden bunları kullanır.
+        
+        Args:
+            connections: Açılacak bağlantı sayısı
+            
+        Returns:
+            Başarıyla açılan bağlantı sayısı
+        """
+        def open_connection(_):
+            try:
+                # Yanıt kodu önemli değil; bağlantının kurulması yeterli
+                self.session.head(self.api_url, timeout=self.timeout).close()
+                return True
+            except requests.exceptions.RequestException as e:
+                self.logger.warning(f"Bağlantı ön ısıtması başarısız: {e}")
+                return False
+        
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            opened = sum(executor.map(open_connection, range(connections)))
+        
+        self.logger.debug(f"{opened}/{connections} bağlantı önceden açıldı")
+        return opened
+    
+    def close(self) -> None:
+        """HTTP oturumunu ve havuzdaki bağlantıları kapat"""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+        
+    def analyze_function(self, function_info,
+                         on_chunk: Optional[Callable[[str], None]] = None,
+                         priority: str = PRIORITY_BATCH) -> FunctionAnalysis:
         """
         Fonksiyonu LLM ile analiz et
         
         Args:
             function_info: DoxygenFunction objesi veya Dict[str, Any]
+            on_chunk: Verilirse yanıt akış (SSE) modunda istenir ve her parça
+                geldikçe bu fonksiyona iletilir. Yerel analizde çağrılmaz.
+            priority: İsteğin öncelik sınıfı (interactive, batch, background)
             
         Returns:
             FunctionAnalysis objesi
         """
-        # DoxygenFunction objesini dict'e çevir
-        if hasattr(function_info, 'name'):
-            # DoxygenFunction objesi
-            function_dict = {
-                'name': function_info.name,
-                'signature': function_info.signature,
-                'brief': function_info.brief,
-                'details': function_info.details,
-                'params': [
-                    {
-                        'name': param.name,
-                        'description': param.description,
-                        'type': param.type,
-                        'direction': param.direction
-                    }
-                    for param in function_info.params
-                ],
-                'return_info': {
-                    'description': function_info.return_info.description if function_info.return_info else None,
-                    'type': function_info.return_info.type if function_info.return_info else None
-                } if function_info.return_info else None
-            }
-        else:
-            # Zaten dict
-            function_dict = function_info
+        function_dict = self._to_function_dict(function_info)
         
         self.logger.info(f"Fonksiyon analiz ediliyor: {function_dict['name']}")
         
+        # Doxygen açıklamaları tüm parametreleri kapsıyorsa LLM'e gitme
+        local_analysis = self._analyze_locally(function_dict)
+        if local_analysis is not None:
+            return local_analysis
+        
+        # Etkileşimli istekler düşük öncelikli bir kopyanın analizini beklemez
+        if self.dedup is None or priority == PRIORITY_INTERACTIVE:
+            return self._analyze_with_llm(function_dict, on_chunk, priority)
+        
+        return self.dedup.run(
+            function_dict,
+            lambda: self._analyze_with_llm(function_dict, on_chunk, priority),
+            keep=self._has_llm_code
+        )
+    
+    def _analyze_with_llm(self, function_dict: Dict[str, Any],
+                          on_chunk: Optional[Callable[[str], None]] = None,
+                          priority: str = PRIORITY_BATCH) -> FunctionAnalysis:
+        """
+        Fonksiyonu tek istekle LLM'e analiz ettir
+        
+        Args:
+            function_dict: Fonksiyon bilgileri
+            on_chunk: Akış modunda parçaların iletileceği fonksiyon
+            priority: İsteğin öncelik sınıfı
+            
+        Returns:
+            FunctionAnalysis objesi (hata durumunda varsayılan analiz)
+        """
         # LLM'e gönderilecek prompt'u hazırla
         prompt = self._create_analysis_prompt(function_dict)
         
         try:
             # LLM'den analiz al
-            response = self._get_llm_analysis(prompt)
+            response = self._get_llm_analysis(prompt, on_chunk=on_chunk, priority=priority,
+                                              model=self._route_model([function_dict]))
             
             # Response'u FunctionAnalysis objesine çevir
             analysis = self._parse_llm_response(function_dict, response)
@@ -130,14 +550,370 @@ class LLMAnalyzer:
             self.logger.info(f"Fonksiyon analizi tamamlandı: {function_dict['name']}")
             return analysis
             
+        except CircuitOpenError:
+            self.logger.warning(f"Backend erişilemiyor, yerel analiz kullanıldı (yeniden üretilecek): {function_dict['name']}")
+            return self._create_fallback_analysis(function_dict)
         except Exception as e:
             self.logger.error(f"Fonksiyon analizi hatası: {e}")
             # Hata durumunda basit bir analiz döndür
-            return self._create_default_analysis(function_dict)
+            return self._create_fallback_analysis(function_dict)
+    
+    def _route_model(self, function_dicts: List[Dict[str, Any]]) -> Optional[str]:
+        """
+        Fonksiyonların karmaşıklığına göre model seç
+        
+        Args:
+            function_dicts: Aynı istekte analiz edilecek fonksiyonlar
+            
+        Returns:
+            Model adı (yönlendirme kapalıysa None, yani backend modeli)
+        """
+        if self.router is None:
+            return None
+        return self.router.route_many(function_dicts).model
+    
+    @staticmethod
+    def _has_llm_code(analysis: FunctionAnalysis) -> bool:
+        """Analiz LLM'in ürettiği test kodunu içeriyor mu"""
+        return any(scenario.get('type') == 'llm_generated' for scenario in analysis.test_scenarios)
+    
+    def _to_function_dict(self, function_info) -> Dict[str, Any]:
+        """
+        DoxygenFunction objesini analiz için dict'e çevir
+        
+        Args:
+            function_info: DoxygenFunction objesi veya Dict[str, Any]
+            
+        Returns:
+            Fonksiyon bilgileri
+        """
+        if not hasattr(function_info, 'name'):
+            # Zaten dict
+            return function_info
+        
+        return {
+            'name': function_info.name,
+            'signature': function_info.signature,
+            'brief': function_info.brief,
+            'details': function_info.details,
+            'params': [
+                {
+                    'name': param.name,
+                    'description': param.description,
+                    'type': param.type,
+                    'direction': param.direction
+                }
+                for param in function_info.params
+            ],
+            'return': {
+                'description': function_info.return_info.description if function_info.return_info else None,
+                'type': function_info.return_info.type if function_info.return_info else None
+            },
+            'return_info': {
+                'description': function_info.return_info.description if function_info.return_info else None,
+                'type': function_info.return_info.type if function_info.return_info else None
+            } if function_info.return_info else None,
+            # Tekilleştirme fingerprint'i bu alanların tamamını okur (bkz. dedup._DOC_FIELDS)
+            'preconditions': [pre.description for pre in function_info.preconditions],
+            'postconditions': [post.description for post in function_info.postconditions],
+            'notes': list(function_info.notes),
+            'warnings': list(function_info.warnings),
+            'throws': list(function_info.throws),
+            'code': function_info.code
+        }
+    
+    def _analyze_locally(self, function_dict: Dict[str, Any]) -> Optional[FunctionAnalysis]:
+        """
+        Fonksiyonu LLM'e gitmeden yerel aralık çıkarımıyla analiz etmeyi dene
+        
+        Args:
+            function_dict: Fonksiyon bilgileri
+            
+        Returns:
+            Tüm parametreler kapsandıysa FunctionAnalysis, aksi halde None
+        """
+        if self.range_extractor is None:
+            return None
+        
+        local_analysis = self.range_extractor.analyze_function(function_dict)
+        if local_analysis is not None:
+            self.logger.info(f"Fonksiyon yerel kurallarla analiz edildi, LLM atlandı: {function_dict['name']}")
+        return local_analysis
+    
+    def analyze_batch(self, function_infos: List[Any], priority: str = PRIORITY_BATCH) -> List[FunctionAnalysis]:
+        """
+        Aynı dosyadaki birden fazla fonksiyonu tek istekle analiz et
+        
+        Fonksiyonlar ayraçlarla tek prompt'a yerleştirilir ve yanıt aynı
+        ayraçlarla fonksiyonlara bölünür. Yanıtta bulunamayan fonksiyonlar
+        (veya istek tamamen başarısız olursa hepsi) tek tek analiz edilir.
+        
+        Args:
+            function_infos: DoxygenFunction objeleri veya Dict[str, Any]
+            priority: İsteklerin öncelik sınıfı
+            
+        Returns:
+            Girdi sırasıyla FunctionAnalysis objeleri
+        """
+        function_dicts = [self._to_function_dict(info) for info in function_infos]
+        if len(function_dicts) == 1:
+            return [self.analyze_function(function_dicts[0], priority=priority)]
+        
+        if self.dedup is None or priority == PRIORITY_INTERACTIVE:
+            return self._analyze_batch_with_llm(function_dicts, priority)
+        
+        # Kopyalar prompt'a eklenmez; sahipler yayınlandıktan sonra beklenir
+        claims = [self.dedup.claim(function_dict) for function_dict in function_dicts]
+        owners = [index for index, claim in enumerate(claims) if claim.owner]
+        results = [None] * len(function_dicts)
+        
+        try:
+            owned = [function_dicts[index] for index in owners]
+            if len(owned) == 1:
+                analyses = [self._analyze_with_llm(owned[0], priority=priority)]
+            else:
+                analyses = self._analyze_batch_with_llm(owned, priority) if owned else []
+        except BaseException as e:
+            for index in owners:
+                self.dedup.fail(claims[index], e)
+            raise
+        
+        for index, analysis in zip(owners, analyses):
+            results[index] = analysis
+            self.dedup.resolve(claims[index], analysis, keep=self._has_llm_code(analysis))
+        
+        for index, claim in enumerate(claims):
+            if not claim.owner:
+                results[index] = (self.dedup.wait(claim, function_dicts[index])
+                                  or self._analyze_with_llm(function_dicts[index], priority=priority))
+        
+        return results
+    
+    def _analyze_batch_with_llm(self, function_dicts: List[Dict[str, Any]],
+                                priority: str = PRIORITY_BATCH) -> List[FunctionAnalysis]:
+        """
+        Fonksiyonları tek toplu istekle LLM'e analiz ettir
+        
+        Args:
+            function_dicts: Fonksiyon bilgileri (en az iki)
+            priority: İsteğin öncelik sınıfı
+            
+        Returns:
+            Girdi sırasıyla FunctionAnalysis objeleri
+        """
+        names = [function_dict['name'] for function_dict in function_dicts]
+        self.logger.info(f"{len(function_dicts)} fonksiyon tek istekle analiz ediliyor: {', '.join(names)}")
+        
+        try:
+            response = self._get_llm_analysis(self._create_batch_prompt(function_dicts), priority=priority,
+                                              model=self._route_model(function_dicts))
+            blocks = self._split_batch_response(response, names)
+        except CircuitOpenError:
+            return [self._create_fallback_analysis(function_dict) for function_dict in function_dicts]
+        except Exception as e:
+            self.logger.warning(f"Toplu analiz başarısız, fonksiyonlar tek tek analiz edilecek: {e}")
+            blocks = {}
+        
+        results = []
+        for index, function_dict in enumerate(function_dicts):
+            code = blocks.get(index)
+            if code:
+                results.append(self._parse_llm_response(function_dict, code))
+            else:
+                self.logger.warning(f"Toplu yanıtta fonksiyon bulunamadı, tek istekle analiz ediliyor: {function_dict['name']}")
+                results.append(self._analyze_with_llm(function_dict, priority=priority))
+        
+        return results
+    
+    def analyze_many(self, functions: Iterable, concurrency: Optional[int] = None,
+                     priority: str = PRIORITY_BATCH) -> List[Union[FunctionAnalysis, Exception]]:
+        """
+        Birden fazla fonksiyonu eşzamanlı analiz et
+        
+        Args:
+            functions: DoxygenFunction objeleri veya Dict[str, Any] (üreteç olabilir)
+            concurrency: Aynı anda yapılacak en fazla analiz (varsayılan: config.llm.concurrency)
+            priority: İsteklerin öncelik sınıfı (interactive, batch, background)
+            
+        Returns:
+            Girdi sırasıyla FunctionAnalysis objeleri; analizi hata veren
+            fonksiyonun yerinde yakalanan exception bulunur
+        """
+        return asyncio.run(self.analyze_many_async(functions, concurrency, priority))
+    
+    async def analyze_many_async(self, functions: Iterable, concurrency: Optional[int] = None,
+                                 priority: str = PRIORITY_BATCH) -> List[Union[FunctionAnalysis, Exception]]:
+        """
+        Birden fazla fonksiyonu event loop üzerinde sınırlı paralellikle analiz et
+        
+        Analizler iş parçacıklarında çalışır; en fazla `concurrency` istek aynı
+        anda beklemededir. Girdi bir üreteçse fonksiyonlar geldikçe analize
+        gönderilir, böylece parse ile analiz örtüşür. Bir fonksiyondaki hata
+        diğerlerini iptal etmez. Backend'e giden istekler ayrıca süreç
+        genelindeki öncelik zamanlayıcısından geçer.
+        
+        Args:
+            functions: DoxygenFunction objeleri veya Dict[str, Any] (üreteç olabilir)
+            concurrency: Aynı anda yapılacak en fazla analiz (varsayılan: config.llm.concurrency)
+            priority: İsteklerin öncelik sınıfı (interactive, batch, background)
+            
+        Returns:
+            Girdi sırasıyla FunctionAnalysis objeleri veya exception'lar
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Geçersiz öncelik sınıfı: {priority} (geçerli: {', '.join(PRIORITIES)})")
+        
+        # Sayaçlar analizör ömrü boyunca birikir; bu çağrının payı farktan hesaplanır
+        retries_before = self.retry_stats.snapshot().get('retries', 0)
+        breaker_before = self.breaker.snapshot()
+        
+        concurrency = max(1, concurrency or config.llm.concurrency)
+        if self.limiter is not None:
+            # İstekleri sınırlayıcı kısar; iş parçacıkları en yüksek sınıra kadar hazır bekler
+            concurrency = max(concurrency, self.limiter.max_limit)
+        batch_size = max(1, config.llm.batch_size)
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def analyze(function_info):
+            async with semaphore:
+                return await loop.run_in_executor(executor, partial(self.analyze_function, function_info,
+                                                                    priority=priority))
+        
+        async def analyze_batch(function_dicts):
+            async with semaphore:
+                return await loop.run_in_executor(executor, self.analyze_batch, function_dicts, priority)
+        
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="llm") as executor:
+            # (başlangıç indeksi, fonksiyon sayısı, task) - toplu task'lar liste döndürür
+            tasks = []
+            results = []
+            # Toplu istekler rota başına biriktirilir; basit fonksiyonlar güçlü modele taşınmaz
+            pending = {}
+            pending_tokens = {}
+            
+            def flush(route):
+                batch = pending.pop(route, None)
+                pending_tokens.pop(route, None)
+                if batch:
+                    indices = [index for index, _ in batch]
+                    tasks.append((indices, asyncio.ensure_future(analyze_batch([info for _, info in batch]))))
+            
+            for function_info in functions:
+                index = len(results)
+                results.append(None)
+                
+                if batch_size == 1:
+                    tasks.append(([index], asyncio.ensure_future(analyze(function_info))))
+                else:
+                    try:
+                        function_dict = self._to_function_dict(function_info)
+                        local_analysis = self._analyze_locally(function_dict)
+                    except Exception as e:
+                        results[index] = e
+                        continue
+                    
+                    if local_analysis is not None:
+                        results[index] = local_analysis
+                        continue
+                    
+                    route = self._route_model([function_dict])
+                    tokens = self._estimate_tokens(self._format_function_section(function_dict))
+                    if pending.get(route) and (len(pending[route]) >= batch_size or
+                                               pending_tokens[route] + tokens > config.llm.batch_token_budget):
+                        flush(route)
+                    pending.setdefault(route, []).append((index, function_dict))
+                    pending_tokens[route] = pending_tokens.get(route, 0) + tokens
+                
+                # Kuyruktaki analizlerin başlayabilmesi için kontrolü event loop'a bırak
+                await asyncio.sleep(0)
+            
+            for route in list(pending):
+                flush(route)
+            outcomes = await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
+        
+        for (indices, _), outcome in zip(tasks, outcomes):
+            if isinstance(outcome, Exception):
+                for index in indices:
+                    results[index] = outcome
+            elif isinstance(outcome, list):
+                for index, analysis in zip(indices, outcome):
+                    results[index] = analysis
+            else:
+                results[indices[0]] = outcome
+        
+        failed = sum(1 for result in results if isinstance(result, Exception))
+        retries = self.retry_stats.snapshot().get('retries', 0) - retries_before
+        self.logger.info(f"{len(results)} fonksiyon analiz edildi (eşzamanlılık: {concurrency}, hata: {failed}, "
+                         f"yeniden deneme: {retries})")
+        
+        degraded = sum(1 for result in results
+                       if isinstance(result, FunctionAnalysis) and result.needs_regeneration)
+        if degraded:
+            breaker = self.breaker.snapshot()
+            opened = breaker.get('opened', 0) - breaker_before.get('opened', 0)
+            short_circuited = breaker.get('short_circuited', 0) - breaker_before.get('short_circuited', 0)
+            self.logger.warning(f"{degraded} fonksiyon LLM'siz analiz edildi ve yeniden üretilmek üzere işaretlendi "
+                                f"(devre kesici: {breaker['state']}, {opened} kez açıldı, "
+                                f"{short_circuited} istek gönderilmedi)")
+        return results
+    
+    def log_summary(self) -> None:
+        """
+        Analizörün ömrü boyunca biriken ölçümleri logla
+        
+        Çok dosyalı çalıştırmalarda her dosyadan sonra değil, çalıştırma
+        sonunda bir kez çağrılır.
+        """
+        retries = self.retry_stats.snapshot()
+        if retries.get('retries') or retries.get('gave_up'):
+            self.logger.info(f"Yeniden deneme: {retries.get('attempts', 0)} denemede {retries.get('retries', 0)} yeniden "
+                             f"deneme, {retries.get('gave_up', 0)} istekte vazgeçildi")
+        
+        hedges = self.hedge_stats.snapshot()
+        if hedges.get('hedged') or hedges.get('budget_denied') or hedges.get('capacity_denied'):
+            self.logger.info(f"İstek kopyalama: {hedges.get('requests', 0)} istekten {hedges.get('hedged', 0)} tanesi kopyalandı, "
+                             f"{hedges.get('hedge_wins', 0)} kopya kazandı, {hedges.get('budget_denied', 0)} kopya bütçe "
+                             f"sınırı, {hedges.get('capacity_denied', 0)} kopya boş kapasite olmadığı için gönderilmedi")
+        
+        if self.limiter is not None:
+            limiter = self.limiter.snapshot()
+            self.logger.info(f"Uyarlanır eşzamanlılık: sınır {limiter['limit']} (en düşük {limiter['lowest_limit']}, "
+                             f"en yüksek {limiter['highest_limit']}, aynı anda en fazla {limiter['peak_in_flight']} istek, "
+                             f"{limiter['increases']} artış, {limiter['decreases']} azaltma)")
+        
+        if self.router is not None:
+            for name, route in self.router.snapshot().items():
+                if route['requests'] or route['failures']:
+                    self.logger.info(f"{name} rotası ({route['model']}): {route['requests']} istek, {route['failures']} hata, "
+                                     f"ortalama {route['mean_latency']:.2f} sn, p95 {route['p95_latency']:.2f} sn")
+        
+        for name, waits in self.scheduler.snapshot()['classes'].items():
+            if waits['requests']:
+                self.logger.info(f"Kuyruk bekleme süresi ({name}): {waits['requests']} istek, ortalama "
+                                 f"{waits['mean_wait']:.2f} sn, p95 {waits['p95_wait']:.2f} sn, en fazla {waits['max_wait']:.2f} sn")
+        
+        if self.quota is not None:
+            for name, waits in self.quota.snapshot()['classes'].items():
+                if waits['requests']:
+                    self.logger.info(f"Süreçler arası kota bekleme süresi ({name}): {waits['requests']} istek, ortalama "
+                                     f"{waits['mean_wait']:.2f} sn, en fazla {waits['max_wait']:.2f} sn")
+        
+        if self.dedup is not None and self.dedup.saved:
+            self.logger.info(f"Tekilleştirme: kopya fonksiyonlar için toplam {self.dedup.saved} LLM analizi tasarruf edildi")
+        
+        metrics = self.backend.metrics.snapshot()
+        if metrics['requests'] or metrics['failures']:
+            self.logger.info(f"{self.backend.name} backend'i: {metrics['requests']} istek, {metrics['failures']} hata, "
+                             f"ortalama {metrics['mean_latency']:.2f} sn, p95 {metrics['p95_latency']:.2f} sn, "
+                             f"{metrics['completion_tokens_per_sec']:.1f} token/sn")
     
     def _create_analysis_prompt(self, function_info: Dict[str, Any]) -> str:
         """
-        LLM analizi için prompt oluştur
+        LLM analizi için fonksiyona özgü prompt oluştur
+        
+        Sabit kurallar ANALYSIS_SYSTEM_PROMPT'tadır; burada yalnızca
+        fonksiyonun bilgileri ve adını koruma hatırlatmaları bulunur.
         
         Args:
             function_info: Fonksiyon bilgileri
@@ -145,70 +921,86 @@ class LLMAnalyzer:
         Returns:
             Analiz prompt'u
         """
-        prompt = f"""
-Senin görevin, verilen C fonksiyonlarına yönelik Ceedling test çerçeveleriyle uyumlu C birim test kodu üretmektir. Kurallara kesinlikle uymalısın:
-
-ÖNEMLİ: Fonksiyon adı "{function_info['name']}" olarak kalmalı, hiç değiştirilmemeli!
-
-1. Sadece geçerli, çalıştırılabilir ve derlenebilir C test kodu üret
-2. Kod dışında yorum, açıklama veya başka içerik EKLEME
-3. Tüm test fonksiyonlarını tek bir dosyada grupla
-4. Test fonksiyonlarını şu formatta adlandır: test_<orijinal_fonksiyon_adı>__<senaryo>
-5. Unity test makrolarını kullan: TEST_ASSERT_TRUE, TEST_ASSERT_FALSE, TEST_ASSERT_EQUAL_INT, TEST_ASSERT_EQUAL_STRING, TEST_ASSERT_NULL, TEST_ASSERT_NOT_NULL vb.
-6. Fonksiyon enum parametresi alıyorsa, geçersiz değerler için açık cast kullan: (enum_t)(...)
-7. Fonksiyonun dönüş değeri varsa mutlaka test et
-8. Doxygen açıklamalarındaki parametre aralıklarını, sınır değerlerini ve eşdeğer sınıfları temel al
-9. Fonksiyon void ise, global değişken, output parametresi gibi yan etkileri test et.
-
-TEST KALİTESİ KURALLARI:
-- Test edilen fonksiyon isimleri gerçek fonksiyonlarla tam uyumlu olmalı.
-- Beklenen çıktılar fonksiyonların gerçek çıktılarıyla birebir eşleşmeli.
-- String veya sabit değerlerde küçük farklılıklar olmamalı.
-- Sınır değerler ve geçersiz girişler mutlaka test edilmeli.
-- Gereksiz tekrarlar önlenmeli, odaklanmış test fonksiyonları kullanılmalı.
-- Taşma, belirsiz veya tanımsız davranış gösteren durumlar test edilmemeli.
-- Testler sade ve anlaşılır olmalı.
-
-Aşağıdaki teknikleri kullanarak test fonksiyonlarını oluştur:
-
-Equivalence Partitioning (EP):
-- Her parametre için geçerli ve geçersiz eşdeğer sınıflar oluştur.
-- Her sınıftan en az bir test vakası yaz
-- Sınıflar arasında gereksiz tekrarlar olmamalı.
-
-Boundary Value Analysis (BVA):
-- Sayısal ve sıralı parametrelerde:
-  * Minimum geçerli değer
-  * Minimum geçersiz değer (bir önceki değer)
-  * Maksimum geçerli değer
-  * Maksimum geçersiz değer (bir sonraki değer)
-- Enum parametrelerde enumun sınır değerleri kullanılarak test yapılmalı.
-- Sınır değerler için ayrı test fonksiyonları oluştur.
-
-Error Handling:
-- Geçersiz girişler için hata durumları test edilmeli.
-- NULL pointer durumları kontrol edilmeli.
-- Taşma/underflow durumları sadece fonksiyon bunları handle ediyorsa test edilmeli.
-
-Test Organizasyonu:
-- Her test senaryosu için ayrı test fonksiyonu
-- Benzer testler gruplandırılmalı
-- Test fonksiyon isimleri açıklayıcı olmalı
-- Gereksiz tekrarlar önlenmeli
-
-Doxygen formatında tanımlanan parametre açıklamaları, test değerlerinin belirlenmesinde temel alınmalıdır. Parametre aralıkları belirtilmemişse, C veri tipinin sınırları (örn. INT_MIN, INT_MAX) kullanılarak analiz yapılmalıdır.
-Yalnızca C dilinde, Ceedling ile uyumlu, test dosyası formatında sadece test fonksiyonu üret. Hiçbir yorum satırı ekleme ve kodlarda asla tekrara düşme.
+        prompt = self._format_function_section(function_info)
+        prompt += f"""
+SON UYARI:
+- Fonksiyon adı "{function_info['name']}" olarak kalmalı, değiştirilmemeli veya çevrilmemeli.
+- Test fonksiyonlarında fonksiyon çağrısı: {function_info['name']}(parametreler) şeklinde olmalı.
+- Fonksiyon imzası: {function_info['signature']} şeklinde korunmalı.
+- Include dosyası: #include "{function_info['name']}.h" şeklinde olmalı.
+"""
+        
+        return prompt
+    
+    def _create_batch_prompt(self, function_infos: List[Dict[str, Any]]) -> str:
+        """
+        Birden fazla fonksiyon için tek prompt oluştur
+        
+        Args:
+            function_infos: Fonksiyon bilgileri
+            
+        Returns:
+            Ayraçlı toplu analiz prompt'u
+        """
+        markers = "\n".join(
+            f"{_BATCH_BEGIN.format(index=index, name=info['name'])}\n"
+            f"...{info['name']} için test kodu...\n"
+            f"{_BATCH_END.format(index=index, name=info['name'])}"
+            for index, info in enumerate(function_infos, 1)
+        )
+        
+        prompt = f"""Aşağıda {len(function_infos)} fonksiyon var. Kuralları HER BİRİ için ayrı ayrı uygula; her fonksiyonun test bloğu kendi include satırını (#include "<fonksiyon_adı>.h") içermeli.
 
-ÖNEMLİ KURALLAR:
-- Sadece C test kodunu döndür. JSON, açıklama veya başka hiçbir şey ekleme.
-- Test edilen fonksiyonun adını ve parametrelerini ASLA değiştirme
-- Test fonksiyon isimlerinde MUTLAKA orijinal fonksiyon adını kullan
-- Fonksiyon adını çevirme, değiştirme veya farklı bir isimle yazma
-- Orijinal fonksiyon adı: "{function_info['name']}" - Bu ismi aynen kullan
-- Test fonksiyonlarında fonksiyon çağrısı yaparken: {function_info['name']}(parametreler) şeklinde yaz
-- Fonksiyon imzasını: {function_info['signature']} şeklinde aynen koru
+ÇIKTI FORMATI (ZORUNLU):
+Her fonksiyonun testlerini kendi ayraç satırları arasına yaz. Ayraç satırlarını aynen kopyala, sırayı koru ve hiçbir fonksiyonu atlama. Ayraç satırları dışında yorum ekleme:
 
-FONKSİYON BİLGİLERİ:
+{markers}
+"""
+        
+        for index, info in enumerate(function_infos, 1):
+            prompt += f"\n=== FONKSİYON {index}: {info['name']} ===\n"
+            prompt += self._format_function_section(info)
+        
+        return prompt
+    
+    def _split_batch_response(self, response: str, names: List[str]) -> Dict[int, str]:
+        """
+        Toplu yanıtı ayraçlara göre fonksiyonlara böl
+        
+        Args:
+            response: LLM yanıtı
+            names: Prompt'taki sırasıyla fonksiyon adları
+            
+        Returns:
+            0 tabanlı fonksiyon indeksi -> test kodu (bulunamayanlar eksik)
+        """
+        blocks = {}
+        for match in _BATCH_BLOCK_PATTERN.finditer(response or ''):
+            index = int(match.group('index')) - 1
+            if 0 <= index < len(names) and match.group('name') == names[index]:
+                code = _CODE_FENCE_PATTERN.sub('', match.group('code')).strip()
+                if code:
+                    blocks[index] = code
+        
+        self.logger.debug(f"Toplu yanıt bölündü: {len(blocks)}/{len(names)} fonksiyon")
+        return blocks
+    
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Metnin yaklaşık token sayısı (~4 karakter/token)"""
+        return len(text) // 4 + 1
+    
+    def _format_function_section(self, function_info: Dict[str, Any]) -> str:
+        """
+        Prompt'un fonksiyona özgü bölümünü oluştur (bilgiler, kod, parametreler, koşullar)
+        
+        Args:
+            function_info: Fonksiyon bilgileri
+            
+        Returns:
+            Fonksiyon bölümü metni
+        """
+        section = f"""FONKSİYON BİLGİLERİ:
 - İsim: {function_info['name']}
 - İmza: {function_info['signature']}
 - Açıklama: {function_info['brief']}
@@ -221,122 +1013,113 @@ PARAMETRELER (Doxygen formatındaki açıklamaları analiz et):
 """
         
         for param in function_info['params']:
-            prompt += f"""
+            section += f"""
 - {param['name']}: {param['description']}
   - Tip: {param.get('type', 'Belirtilmemiş')}
   - Yön: {param.get('direction', 'Belirtilmemiş')}
-  
-  Doxygen açıklamasını analiz et ve şunları çıkar:
-  * Parametre aralığı (min, max değerler)
-  * Geçerli değer sınıfları
-  * Geçersiz değer sınıfları
-  * Sınır değerleri
-  * Özel kısıtlamalar
 """
         
         if function_info.get('return'):
-            prompt += f"""
+            section += f"""
 DÖNÜŞ DEĞERİ:
 - Açıklama: {function_info['return']['description']}
 - Tip: {function_info['return'].get('type', 'Belirtilmemiş')}
 """
         
         if function_info.get('preconditions'):
-            prompt += f"""
+            section += f"""
 ÖNKOŞULLAR:
 """
             for pre in function_info['preconditions']:
-                prompt += f"- {pre}\n"
+                section += f"- {pre}\n"
         
         if function_info.get('postconditions'):
-            prompt += f"""
+            section += f"""
 SONKOŞULLAR:
 """
             for post in function_info['postconditions']:
-                prompt += f"- {post}\n"
-        
-        prompt += f"""
-
-TEST KODU ÜRETME TALİMATLARI:
-1. Fonksiyonun gerçek mantığını ve amacını anla.
-2. Her parametre için Doxygen açıklamasını detaylı analiz et.
-3. Parametre aralıklarını, kısıtlamalarını ve sınır değerlerini çıkar.
-4. Equivalence Partitioning için geçerli ve geçersiz değer sınıflarını belirle.
-5. Boundary Value Analysis için sınır değerlerini belirle.
-6. Hata durumlarını ve özel durumları tespit et.
-7. Her test senaryosu için beklenen sonucu hesapla (fonksiyon mantığına göre).
-8. Sadece C test kodunu üret, başka hiçbir şey ekleme.
-
-KALİTE KONTROL:
-1. Test fonksiyon isimleri açıklayıcı ve anlamlı olmalı (Test fonksiyonları `test_<fonksiyon_adı>__<senaryo>` biçiminde olmalı.).
-2. Beklenen çıktılar fonksiyonun gerçek davranışıyla tam uyumlu olmalı.
-3. String değerler birebir eşleşmeli (büyük/küçük harf, boşluk, noktalama).
-4. Sınır değerler doğru test edilmeli.
-5. Üretilen test fonksiyonlarında gereksiz tekrarlar olmamalı.
-6. Her test senaryosu için ayrı test fonksiyonu.
-7. Testler sade ve anlaşılır olmalı.
-8. Taşma/underflow gibi belirsiz durumlar test edilmemeli.
-
-Analiz yaparken şunlara dikkat et:
-1. Equivalence Partitioning (EP) için geçerli ve geçersiz değer sınıflarını belirle.
-2. Boundary Value Analysis (BVA) için sınır değerlerini belirle.
-3. Hata durumlarını ve özel durumları tespit et.
-4. Her parametre için veri tipini ve kısıtlamaları çıkar.
-5. Fonksiyonun davranışını ve beklenen sonuçları belirle.
-6. Sadece C test kodunu döndür, JSON veya açıklama ekleme.
-
-SON UYARI:
-- Fonksiyon adı "{function_info['name']}" olarak kalmalı, değiştirilmemeli.
-- Test fonksiyonlarında fonksiyon çağrısı: {function_info['name']}(parametreler) şeklinde olmalı.
-- Fonksiyon imzası: {function_info['signature']} şeklinde korunmalı.
-- Fonksiyon adını çevirme, Türkçe'ye çevirme veya farklı bir isimle yazma.
-- Fonksiyon adını İngilizce'ye çevirme, aynen koru.
-- Include dosyası: #include "{function_info['name']}.h" şeklinde olmalı.
-- Fonksiyon adı "{function_info['name']}" - Bu ismi hiç değiştirme.
-- Beklenen çıktıları fonksiyonun gerçek çıktılarıyla tam olarak eşleştir.
-- String değerlerde büyük/küçük harf, boşluk ve noktalama işaretlerine dikkat et.
-"""
+                section += f"- {post}\n"
         
-        return prompt
+        return section
     
-    def _get_llm_analysis(self, prompt: str) -> str:
+    def _get_llm_analysis(self, prompt: str, on_chunk: Optional[Callable[[str], None]] = None,
+                          priority: str = PRIORITY_BATCH, model: Optional[str] = None) -> str:
         """
         OpenRouter API'den analiz al
         
         Args:
             prompt: Analiz prompt'u
+            on_chunk: Verilirse yanıt akış modunda alınır ve parçalar geldikçe
+                bu fonksiyona iletilir (önbellekten gelen yanıt tek parça olarak)
+            priority: İsteğin zamanlayıcıdaki öncelik sınıfı
+            model: İstekte kullanılacak model (None ise backend modeli)
             
         Returns:
-            LLM yanıtı
+            LLM yanıtı (tamamı)
         """
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://github.com/c-ai-test",
-                "X-Title": "C-AI-Test"
-            }
-            
-            data = {
-                "model": "deepseek/deepseek-chat-v3-0324:free",
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "Sen bir C fonksiyon analiz uzmanısın. Black Box test teknikleri konusunda uzman olarak, fonksiyonları analiz edip test senaryoları üretirsin."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            }
+            data = self.backend.build_request([
+                {
+                    "role": "system",
+                    "content": ANALYSIS_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ], model=model)
+            
+            self.logger.debug(f"Prompt boyutu: sabit önek {len(ANALYSIS_SYSTEM_PROMPT)} karakter "
+                              f"(~{self._estimate_tokens(ANALYSIS_SYSTEM_PROMPT)} token), değişken kısım "
+                              f"{len(prompt)} karakter (~{self._estimate_tokens(prompt)} token)")
+            
+            cache_key = None
+            if self.response_cache is not None:
+                cache_key = self.response_cache.make_key(data)
+                cached = self.response_cache.get(cache_key)
+                if cached is not None:
+                    cache_stats = self.response_cache.stats()
+                    self.logger.info(f"LLM yanıtı önbellekten alındı ({cache_stats['hits']} isabet, "
+                                     f"{cache_stats['misses']} ıska)")
+                    if on_chunk is not None:
+                        on_chunk(cached)
+                    return cached
+            
+            if on_chunk is not None:
+                chunks = []
+                with self._backend_call(priority) as mark_attempt:
+                    for chunk in self._stream_completion(data, on_attempt=mark_attempt):
+                        chunks.append(chunk)
+                        on_chunk(chunk)
+                content = ''.join(chunks)
+                
+                if cache_key is not None and content.strip():
+                    self.response_cache.put(cache_key, content, model=data['model'])
+                
+                return content
             
-            response = requests.post(self.api_url, headers=headers, json=data)
-            response.raise_for_status()
+            start = time.perf_counter()
+            if self._hedge_executor is not None:
+                result = self._complete_hedged(data, priority)
+            else:
+                with self._backend_call(priority) as mark_attempt:
+                    result = self._complete(data, on_attempt=mark_attempt)
+            elapsed = time.perf_counter() - start
+            content = result['choices'][0]['message']['content']
+            
+            # Sağlayıcı prompt önbelleği: önekten kaç token yeniden kullanıldı
+            usage = result.get('usage') or {}
+            cached_tokens = (usage.get('prompt_tokens_details') or {}).get('cached_tokens')
+            self.logger.info(f"LLM yanıtı {elapsed:.2f} sn'de alındı (prompt {usage.get('prompt_tokens', '?')} token, "
+                             f"sağlayıcı önbelleğinden {cached_tokens if cached_tokens is not None else '?'} token)")
             
-            result = response.json()
-            return result['choices'][0]['message']['content']
+            if cache_key is not None and content and content.strip():
+                self.response_cache.put(cache_key, content, model=data['model'])
             
+            return content
+            
+        except CircuitOpenError:
+            raise
         except requests.exceptions.RequestException as e:
             self.logger.error(f"OpenRouter API hatası: {e}")
             raise
@@ -344,6 +1127,501 @@ SON UYARI:
             self.logger.error(f"LLM API hatası: {e}")
             raise
     
+    @contextmanager
+    def _backend_call(self, priority: str = PRIORITY_BATCH):
+        """
+        Backend isteğini öncelik zamanlayıcısından, devre kesiciden ve
+        eşzamanlılık sınırlayıcıdan geçir ve sonucunu bildir
+        
+        Yeniden denemeleri tükenen geçici hatalar (zaman aşımı, bağlantı,
+        429/5xx) hata sayılır; kalıcı HTTP hataları backend'in yanıt verdiğini
+        gösterdiği için başarı sayılır.
+        
+        Sınırlayıcıya bildirilen gecikme yalnızca son HTTP denemesinin
+        süresidir; yeniden denemeler arasındaki beklemeler gecikme artışı
+        sayılıp sınırı ikinci kez düşürmesin diye dışarıda bırakılır.
+        
+        Args:
+            priority: İsteğin öncelik sınıfı
+        
+        Yields:
+            Her HTTP denemesinin başında çağrılacak fonksiyon (on_attempt)
+        
+        Raises:
+            CircuitOpenError: Devre açık, istek gönderilmedi
+        """
+        # Devre açıkken istekler kuyrukta beklemeden reddedilir
+        self.breaker.reject_if_open()
+        
+        # Zamanlayıcı kapasiteyi sınırlayıcının sınırına göre verdiğinden
+        # limiter.acquire yalnızca sınır bu arada düşürüldüyse bekler
+        self.scheduler.acquire(priority)
+        quota_token = None
+        try:
+            # Süreç içindeki sıra geldikten sonra diğer süreçlerle paylaşılan yer alınır
+            if self.quota is not None:
+                quota_token = self.quota.acquire(priority)
+            
+            # Kuyrukta beklerken devre açılmış veya deneme isteği başlamış olabilir
+            self.breaker.check()
+            
+            limiter = self.limiter
+            if limiter is not None:
+                limiter.acquire()
+            attempt_started = [time.perf_counter()]
+            
+            def mark_attempt() -> None:
+                attempt_started[0] = time.perf_counter()
+            
+            try:
+                try:
+                    yield mark_attempt
+                except requests.exceptions.RequestException as e:
+                    if classify_error(e) is None:
+                        self.breaker.record_success()
+                    else:
+                        self.breaker.record_failure()
+                    raise
+                except BaseException:
+                    self.breaker.release()
+                    raise
+                
+                if limiter is not None:
+                    limiter.on_success(time.perf_counter() - attempt_started[0])
+                self.breaker.record_success()
+            finally:
+                if limiter is not None:
+                    limiter.release()
+        finally:
+            if quota_token is not None:
+                self.quota.release(quota_token)
+            self.scheduler.release()
+    
+    def _complete(self, data: Dict[str, Any], on_attempt: Optional[Callable[[], None]] = None,
+                  attempt: Optional[_HedgeAttempt] = None) -> Dict[str, Any]:
+        """
+        Akışsız isteği moda göre API'ye gönder veya kasetten oynat
+        
+        Args:
+            data: Chat completions istek gövdesi
+            on_attempt: Her HTTP denemesinin başında çağrılacak fonksiyon
+            attempt: Kopyalanan istekse iptal durumu (iptal hata sayılmaz)
+            
+        Returns:
+            JSON yanıt
+        """
+        start = time.perf_counter()
+        try:
+            if self.mode == 'replay':
+                result = self.cassettes.replay(data)
+            else:
+                result = self._post_with_retry(data, attempt=attempt, on_attempt=on_attempt)
+        except Exception:
+            if attempt is None or not attempt.cancelled:
+                self._record_backend_failure(data)
+            raise
+        elapsed = time.perf_counter() - start
+        
+        if self.mode == 'record':
+            self.cassettes.record(data, result, elapsed)
+        
+        self._record_backend_metrics(data, elapsed, result)
+        return result
+    
+    def _complete_hedged(self, data: Dict[str, Any], priority: str = PRIORITY_BATCH) -> Dict[str, Any]:
+        """
+        İsteği gönder; gözlenen gecikmenin config.llm.hedge_percentile
+        yüzdeliğinde yanıt gelmezse aynı veya alternatif modele kopyasını gönder
+        
+        Asıl istek her zamanki gibi akışsız gönderilir; yalnızca gönderilen
+        kopya akış (SSE) olarak alınır. Boş olmayan ilk yanıt kazanır, diğer
+        isteğin soketi hemen kapatılır ve iptal anına kadar geçen süre gecikme
+        yüzdeliklerine eklenir. Her istek zamanlayıcı ve eşzamanlılık
+        sınırlayıcıdaki yerini kendi iş parçacığında, bağlantısı kapandıktan
+        sonra bırakır. Kopya için boş yer yoksa veya kopya sayısı toplam
+        isteklerin config.llm.hedge_budget oranını aşacaksa gönderilmez.
+        
+        Args:
+            data: Chat completions istek gövdesi
+            priority: İsteğin öncelik sınıfı
+            
+        Returns:
+            Kazanan isteğin JSON yanıtı
+        
+        Raises:
+            CircuitOpenError: Devre açık, istek gönderilmedi
+        """
+        self.hedge_stats.record('requests')
+        
+        metrics = self.backend.metrics
+        route = self.router.for_model(data['model']) if self.router is not None else None
+        if route is not None:
+            metrics = route.metrics
+        delay = metrics.latency_percentile(config.llm.hedge_percentile, min_samples=config.llm.hedge_min_samples)
+        if delay is None:
+            with self._backend_call(priority) as mark_attempt:
+                return self._complete(data, on_attempt=mark_attempt)
+        
+        attempts = {}
+        
+        def start(attempt: _HedgeAttempt) -> None:
+            try:
+                future = self._hedge_executor.submit(self._hedge_attempt, attempt)
+            except BaseException:
+                attempt.slot.close()
+                raise
+            attempts[future] = attempt
+        
+        # Asıl isteğin yeri burada alınır; kopya için beklenen süre kuyrukta
+        # geçen zamanı içermez
+        with ExitStack() as stack:
+            mark_attempt = stack.enter_context(self._backend_call(priority))
+            slot = stack.pop_all()
+        start(_HedgeAttempt(data, 'primary', slot, on_attempt=mark_attempt))
+        done, _ = wait(list(attempts), timeout=delay)
+        
+        if not done:
+            snapshot = self.hedge_stats.snapshot()
+            slot = None
+            if snapshot.get('hedged', 0) + 1 > config.llm.hedge_budget * snapshot['requests']:
+                self.hedge_stats.record('budget_denied')
+            else:
+                slot = self._acquire_hedge_slot(priority)
+                if slot is None:
+                    self.hedge_stats.record('capacity_denied')
+            
+            if slot is not None:
+                hedge_data = dict(data, model=config.llm.hedge_model or data['model'])
+                self.hedge_stats.record('hedged')
+                self.logger.info(f"LLM isteği {delay:.2f} sn'de yanıtlanmadı (p{config.llm.hedge_percentile * 100:g}), "
+                                 f"kopya gönderiliyor: {hedge_data['model']}")
+                start(_HedgeAttempt(hedge_data, 'hedge', slot))
+        
+        pending = set(attempts)
+        fallback = None
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error = e
+                    continue
+                
+                if not (result['choices'][0]['message'].get('content') or '').strip():
+                    fallback = fallback or result
+                    continue
+                
+                for other in pending:
+                    loser = attempts[other]
+                    self._record_censored_latency(loser.data, loser.cancel())
+                    self.hedge_stats.record('cancelled')
+                if attempts[future].label == 'hedge':
+                    self.hedge_stats.record('hedge_wins')
+                return result
+        
+        if fallback is None or error is not None:
+            raise error
+        return fallback
+    
+    def _hedge_attempt(self, attempt: _HedgeAttempt) -> Dict[str, Any]:
+        """
+        Yarışan isteklerden birini al ve yerini bağlantısı kapandıktan sonra bırak
+        
+        Asıl istek akışsız, kopya istek akış olarak alınır. İptal edilen
+        istek hata sayılmaz; devre kesiciye ve sınırlayıcıya bildirilmez.
+        
+        Args:
+            attempt: İstek ve iptal durumu
+            
+        Returns:
+            JSON yanıt (choices/message biçiminde)
+        
+        Raises:
+            _HedgeCancelled: İstek, diğeri kazandığı için iptal edildi
+        """
+        with attempt.slot:
+            try:
+                if attempt.label == 'primary':
+                    return self._complete(attempt.data, on_attempt=attempt.on_attempt, attempt=attempt)
+                
+                parts = []
+                stream = self._stream_completion(attempt.data, attempt=attempt)
+                try:
+                    for chunk in stream:
+                        if attempt.cancelled:
+                            raise _HedgeCancelled()
+                        parts.append(chunk)
+                finally:
+                    # Yarıda bırakılan akışın bağlantısı burada kapanır
+                    stream.close()
+                return {'choices': [{'message': {'role': 'assistant', 'content': ''.join(parts)}}]}
+            except _HedgeCancelled:
+                raise
+            except Exception:
+                if attempt.cancelled:
+                    raise _HedgeCancelled()
+                raise
+    
+    def _acquire_hedge_slot(self, priority: str) -> Optional[ExitStack]:
+        """
+        Kopya istek için zamanlayıcı ve sınırlayıcıda beklemeden yer al
+        
+        Args:
+            priority: Asıl isteğin öncelik sınıfı
+            
+        Returns:
+            Çıkıldığında yeri bırakan bağlam veya boş yer yoksa None
+        """
+        if not self.scheduler.try_acquire(priority):
+            return None
+        
+        slot = ExitStack()
+        slot.callback(self.scheduler.release)
+        
+        if self.quota is not None:
+            quota_token = self.quota.try_acquire(priority)
+            if quota_token is None:
+                slot.close()
+                return None
+            slot.callback(self.quota.release, quota_token)
+        
+        limiter = self.limiter
+        if limiter is not None:
+            if not limiter.try_acquire():
+                slot.close()
+                return None
+            slot.callback(limiter.release)
+        return slot
+    
+    def _record_censored_latency(self, data: Dict[str, Any], elapsed: float) -> None:
+        """İptal edilen isteğin süresini backend ve (yönlendirme açıksa) rota gecikmelerine ekle"""
+        self.backend.metrics.record_censored(elapsed)
+        route = self.router.for_model(data['model']) if self.router is not None else None
+        if route is not None:
+            route.metrics.record_censored(elapsed)
+    
+    def _record_backend_failure(self, data: Dict[str, Any]) -> None:
+        """Başarısız isteği backend ve (yönlendirme açıksa) rota ölçümlerine ekle"""
+        self.backend.metrics.record_failure()
+        route = self.router.for_model(data['model']) if self.router is not None else None
+        if route is not None:
+            route.metrics.record_failure()
+    
+    def _record_backend_metrics(self, data: Dict[str, Any], elapsed: float, result: Dict[str, Any]) -> None:
+        """
+        Başarılı isteğin gecikme ve token sayılarını backend ve (yönlendirme
+        açıksa) rota ölçümlerine ekle
+        
+        Args:
+            data: Chat completions istek gövdesi
+            elapsed: İstek süresi (saniye)
+            result: JSON yanıt (usage yoksa üretilen token sayısı tahmin edilir)
+        """
+        usage = result.get('usage') or {}
+        completion_tokens = usage.get('completion_tokens')
+        if completion_tokens is None:
+            choices = result.get('choices') or [{}]
+            completion_tokens = self._estimate_tokens((choices[0].get('message') or {}).get('content') or '')
+        
+        self.backend.metrics.record(elapsed, usage.get('prompt_tokens') or 0, completion_tokens)
+        route = self.router.for_model(data['model']) if self.router is not None else None
+        if route is not None:
+            route.metrics.record(elapsed, usage.get('prompt_tokens') or 0, completion_tokens)
+    
+    def _stream_completion(self, data: Dict[str, Any], attempt: Optional[_HedgeAttempt] = None,
+                           on_attempt: Optional[Callable[[], None]] = None) -> Iterator[str]:
+        """
+        Yanıtı Server-Sent Events akışı olarak al ve parçaları geldikçe üret
+        
+        Yeniden deneme yalnızca akış başlamadan önce yapılır; akış ortasında
+        kopan bağlantı hata olarak yükseltilir.
+        
+        Args:
+            data: Chat completions istek gövdesi (stream alanı eklenir)
+            attempt: Kopyalanan istekse iptal durumu (iptal hata sayılmaz)
+            on_attempt: Her HTTP denemesinin başında çağrılacak fonksiyon
+            
+        Yields:
+            Yanıt metni parçaları
+        """
+        if self.mode == 'replay':
+            content = self._complete(data, on_attempt=on_attempt, attempt=attempt)['choices'][0]['message']['content']
+            if content:
+                yield content
+            return
+        
+        start = time.perf_counter()
+        first_chunk_at = None
+        usage = {}
+        parts = []
+        
+        try:
+            response = self._post_with_retry(dict(data, stream=True), stream=True, attempt=attempt,
+                                             on_attempt=on_attempt)
+            response.encoding = 'utf-8'
+            
+            with response:
+                for line in response.iter_lines(decode_unicode=True):
+                    # Boş satırlar olay ayıracı, ':' ile başlayanlar yorum (keep-alive)
+                    if not line or line.startswith(':') or not line.startswith('data:'):
+                        continue
+                    
+                    payload = line[len('data:'):].strip()
+                    if payload == '[DONE]':
+                        break
+                    
+                    event = json.loads(payload)
+                    if 'error' in event:
+                        raise requests.exceptions.HTTPError(
+                            f"API akış hatası: {event['error'].get('message', event['error'])}", response=response
+                        )
+                    
+                    usage = event.get('usage') or usage
+                    for choice in event.get('choices') or []:
+                        chunk = (choice.get('delta') or {}).get('content')
+                        if chunk:
+                            if first_chunk_at is None:
+                                first_chunk_at = time.perf_counter() - start
+                            parts.append(chunk)
+                            yield chunk
+        except Exception:
+            if attempt is None or not attempt.cancelled:
+                self._record_backend_failure(data)
+            raise
+        
+        elapsed = time.perf_counter() - start
+        result = {'choices': [{'message': {'role': 'assistant', 'content': ''.join(parts)}}]}
+        if usage:
+            result['usage'] = usage
+        
+        if self.mode == 'record':
+            self.cassettes.record(data, result, elapsed)
+        
+        self._record_backend_metrics(data, elapsed, result)
+        
+        cached_tokens = (usage.get('prompt_tokens_details') or {}).get('cached_tokens')
+        first = f"{first_chunk_at:.2f}" if first_chunk_at is not None else "-"
+        self.logger.info(f"LLM akışı {elapsed:.2f} sn'de tamamlandı (ilk parça {first} sn, "
+                         f"prompt {usage.get('prompt_tokens', '?')} token, sağlayıcı önbelleğinden "
+                         f"{cached_tokens if cached_tokens is not None else '?'} token)")
+    
+    def _post_with_retry(self, data: Dict[str, Any], stream: bool = False,
+                         attempt: Optional[_HedgeAttempt] = None,
+                         on_attempt: Optional[Callable[[], None]] = None) -> Union[Dict[str, Any], requests.Response]:
+        """
+        İsteği gönder; geçici hatalarda üstel geri çekilmeyle yeniden dene
+        
+        Retry-After başlığı varsa bekleme süresi olarak kullanılır. Toplam süre
+        retry_policy.deadline ile sınırlıdır; okuma zaman aşımı da kalan
+        süreye göre kısaltılır. Kalıcı hatalar (400, 401, 403 ...) hemen
+        yükseltilir.
+        
+        Args:
+            data: Chat completions istek gövdesi
+            stream: True ise gövde okunmadan HTTP yanıtı döndürülür
+            attempt: Kopyalanan istekse iptal durumu; yanıt gövdesi okunmadan
+                önce iptal için saklanır, iptal edilen istek yeniden denenmez
+            on_attempt: Her denemenin başında çağrılacak fonksiyon
+            
+        Returns:
+            JSON yanıt veya (stream=True ise) açık HTTP yanıtı
+        """
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.deadline
+        retry_number = 0
+        
+        while True:
+            if attempt is not None and attempt.cancelled:
+                raise _HedgeCancelled()
+            
+            remaining = deadline - time.monotonic()
+            self.retry_stats.record('attempts')
+            if on_attempt is not None:
+                on_attempt()
+            
+            try:
+                response = self.session.post(
+                    self.api_url,
+                    json=data,
+                    timeout=(self.timeout[0], max(1.0, min(self.timeout[1], remaining))),
+                    # Yarışan isteğin gövdesi okunurken soketi kapatılabilsin
+                    stream=stream or attempt is not None
+                )
+                if attempt is not None:
+                    attempt.attach(response)
+                if not response.ok and (stream or attempt is not None):
+                    # Okunmayan hata gövdesi bağlantıyı açık bırakmasın
+                    response.close()
+                response.raise_for_status()
+                
+                if stream:
+                    if retry_number:
+                        self.retry_stats.record('recovered')
+                    return response
+                
+                result = response.json()
+                
+                # OpenRouter bazı hataları 200 yanıtının gövdesinde döndürür
+                if 'error' in result and not result.get('choices'):
+                    code = result['error'].get('code')
+                    if isinstance(code, int):
+                        response.status_code = code
+                    raise requests.exceptions.HTTPError(
+                        f"API hatası: {result['error'].get('message', result['error'])}", response=response
+                    )
+                
+                if retry_number:
+                    self.retry_stats.record('recovered')
+                return result
+                
+            except requests.exceptions.RequestException as e:
+                if attempt is not None and attempt.cancelled:
+                    raise
+                
+                reason = classify_error(e)
+                if reason is None:
+                    self.retry_stats.record('permanent_failures')
+                    raise
+                
+                self.retry_stats.record(f"errors.{reason}")
+                
+                if self.limiter is not None and reason in ('http_429', 'timeout'):
+                    self.limiter.on_overload(reason)
+                
+                if retry_number >= policy.max_retries:
+                    self.retry_stats.record('gave_up')
+                    raise
+                
+                # Devre başka bir istekte açıldıysa (veya bu bir deneme isteğiyse) bekleme
+                if self.breaker.enabled and self.breaker.state != CLOSED:
+                    self.retry_stats.record('circuit_open')
+                    raise
+                
+                retry_after = parse_retry_after(getattr(e, 'response', None))
+                if retry_after is not None:
+                    self.retry_stats.record('retry_after')
+                    delay = retry_after
+                else:
+                    delay = policy.backoff(retry_number)
+                
+                if time.monotonic() + delay >= deadline:
+                    self.retry_stats.record('deadline_exceeded')
+                    self.logger.warning(f"LLM isteği için süre sınırı doldu ({policy.deadline:.0f} sn)")
+                    raise
+                
+                retry_number += 1
+                self.retry_stats.record('retries')
+                self.logger.warning(f"LLM isteği başarısız ({reason}), {delay:.1f} sn sonra "
+                                    f"yeniden denenecek ({retry_number}/{policy.max_retries})")
+                # İptal edilen yarışan istek beklemeyi keser ve yerini hemen bırakır
+                if attempt is not None:
+                    if attempt.wait_cancelled(delay):
+                        raise _HedgeCancelled()
+                else:
+                    time.sleep(delay)
+    
     def _parse_llm_response(self, function_dict: Dict[str, Any], response: str) -> FunctionAnalysis:
         """
         LLM response'unu FunctionAnalysis objesine çevir
@@ -373,6 +1651,34 @@ SON UYARI:
             self.logger.error(f"LLM response parse hatası: {e}")
             return self._create_default_analysis(function_dict)
     
+    def _create_fallback_analysis(self, function_dict: Dict[str, Any]) -> FunctionAnalysis:
+        """
+        LLM'e ulaşılamadığında kullanılacak, yeniden üretim için işaretli analiz
+        
+        Açıklaması yerel kurallarla çözülebilen parametreler için yerel aralık
+        çıkarımı, diğerleri için varsayılan değerler kullanılır.
+        
+        Args:
+            function_dict: Fonksiyon bilgileri
+            
+        Returns:
+            needs_regeneration=True olan FunctionAnalysis objesi
+        """
+        from .range_extractor import RangeExtractor, parse_signature
+        
+        analysis = self._create_default_analysis(function_dict)
+        analysis.needs_regeneration = True
+        
+        extractor = self.range_extractor or RangeExtractor()
+        _, signature_types = parse_signature(function_dict.get('signature', ''))
+        for index, param in enumerate(function_dict.get('params', [])):
+            param_type = param.get('type') or signature_types.get(param['name'])
+            local = extractor.extract(param['name'], param.get('description') or '', param_type)
+            if local is not None:
+                analysis.parameters[index] = local
+        
+        return analysis
+    
     def _create_default_analysis(self, function_dict: Dict[str, Any]) -> FunctionAnalysis:
         """
         Varsayılan analiz oluştur
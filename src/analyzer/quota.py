@@ -0,0 +1,165 @@
+"""
+Süreçler arası paylaşılan LLM istek kotası
+
+RequestScheduler yalnızca kendi süreci içindeki istekleri sıralar; web
+arayüzü ile ayrı bir süreçte çalışan toplu iş (ör. gece çalışan
+`main.py --examples`) aynı API kotasını kullanırken birbirlerini görmez. Bu
+modül eşzamanlı istek yerlerini bir klasördeki kilit dosyalarıyla süreçler
+arasında paylaştırır: her yer bir dosyadır ve flock ile kilitlenir, süreç
+çökse bile kilidi işletim sistemi bırakır. Son `reserved_interactive` yer
+yalnızca interactive istekler tarafından alınabilir; böylece toplu işler
+kotanın geri kalanını doldursa bile web arayüzünün istekleri beklemez.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .scheduler import PRIORITY_INTERACTIVE, PRIORITIES
+from ..utils.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = get_logger(__name__)
+
+
+class SharedQuota:
+    """Kilit dosyalarıyla süreçler arası paylaşılan eşzamanlı istek yerleri"""
+
+    def __init__(self, directory: Path, slots: int, reserved_interactive: int = 1,
+                 poll_interval: float = 0.05):
+        """
+        Args:
+            directory: Kilit dosyalarının klasörü (kotayı paylaşan tüm süreçlerde aynı)
+            slots: Tüm süreçlerde aynı anda backend'e gidebilecek istek sayısı
+            reserved_interactive: interactive dışındaki sınıfların kullanamayacağı
+                yer sayısı (en az bir yer paylaşımlı kalır)
+            poll_interval: Boş yer beklenirken denemeler arası süre (saniye)
+
+        Raises:
+            RuntimeError: Platformda dosya kilidi (fcntl) yok
+        """
+        if fcntl is None:
+            raise RuntimeError("Süreçler arası kota için fcntl gerekli (bu platformda yok)")
+
+        self.logger = get_logger(__name__)
+        self.directory = Path(directory)
+        self.slots = max(1, slots)
+        self.reserved_interactive = min(max(0, reserved_interactive), self.slots - 1)
+        self.poll_interval = poll_interval
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.held = 0
+        self._requests = {priority: 0 for priority in PRIORITIES}
+        self._total_wait = {priority: 0.0 for priority in PRIORITIES}
+        self._max_wait = {priority: 0.0 for priority in PRIORITIES}
+
+    @staticmethod
+    def available() -> bool:
+        """Platform süreçler arası kotayı destekliyor mu"""
+        return fcntl is not None
+
+    def acquire(self, priority: str) -> int:
+        """
+        Boş yer açılana kadar bekle ve yeri al
+
+        Args:
+            priority: PRIORITIES sınıflarından biri
+
+        Returns:
+            release ile bırakılacak yer anahtarı
+        """
+        started = time.monotonic()
+        token = self.try_acquire(priority)
+        while token is None:
+            time.sleep(self.poll_interval)
+            token = self.try_acquire(priority)
+
+        wait = time.monotonic() - started
+        with self._lock:
+            self._requests[priority] += 1
+            self._total_wait[priority] += wait
+            self._max_wait[priority] = max(self._max_wait[priority], wait)
+
+        if wait >= 1.0:
+            self.logger.debug(f"{priority} isteği süreçler arası kotada {wait:.2f} sn bekledi")
+        return token
+
+    def try_acquire(self, priority: str) -> Optional[int]:
+        """
+        Beklemeden boş yer al
+
+        interactive istekler ayrılmış yerleri önce dener, böylece paylaşımlı
+        yerler diğer sınıflara kalır.
+
+        Args:
+            priority: PRIORITIES sınıflarından biri
+
+        Returns:
+            Yer anahtarı veya boş yer yoksa None
+        """
+        if priority not in PRIORITIES:
+            raise ValueError(f"Geçersiz öncelik sınıfı: {priority} (geçerli: {', '.join(PRIORITIES)})")
+
+        if priority == PRIORITY_INTERACTIVE:
+            candidates = reversed(range(self.slots))
+        else:
+            candidates = range(self.slots - self.reserved_interactive)
+
+        for index in candidates:
+            fd = os.open(self.directory / f"slot-{index}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                continue
+
+            with self._lock:
+                self.held += 1
+            return fd
+
+        return None
+
+    def release(self, token: int) -> None:
+        """
+        Yeri bırak
+
+        Args:
+            token: acquire/try_acquire'ın döndürdüğü anahtar
+        """
+        try:
+            fcntl.flock(token, fcntl.LOCK_UN)
+        finally:
+            os.close(token)
+            with self._lock:
+                self.held -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Kotanın anlık özeti
+
+        Returns:
+            slots, reserved_interactive, bu süreçte tutulan yer sayısı ve
+            sınıf başına istek sayısı ile ortalama/en yüksek bekleme süresi
+        """
+        with self._lock:
+            classes = {}
+            for priority in PRIORITIES:
+                requests = self._requests[priority]
+                classes[priority] = {
+                    'requests': requests,
+                    'mean_wait': self._total_wait[priority] / requests if requests else 0.0,
+                    'max_wait': self._max_wait[priority]
+                }
+
+            return {
+                'slots': self.slots,
+                'reserved_interactive': self.reserved_interactive,
+                'held': self.held,
+                'classes': classes
+            }
@@ -0,0 +1,571 @@
+"""
+Doxygen parametre açıklamalarından kural tabanlı aralık çıkarımı yapan modül
+
+"0 to 100", "must be > 30", "one of RED, GREEN", "must not be NULL",
+"max length 32" gibi yaygın ifadeler (İngilizce ve Türkçe) yerel olarak
+ParameterAnalysis'e çevrilir. Tüm parametreleri bu şekilde kapsanan
+fonksiyonlar için LLM çağrısına gerek kalmaz.
+"""
+
+import re
+from typing import Dict, List, Any, Optional, Tuple
+
+from .llm_analyzer import ParameterAnalysis, FunctionAnalysis
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Tip -> (min, max) sınırları (LP64 varsayımı)
+_INTEGER_LIMITS = {
+    'char': (-128, 127),
+    'signed char': (-128, 127),
+    'unsigned char': (0, 255),
+    'short': (-32768, 32767),
+    'unsigned short': (0, 65535),
+    'int': (-2147483648, 2147483647),
+    'signed': (-2147483648, 2147483647),
+    'unsigned': (0, 4294967295),
+    'unsigned int': (0, 4294967295),
+    'long': (-9223372036854775808, 9223372036854775807),
+    'unsigned long': (0, 18446744073709551615),
+    'long long': (-9223372036854775808, 9223372036854775807),
+    'unsigned long long': (0, 18446744073709551615),
+    'int8_t': (-128, 127),
+    'uint8_t': (0, 255),
+    'int16_t': (-32768, 32767),
+    'uint16_t': (0, 65535),
+    'int32_t': (-2147483648, 2147483647),
+    'uint32_t': (0, 4294967295),
+    'int64_t': (-9223372036854775808, 9223372036854775807),
+    'uint64_t': (0, 18446744073709551615),
+    'size_t': (0, 18446744073709551615),
+}
+
+_FLOAT_LIMITS = {
+    'float': (-3.402823e+38, 3.402823e+38),
+    'double': (-1.797693e+308, 1.797693e+308),
+}
+
+# Ondalıklı tiplerde sınır komşuları için kullanılan adım
+_FLOAT_STEP = 0.01
+
+_NUMBER = r'[-+]?(?:0[xX][0-9a-fA-F]+|\d+(?:\.\d+)?)'
+_SUFFIX = r"(?:'?\s*(?:d|t)[ae]n)"  # 0'dan, 10'den, 5'ten ...
+
+_RANGE_PATTERNS = [
+    re.compile(rf'between\s+({_NUMBER})\s+and\s+({_NUMBER})', re.IGNORECASE),
+    re.compile(rf'({_NUMBER})\s*(?:\.\.\.?|to|through|–|ile)\s*({_NUMBER})', re.IGNORECASE),
+    re.compile(rf'(?<![\w.-])(?<![A-Z][A-Z]\s)(\d+)\s*-\s*({_NUMBER})(?![\w.-])'),
+]
+_BRACKET_RANGE = re.compile(rf'([\[(])\s*({_NUMBER})\s*,\s*({_NUMBER})\s*([\])])')
+
+# (desen, operatör) - operatör: '>', '>=', '<', '<='
+_INEQUALITY_PATTERNS = [
+    (re.compile(rf'(>=|≥|<=|≤|>|<)\s*({_NUMBER})'), None),
+    (re.compile(rf'greater\s+than\s+or\s+equal\s+to\s+({_NUMBER})', re.IGNORECASE), '>='),
+    (re.compile(rf'less\s+than\s+or\s+equal\s+to\s+({_NUMBER})', re.IGNORECASE), '<='),
+    (re.compile(rf'(?:greater|larger|more|bigger)\s+than\s+({_NUMBER})', re.IGNORECASE), '>'),
+    (re.compile(rf'(?:less|smaller|fewer)\s+than\s+({_NUMBER})', re.IGNORECASE), '<'),
+    (re.compile(rf'(?:at\s+least|minimum(?:\s+of|\s+is)?|min\.?)\s*:?\s*({_NUMBER})(?!\s*(?:char|byte|karakter))',
+                re.IGNORECASE), '>='),
+    (re.compile(rf'(?:at\s+most|maximum(?:\s+of|\s+is)?|max\.?)\s*:?\s*({_NUMBER})(?!\s*(?:char|byte|karakter))',
+                re.IGNORECASE), '<='),
+    (re.compile(rf'(?:above|exceeds?)\s+({_NUMBER})', re.IGNORECASE), '>'),
+    (re.compile(rf'below\s+({_NUMBER})', re.IGNORECASE), '<'),
+    (re.compile(rf'({_NUMBER}){_SUFFIX}\s+büyük\s+(?:veya|ya\s+da)?\s*eşit', re.IGNORECASE), '>='),
+    (re.compile(rf'({_NUMBER}){_SUFFIX}\s+küçük\s+(?:veya|ya\s+da)?\s*eşit', re.IGNORECASE), '<='),
+    (re.compile(rf'({_NUMBER}){_SUFFIX}\s+büyük(?!\s+(?:veya|ya\s+da)?\s*eşit)', re.IGNORECASE), '>'),
+    (re.compile(rf'({_NUMBER}){_SUFFIX}\s+küçük(?!\s+(?:veya|ya\s+da)?\s*eşit)', re.IGNORECASE), '<'),
+    (re.compile(rf'en\s+az\s+({_NUMBER})(?!\s*karakter)', re.IGNORECASE), '>='),
+    (re.compile(rf'en\s+fazla\s+({_NUMBER})(?!\s*karakter)', re.IGNORECASE), '<='),
+]
+
+# (desen, operatör, değer) - sayı içermeyen kelime kalıpları
+_WORD_BOUNDS = [
+    (re.compile(r'\bnon[- ]?negative\b|\bnegatif\s+olmayan|sıfır\s+veya\s+pozitif', re.IGNORECASE), '>=', 0),
+    (re.compile(r'(?<!non-)(?<!non)\bpositive\b|\bpozitif\b|sıfırdan\s+büyük', re.IGNORECASE), '>', 0),
+    (re.compile(r'(?<!non-)(?<!non)\bnegative\b|\bnegatif\b(?!\s+olmayan)|sıfırdan\s+küçük', re.IGNORECASE), '<', 0),
+]
+
+# Eşleşmenin bağlamı bu ayraçlarla bölünen yan cümledir
+_CLAUSE_BREAK = re.compile(r'[,;.!?](?=\s|$)|[()]|\b(?:but|and|however|whereas|ama|fakat|ancak|ve)\b', re.IGNORECASE)
+# İngilizce olumsuzluk sınırdan önce, Türkçe olumsuzluk sınırdan sonra gelir
+_NEGATION_BEFORE = re.compile(r"\b(?:not|cannot|can't|never|no|nor)\b|n't\b", re.IGNORECASE)
+_NEGATION_AFTER = re.compile(r'^\s*(?:olmamal[ıi]|olamaz|olmayacak|değil)', re.IGNORECASE)
+# Sınırın geçerli aralığı mı yoksa hata/koşul durumunu mu anlattığı belirsiz yan cümleler
+_AMBIGUOUS_CLAUSE = re.compile(
+    r'\b(?:means?|errors?|invalid|fails?|failure|reject(?:s|ed)?|allowed|permitted|if|when|unless|otherwise'
+    r'|hata|geçersiz|ise|durumunda|halinde)\b',
+    re.IGNORECASE
+)
+# Başka bir belgeye/sürüme atıf yapan yan cümlelerdeki sayılar sınır değildir
+_REFERENCE_CLAUSE = re.compile(r'\b(?:see|refer|rfc|iso|ieee|section|chapter|version|bkz|bakınız|sürüm)\b',
+                               re.IGNORECASE)
+# Karşılaştırma operatöründen önce gelebilecek, parametre dışında bir şeyi göstermeyen kelimeler
+_SUBJECT_WORDS = {'be', 'is', 'are', 'must', 'should', 'shall', 'always', 'strictly', 'value', 'values', 'it',
+                  'and', 'or', 'but', 'yet', 'also', 'değer', 'değeri', 'olmalı', 'olmalıdır', 've', 'veya', 'ama'}
+_INVERTED = {'>': '<=', '>=': '<', '<': '>=', '<=': '>'}
+
+_NON_ZERO = re.compile(r'\bnon[- ]?zero\b|!=\s*0\b|\bnot\s+(?:be\s+)?zero\b|sıfır\s+olmamalı|sıfır\s+olamaz|sıfırdan\s+farklı',
+                       re.IGNORECASE)
+_NON_NULL = re.compile(r'non[- ]?null|not\s+(?:be\s+)?null|cannot\s+be\s+null|!=\s*null|null\s+olmamalı|null\s+olamaz'
+                       r'|null\s+değil', re.IGNORECASE)
+_NULLABLE = re.compile(r'(?:can|may)\s+be\s+null|null\s+olabilir', re.IGNORECASE)
+_MAX_LENGTH = re.compile(
+    rf'(?:max(?:imum)?\.?\s*(?:string\s+)?(?:length|len|uzunluk)(?:\s+of|\s+is)?\s*:?\s*({_NUMBER})'
+    rf'|(?:at\s+most|up\s+to|no\s+more\s+than|en\s+fazla)\s+({_NUMBER})\s*(?:characters|chars|bytes|karakter)'
+    rf'|({_NUMBER})\s*karakterden\s+uzun\s+olmamalı)',
+    re.IGNORECASE
+)
+_ENUM_PATTERNS = [
+    re.compile(r'one\s+of\s*:?\s*[{(\[]?\s*([^.;{}()\[\]]+)', re.IGNORECASE),
+    re.compile(r'(?:valid\s+)?values?\s*:\s*[{(\[]?\s*([^.;{}()\[\]]+)', re.IGNORECASE),
+    re.compile(r'şunlardan\s+biri(?:dir)?\s*:?\s*([^.;{}()\[\]]+)', re.IGNORECASE),
+    re.compile(r'(?:değerler(?:i)?|alabileceği\s+değerler)\s*:\s*([^.;{}()\[\]]+)', re.IGNORECASE),
+    re.compile(r'\beither\s+(\w+\s+or\s+\w+)', re.IGNORECASE),
+]
+_ENUM_SEPARATOR = re.compile(r'\s*(?:,|\||/|\bor\b|\bveya\b|\bya\s+da\b)\s*', re.IGNORECASE)
+_ENUM_ITEM = re.compile(rf'^(?:[A-Za-z_]\w*|{_NUMBER})$')
+# Sayısal olmayan değerler yalnızca C sabiti biçimindeyse (RED, MODE_FAST) değer kümesi sayılır
+_ENUM_CONSTANT = re.compile(r'^[A-Z_][A-Z0-9_]*$')
+
+_SIGNATURE_PARAMS = re.compile(r'\((.*)\)', re.DOTALL)
+
+
+def parse_signature(signature: str) -> Tuple[Optional[str], Dict[str, str]]:
+    """
+    İmzadan dönüş tipini ve parametre adı -> tip eşlemesini çıkar
+
+    Args:
+        signature: C fonksiyon imzası
+
+    Returns:
+        (dönüş tipi, {parametre adı: tip}) tuple'ı
+    """
+    match = _SIGNATURE_PARAMS.search(signature or '')
+    if not match:
+        return None, {}
+
+    head = signature[:match.start()].split()
+    return_type = _normalize_type(' '.join(head[:-1]) + ('*' * head[-1].count('*'))) if len(head) > 1 else None
+
+    types = {}
+    for declaration in match.group(1).split(','):
+        declaration = declaration.strip()
+        if not declaration or declaration == 'void' or declaration == '...':
+            continue
+
+        is_array = '[' in declaration
+        declaration = declaration.split('[', 1)[0]
+        name_match = re.search(r'(\w+)\s*$', declaration)
+        if not name_match:
+            continue
+
+        param_type = declaration[:name_match.start()]
+        if is_array:
+            param_type += '*'
+        types[name_match.group(1)] = _normalize_type(param_type)
+
+    return return_type, types
+
+
+def _normalize_type(c_type: str) -> str:
+    """'const char *' -> 'char*' biçiminde tip adı"""
+    pointer = '*' * c_type.count('*')
+    words = [word for word in c_type.replace('*', ' ').split() if word not in ('const', 'volatile', 'static', 'extern')]
+    return ' '.join(words) + pointer
+
+
+class _AmbiguousBounds(Exception):
+    """Açıklamadaki sınırlar güvenle yorumlanamıyor; analiz LLM'e bırakılmalı"""
+
+
+def _clause(text: str, start: int, end: int) -> Tuple[str, str]:
+    """
+    Eşleşmenin bulunduğu yan cümlede eşleşmeden önceki ve sonraki metin
+
+    Args:
+        text: Açıklama
+        start: Eşleşmenin başlangıcı
+        end: Eşleşmenin sonu
+
+    Returns:
+        (önceki metin, sonraki metin) tuple'ı
+    """
+    clause_start = 0
+    for match in _CLAUSE_BREAK.finditer(text, 0, start):
+        clause_start = match.end()
+
+    following = _CLAUSE_BREAK.search(text, end)
+    clause_end = following.start() if following else len(text)
+    return text[clause_start:start], text[end:clause_end]
+
+
+def _to_number(text: str):
+    """Metni int veya float'a çevir"""
+    text = text.replace('+', '')
+    if text.lower().lstrip('-').startswith('0x'):
+        return int(text, 16)
+    return float(text) if '.' in text else int(text)
+
+
+class RangeExtractor:
+    """
+    Parametre açıklamalarından EP/BVA girdilerini kural tabanlı çıkaran sınıf
+    """
+
+    def __init__(self):
+        self.logger = get_logger(__name__)
+
+    def analyze_function(self, function_dict: Dict[str, Any]) -> Optional[FunctionAnalysis]:
+        """
+        Fonksiyonu yerel kurallarla analiz et
+
+        Args:
+            function_dict: Fonksiyon bilgileri
+
+        Returns:
+            Tüm parametreler kapsandıysa FunctionAnalysis, aksi halde None
+        """
+        params = function_dict.get('params') or []
+        return_type, signature_types = parse_signature(function_dict.get('signature', ''))
+
+        documented = {param['name'] for param in params}
+        if not params or any(name not in documented for name in signature_types):
+            return None
+
+        parameters = []
+        for param in params:
+            param_type = param.get('type') or signature_types.get(param['name'])
+            analysis = self.extract(param['name'], param.get('description') or '', param_type)
+            if analysis is None:
+                self.logger.debug(f"Yerel aralık çıkarımı kapsamadı: {function_dict['name']}.{param['name']}")
+                return None
+            parameters.append(analysis)
+
+        error_conditions = []
+        if any(param.type.endswith('*') and None in param.invalid_values for param in parameters):
+            error_conditions.append('null_pointer')
+        if any(param.invalid_values for param in parameters):
+            error_conditions.append('invalid_input')
+
+        return FunctionAnalysis(
+            name=function_dict['name'],
+            description=function_dict.get('brief', ''),
+            parameters=parameters,
+            return_type=return_type or 'int',
+            return_constraints=[],
+            preconditions=list(function_dict.get('preconditions') or []),
+            postconditions=list(function_dict.get('postconditions') or []),
+            error_conditions=error_conditions
+        )
+
+    def extract(self, name: str, description: str, param_type: Optional[str]) -> Optional[ParameterAnalysis]:
+        """
+        Tek parametrenin açıklamasından analiz çıkar
+
+        Args:
+            name: Parametre adı
+            description: @param açıklaması
+            param_type: C tipi (bilinmiyorsa None)
+
+        Returns:
+            ParameterAnalysis veya açıklama tanınmadıysa None
+        """
+        param_type = _normalize_type(param_type) if param_type else 'int'
+
+        if param_type.endswith('*'):
+            return self._extract_pointer(name, description, param_type)
+
+        values = self._find_enum_values(description)
+        if values:
+            return self._build_enum(name, description, param_type, values)
+
+        try:
+            bounds = self._find_bounds(description, name)
+        except _AmbiguousBounds as e:
+            self.logger.debug(f"Belirsiz aralık ifadesi, LLM'e bırakılıyor: {name} ({e})")
+            return None
+        non_zero = bool(_NON_ZERO.search(description))
+        if bounds is None and not non_zero:
+            return None
+
+        return self._build_numeric(name, description, param_type, bounds or (None, None), non_zero)
+
+    def _find_bounds(self, description: str,
+                     name: Optional[str] = None) -> Optional[Tuple[Optional[Tuple[Any, bool]], Optional[Tuple[Any, bool]]]]:
+        """
+        Açıklamadaki alt ve üst sınırları bul
+
+        Her eşleşme bulunduğu yan cümleyle birlikte yorumlanır: olumsuzlanan
+        sınır ters çevrilir ("must not exceed 255" -> <= 255), atıf yapan yan
+        cümlelerdeki sayılar yok sayılır ("see RFC 1234-5678").
+
+        Args:
+            description: @param açıklaması
+            name: Parametre adı; "size < 10" gibi başka bir şeyi karşılaştıran
+                ifadeleri ayırt etmek için kullanılır
+
+        Returns:
+            ((alt, dahil mi), (üst, dahil mi)) veya hiç sınır yoksa None
+
+        Raises:
+            _AmbiguousBounds: Sınırın hata/koşul durumunu mu geçerli aralığı mı
+                anlattığı belirsiz, olumsuzlanmış bir aralık veya başka bir
+                değişkeni karşılaştıran ifade var
+        """
+        lower = upper = None
+
+        def context(match) -> Optional[bool]:
+            """Eşleşme olumsuzlanmışsa True, yok sayılacaksa None"""
+            before, after = _clause(description, match.start(), match.end())
+            clause = before + match.group(0) + after
+            if _REFERENCE_CLAUSE.search(clause):
+                return None
+            if _AMBIGUOUS_CLAUSE.search(clause):
+                raise _AmbiguousBounds(clause.strip())
+            return bool(_NEGATION_BEFORE.search(before) or _NEGATION_AFTER.search(after))
+
+        def apply(op, value, negated):
+            if negated:
+                op = _INVERTED[op]
+            if op.startswith('>'):
+                tighten_lower(value, op == '>=')
+            else:
+                tighten_upper(value, op == '<=')
+
+        def tighten_lower(value, inclusive):
+            nonlocal lower
+            if lower is None or value > lower[0] or (value == lower[0] and not inclusive):
+                lower = (value, inclusive)
+
+        def tighten_upper(value, inclusive):
+            nonlocal upper
+            if upper is None or value < upper[0] or (value == upper[0] and not inclusive):
+                upper = (value, inclusive)
+
+        ranges = []
+        bracket = _BRACKET_RANGE.search(description)
+        if bracket:
+            ranges.append((bracket, (_to_number(bracket.group(2)), bracket.group(1) == '['),
+                           (_to_number(bracket.group(3)), bracket.group(4) == ']')))
+        else:
+            for pattern in _RANGE_PATTERNS:
+                for match in pattern.finditer(description):
+                    low, high = sorted((_to_number(match.group(1)), _to_number(match.group(2))))
+                    ranges.append((match, (low, True), (high, True)))
+                if ranges:
+                    break
+
+        for match, low, high in ranges:
+            negated = context(match)
+            if negated is None:
+                continue
+            if negated:
+                # "must not be between 1 and 10" tek bir aralıkla ifade edilemez
+                raise _AmbiguousBounds(match.group(0))
+            tighten_lower(*low)
+            tighten_upper(*high)
+
+        for pattern, operator in _INEQUALITY_PATTERNS:
+            for match in pattern.finditer(description):
+                negated = context(match)
+                if negated is None:
+                    continue
+
+                op = operator
+                if op is None:
+                    op = {'≥': '>=', '≤': '<='}.get(match.group(1), match.group(1))
+                    subject = re.search(r'([A-Za-z_]\w*)\s*$', description[:match.start()])
+                    if (subject and subject.group(1) != name and subject.group(1).lower() not in _SUBJECT_WORDS
+                            and not _NEGATION_BEFORE.fullmatch(subject.group(1))):
+                        raise _AmbiguousBounds(f"{subject.group(1)} {match.group(0)}")
+                apply(op, _to_number(match.group(match.lastindex)), negated)
+
+        for pattern, op, value in _WORD_BOUNDS:
+            for match in pattern.finditer(description):
+                negated = context(match)
+                if negated is not None:
+                    apply(op, value, negated)
+
+        if lower is None and upper is None:
+            return None
+        return lower, upper
+
+    def _find_enum_values(self, description: str) -> List[str]:
+        """Açıklamada sayılan değerleri bul (en az iki değer)"""
+        for pattern in _ENUM_PATTERNS:
+            match = pattern.search(description)
+            if not match:
+                continue
+
+            items = [item.strip() for item in _ENUM_SEPARATOR.split(match.group(1).strip()) if item.strip()]
+            if len(items) < 2 or not all(_ENUM_ITEM.match(item) for item in items):
+                continue
+            # "fast or slow" gibi düz kelimeler sabit değil, açıklamadır
+            if all(re.fullmatch(_NUMBER, item) or _ENUM_CONSTANT.match(item) for item in items):
+                return items
+        return []
+
+    def _build_numeric(self, name: str, description: str, param_type: str,
+                       bounds: Tuple, non_zero: bool) -> Optional[ParameterAnalysis]:
+        """Sayısal sınırlardan parametre analizi oluştur"""
+        is_float = param_type in _FLOAT_LIMITS
+        type_min, type_max = _FLOAT_LIMITS.get(param_type) or _INTEGER_LIMITS.get(param_type, _INTEGER_LIMITS['int'])
+        step = _FLOAT_STEP if is_float else 1
+
+        def adjust(value):
+            return round(value, 6) if is_float else int(value)
+
+        lower, upper = bounds
+        low = type_min if lower is None else adjust(lower[0] if lower[1] else lower[0] + step)
+        high = type_max if upper is None else adjust(upper[0] if upper[1] else upper[0] - step)
+        if low > high:
+            self.logger.warning(f"Çelişkili aralık: {name} ({description})")
+            return None
+
+        def in_type(value):
+            return type_min <= value <= type_max
+
+        classes = []
+        invalid_values = []
+        if low > type_min:
+            below = adjust(low - step)
+            invalid_values.append(below)
+            classes.append(self._eq_class('below_min', [type_min, below], f"{low} altındaki değerler", below, 'invalid'))
+
+        if lower is not None and upper is not None:
+            nominal = adjust((low + high) / 2)
+        elif lower is not None:
+            nominal = adjust(min(low + 10 * step, high))
+        elif upper is not None:
+            nominal = adjust(max(high - 10 * step, low))
+        else:
+            nominal = adjust(step)
+        if non_zero and low <= 0 <= high:
+            invalid_values.append(0)
+            classes.append(self._eq_class('zero', [0], 'Sıfır değeri', 0, 'invalid'))
+            if nominal == 0:
+                nominal = adjust(step) if high >= step else adjust(-step)
+
+        classes.append(self._eq_class('valid_range', [low, high], f"{low} ile {high} arası geçerli değerler", nominal, 'valid'))
+
+        if high < type_max:
+            above = adjust(high + step)
+            invalid_values.append(above)
+            classes.append(self._eq_class('above_max', [above, type_max], f"{high} üzerindeki değerler", above, 'invalid'))
+
+        boundaries = {adjust(value) for value in (low - step, low, low + step, high - step, high, high + step)
+                      if in_type(value) and low - step <= value <= high + step}
+        if non_zero and low <= 0 <= high:
+            boundaries.update(value for value in (-step, 0, step) if low <= value <= high or value == 0)
+
+        constraints = [f"{low} <= {name} <= {high}"]
+        if non_zero:
+            constraints.append(f"{name} != 0")
+
+        return ParameterAnalysis(
+            name=name,
+            type=param_type,
+            description=description,
+            constraints=constraints,
+            valid_range={'min': low, 'max': high},
+            invalid_values=invalid_values,
+            boundary_values=sorted(boundaries),
+            equivalence_classes=classes
+        )
+
+    def _build_enum(self, name: str, description: str, param_type: str, values: List[str]) -> Optional[ParameterAnalysis]:
+        """Sayılan değerlerden parametre analizi oluştur"""
+        numeric = all(re.fullmatch(_NUMBER, value) for value in values)
+        if not numeric and (param_type in _INTEGER_LIMITS or param_type in _FLOAT_LIMITS):
+            # Sabitlerin sayısal değeri bilinmeden tanımlı olmayan bir değer seçilemez
+            self.logger.debug(f"Sabit değerleri bilinmeyen {param_type} parametresi LLM'e bırakılıyor: {name}")
+            return None
+        parsed = [_to_number(value) for value in values] if numeric else values
+
+        if numeric:
+            invalid = max(parsed) + 1
+            valid_range = {'min': min(parsed), 'max': max(parsed)}
+        else:
+            invalid = f"({param_type})-1"
+            valid_range = None
+
+        classes = [
+            self._eq_class(f"value_{value}", [value], f"{value} değeri", value, 'valid')
+            for value in parsed
+        ]
+        classes.append(self._eq_class('out_of_set', [invalid], 'Tanımlı değerler dışındaki değer', invalid, 'invalid'))
+
+        return ParameterAnalysis(
+            name=name,
+            type=param_type,
+            description=description,
+            constraints=[f"{name} in {{{', '.join(values)}}}"],
+            valid_range=valid_range,
+            invalid_values=[invalid],
+            boundary_values=[parsed[0], parsed[-1], invalid] if len(parsed) > 1 else [parsed[0], invalid],
+            equivalence_classes=classes
+        )
+
+    def _extract_pointer(self, name: str, description: str, param_type: str) -> Optional[ParameterAnalysis]:
+        """Pointer/string parametresi için NULL ve uzunluk kısıtlarını çıkar"""
+        non_null = bool(_NON_NULL.search(description))
+        nullable = bool(_NULLABLE.search(description))
+        length_match = _MAX_LENGTH.search(description) if param_type == 'char*' else None
+
+        if not (non_null or nullable or length_match):
+            return None
+
+        is_string = param_type == 'char*'
+        sample = '"test"' if is_string else f"&{name}_value"
+        classes = [self._eq_class('non_null', [sample], 'Geçerli (NULL olmayan) pointer', sample, 'valid')]
+        boundary_values = []
+        invalid_values = []
+        constraints = []
+        valid_range = None
+
+        if length_match:
+            max_length = int(_to_number(next(group for group in length_match.groups() if group)))
+            at_max = '"' + 'a' * max_length + '"'
+            too_long = '"' + 'a' * (max_length + 1) + '"'
+            classes = [
+                self._eq_class('empty', ['""'], 'Boş string', '""', 'valid'),
+                self._eq_class('max_length', [at_max], f"{max_length} karakterlik string", at_max, 'valid'),
+                self._eq_class('too_long', [too_long], f"{max_length} karakterden uzun string", too_long, 'invalid')
+            ]
+            boundary_values.extend(['""', at_max, too_long])
+            invalid_values.append(too_long)
+            constraints.append(f"strlen({name}) <= {max_length}")
+            valid_range = {'min_length': 0, 'max_length': max_length}
+
+        if non_null:
+            classes.append(self._eq_class('null', [None], 'NULL pointer', None, 'invalid'))
+            invalid_values.insert(0, None)
+            constraints.append(f"{name} != NULL")
+        else:
+            classes.append(self._eq_class('null', [None], 'NULL pointer', None, 'valid'))
+        boundary_values.insert(0, None)
+
+        return ParameterAnalysis(
+            name=name,
+            type=param_type,
+            description=description,
+            constraints=constraints,
+            valid_range=valid_range,
+            invalid_values=invalid_values,
+            boundary_values=boundary_values,
+            equivalence_classes=classes
+        )
+
+    @staticmethod
+    def _eq_class(name: str, values: List[Any], description: str,
+                  representative: Any, behavior: str) -> Dict[str, Any]:
+        """Eşdeğerlik sınıfı sözlüğü oluştur"""
+        return {
+            'name': name,
+            'values': values,
+            'description': description,
+            'representative_value': representative,
+            'expected_behavior': behavior
+        }
@@ -0,0 +1,231 @@
+"""
+LLM yanıtlarını diskte saklayan içerik adresli önbellek modülü
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Kayıt formatı değiştiğinde artırılmalı
+RESPONSE_CACHE_VERSION = 1
+
+
+class ResponseCache:
+    """
+    LLM istek gövdesi -> yanıt önbelleği
+
+    Anahtar; model, mesajlar (system + prompt) ve örnekleme parametrelerini
+    içeren istek gövdesinin SHA-256 özetidir. Her yanıt ayrı bir JSON
+    dosyasında tutulur ve atomik olarak yazılır; böylece önbellek birden
+    fazla süreç tarafından paylaşılabilir. Dosyanın mtime değeri son erişim
+    zamanı olarak kullanılır, boyut sınırı aşıldığında en eski erişilenler
+    silinir (LRU).
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 256 * 1024 * 1024, ttl: Optional[float] = None):
+        """
+        Args:
+            cache_dir: Önbellek klasörü
+            max_bytes: Toplam boyut sınırı
+            ttl: Kayıt ömrü (saniye, None ise süresiz)
+        """
+        self.logger = get_logger(__name__)
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._total_bytes = None
+        # Sayaçlar ve toplam boyut iş parçacıklarından güncellenir
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> str:
+        """
+        İstek gövdesinden önbellek anahtarı üret
+
+        Args:
+            request: Chat completions istek gövdesi
+
+        Returns:
+            SHA-256 hex özeti
+        """
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Önbellekteki yanıtı oku
+
+        Args:
+            key: make_key ile üretilmiş anahtar
+
+        Returns:
+            Yanıt metni veya None
+        """
+        entry_path = self._entry_path(key)
+
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            self._record(hit=False)
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"LLM önbelleği okunamadı: {entry_path} - {e}")
+            self._record(hit=False)
+            return None
+
+        if entry.get('version') != RESPONSE_CACHE_VERSION or self._expired(entry):
+            self._remove(entry_path)
+            self._record(hit=False)
+            return None
+
+        # Son erişim zamanını güncelle (LRU)
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+        self._record(hit=True)
+        return entry['response']
+
+    def put(self, key: str, response: str, model: Optional[str] = None) -> None:
+        """
+        Yanıtı önbelleğe atomik olarak yaz
+
+        Args:
+            key: make_key ile üretilmiş anahtar
+            response: Yanıt metni
+            model: Yanıtı üreten model (bilgi amaçlı)
+        """
+        entry_path = self._entry_path(key)
+        entry = {
+            'version': RESPONSE_CACHE_VERSION,
+            'created': time.time(),
+            'model': model,
+            'response': response
+        }
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            size = entry_path.stat().st_size
+        except OSError as e:
+            self.logger.warning(f"LLM önbelleği yazılamadı: {entry_path} - {e}")
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += size
+            over_limit = self._total_bytes > self.max_bytes
+
+        if over_limit:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        Süresi dolmuş kayıtları ve boyut sınırını aşan en eski kayıtları sil
+
+        Returns:
+            Silinen kayıt sayısı
+        """
+        entries = []
+        for entry_path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        now = time.time()
+        removed = 0
+
+        for mtime, size, entry_path in entries:
+            # mtime son erişim zamanıdır; TTL'den uzun süredir erişilmeyenler de silinir
+            stale = self.ttl is not None and now - mtime > self.ttl
+            if total <= self.max_bytes and not stale:
+                continue
+            if self._remove(entry_path):
+                total -= size
+                removed += 1
+
+        with self._lock:
+            self._total_bytes = total
+        if removed:
+            self.logger.debug(f"LLM önbelleğinden {removed} kayıt silindi")
+        return removed
+
+    def clear(self) -> None:
+        """Tüm önbelleği sil"""
+        for entry_path in self.cache_dir.glob('*/*.json'):
+            self._remove(entry_path)
+        with self._lock:
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        İsabet/ıska sayaçlarının tutarlı bir kopyası
+
+        Returns:
+            hits ve misses değerleri
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+    def _record(self, hit: bool) -> None:
+        """İsabet veya ıskayı kilit altında say"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _expired(self, entry: Dict[str, Any]) -> bool:
+        """Kaydın TTL süresi doldu mu"""
+        return self.ttl is not None and time.time() - entry.get('created', 0) > self.ttl
+
+    def _scan_size(self) -> int:
+        """Önbelleğin diskteki toplam boyutu"""
+        total = 0
+        for entry_path in self.cache_dir.glob('*/*.json'):
+            try:
+                total += entry_path.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    def _remove(self, entry_path: Path) -> bool:
+        """Kaydı sil (başka süreç silmişse sorun değil)"""
+        try:
+            os.unlink(entry_path)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            self.logger.warning(f"LLM önbellek kaydı silinemedi: {entry_path} - {e}")
+            return False
+
+    def _entry_path(self, key: str) -> Path:
+        """Anahtarın önbellek dosyası yolu"""
+        return self.cache_dir / key[:2] / f"{key}.json"
@@ -0,0 +1,106 @@
+"""
+LLM istekleri için yeniden deneme politikası modülü
+"""
+
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import requests
+
+# Geçici kabul edilen HTTP durum kodları
+RETRYABLE_STATUS = frozenset({408, 409, 425, 429, 500, 502, 503, 504, 520, 522, 524})
+
+
+@dataclass
+class RetryPolicy:
+    """Üstel geri çekilme (full jitter) ayarları"""
+    max_retries: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    deadline: float = 300.0  # çağrı başına toplam süre sınırı (saniye)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Deneme numarasına göre bekleme süresi
+
+        Args:
+            attempt: 0'dan başlayan yeniden deneme sırası
+
+        Returns:
+            0 ile min(max_delay, base_delay * 2^attempt) arasında rastgele süre
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+
+def classify_error(error: Exception) -> Optional[str]:
+    """
+    Hatayı sınıflandır
+
+    Args:
+        error: İstek sırasında oluşan hata
+
+    Returns:
+        Yeniden denenebilir hatalar için neden etiketi (ör. 'http_429',
+        'timeout'), kalıcı hatalar için None
+    """
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return f"http_{status}" if status in RETRYABLE_STATUS else None
+    if isinstance(error, requests.exceptions.Timeout):
+        return 'timeout'
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return 'connection'
+    if isinstance(error, requests.exceptions.ChunkedEncodingError):
+        return 'connection'
+    return None
+
+
+def parse_retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """
+    Retry-After başlığını saniyeye çevir
+
+    Args:
+        response: HTTP yanıtı
+
+    Returns:
+        Beklenecek süre (saniye) veya başlık yoksa None
+    """
+    if response is None:
+        return None
+
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryStats:
+    """İş parçacığı güvenli yeniden deneme sayaçları"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = Counter()
+
+    def record(self, key: str, amount: int = 1) -> None:
+        """Sayacı artır"""
+        with self._lock:
+            self._counters[key] += amount
+
+    def snapshot(self) -> Dict[str, int]:
+        """Sayaçların anlık kopyası"""
+        with self._lock:
+            return dict(self._counters)
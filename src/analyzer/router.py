@@ -0,0 +1,139 @@
+"""
+Fonksiyon karmaşıklığına göre model yönlendirme modülü
+
+Her fonksiyon parametre sayısı, pointer parametreler, dallanma sayısı ve
+gövde uzunluğundan hesaplanan bir karmaşıklık puanı alır. Puanı eşiğin
+altında kalan basit fonksiyonlar küçük ve hızlı modele, diğerleri güçlü
+modele gönderilir. Rota başına gecikme ve başarı ölçümleri tutulur.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+from .backends import BackendMetrics
+from .dedup import normalize_code
+from .range_extractor import parse_signature
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Dallanma noktaları: koşullar, döngüler, case etiketleri, ?: ve kısa devre operatörleri
+_BRANCH_PATTERN = re.compile(r'\b(?:if|for|while|case)\b|\?|&&|\|\|')
+
+# Puan ağırlıkları
+PARAM_WEIGHT = 1.0
+POINTER_WEIGHT = 2.0
+BRANCH_WEIGHT = 1.5
+LINE_WEIGHT = 0.1
+
+
+@dataclass
+class ComplexityScore:
+    """Fonksiyonun karmaşıklık özellikleri ve toplam puanı"""
+    params: int
+    pointer_params: int
+    branches: int
+    body_lines: int
+
+    @property
+    def total(self) -> float:
+        return (self.params * PARAM_WEIGHT + self.pointer_params * POINTER_WEIGHT
+                + self.branches * BRANCH_WEIGHT + self.body_lines * LINE_WEIGHT)
+
+
+def score_function(function_dict: Dict[str, Any]) -> ComplexityScore:
+    """
+    Fonksiyonun karmaşıklık puanını hesapla
+
+    Args:
+        function_dict: Fonksiyon bilgileri (code alanı yoksa yalnızca imza kullanılır)
+
+    Returns:
+        ComplexityScore objesi
+    """
+    _, signature_types = parse_signature(function_dict.get('signature', ''))
+    types = dict(signature_types)
+    for param in function_dict.get('params') or []:
+        if param.get('type'):
+            types[param['name']] = param['type']
+
+    params = max(len(types), len(function_dict.get('params') or []))
+    pointer_params = sum(1 for param_type in types.values() if '*' in param_type or '[' in param_type)
+
+    code = function_dict.get('code') or ''
+    body = code[code.find('{') + 1:] if '{' in code else ''
+    # Yorumlar dallanma ve satır sayısına katılmaz
+    lines = [line for line in re.sub(r'//[^\n]*|/\*.*?\*/', '', body, flags=re.DOTALL).splitlines() if line.strip()]
+
+    return ComplexityScore(
+        params=params,
+        pointer_params=pointer_params,
+        branches=len(_BRANCH_PATTERN.findall(normalize_code(body))),
+        body_lines=max(0, len(lines) - 1)  # kapanış parantezi
+    )
+
+
+@dataclass
+class Route:
+    """Puanı max_score'a kadar olan fonksiyonların gönderileceği model"""
+    name: str
+    model: str
+    max_score: float
+    metrics: BackendMetrics = field(default_factory=BackendMetrics, repr=False)
+
+
+class ModelRouter:
+    """Fonksiyonları karmaşıklık puanına göre rotalara dağıtan sınıf"""
+
+    def __init__(self, routes: List[Route]):
+        """
+        Args:
+            routes: Rotalar; en yüksek max_score'lu rota tüm kalan fonksiyonları alır
+        """
+        if not routes:
+            raise ValueError("En az bir rota gerekli")
+        self.logger = get_logger(__name__)
+        self.routes = sorted(routes, key=lambda route: route.max_score)
+
+    def route(self, function_dict: Dict[str, Any]) -> Route:
+        """
+        Fonksiyonun rotasını seç
+
+        Args:
+            function_dict: Fonksiyon bilgileri
+
+        Returns:
+            Puanın sığdığı ilk rota (hiçbirine sığmazsa en güçlü rota)
+        """
+        score = score_function(function_dict)
+        total = score.total
+        route = next((route for route in self.routes if total <= route.max_score), self.routes[-1])
+
+        self.logger.debug(f"{function_dict['name']} -> {route.name} ({route.model}), puan {total:.1f} "
+                          f"(parametre {score.params}, pointer {score.pointer_params}, "
+                          f"dallanma {score.branches}, satır {score.body_lines})")
+        return route
+
+    def route_many(self, function_dicts: List[Dict[str, Any]]) -> Route:
+        """
+        Aynı istekte analiz edilecek fonksiyonlar için rota seç
+
+        Returns:
+            Fonksiyonların rotalarından en güçlüsü
+        """
+        routes = [self.route(function_dict) for function_dict in function_dicts]
+        return max(routes, key=self.routes.index)
+
+    def for_model(self, model: str) -> Optional[Route]:
+        """Modeli kullanan rota (yoksa None)"""
+        return next((route for route in self.routes if route.model == model), None)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Rota başına ölçümler
+
+        Returns:
+            Rota adı -> model ve BackendMetrics.snapshot() alanları
+        """
+        return {route.name: dict(route.metrics.snapshot(), model=route.model) for route in self.routes}
@@ -0,0 +1,220 @@
+"""
+LLM istekleri için öncelik sınıflı zamanlayıcı
+
+Backend'e giden her istek bir öncelik sınıfıyla (interactive, batch,
+background) kuyruğa girer. Boş yer açıldıkça sıradaki istek, sınıf
+ağırlıklarına göre adil paylaşım (stride scheduling) yapılarak seçilir; en
+yüksek ağırlıklı interactive sınıfı, boşta geçen süre için biriken hak
+olmadan kuyruğun önüne geçer. Toplam kapasitenin bir kısmı interactive
+istekler için ayrılabilir, böylece kapasite toplu işlerle doluyken gelen
+etkileşimli istek uzun bir LLM çağrısının bitmesini beklemez.
+
+Zamanlayıcı yalnızca kendi sürecindeki istekleri görür. Aynı API kotasını
+kullanan ayrı süreçler (web arayüzü ve toplu işler) arasındaki paylaşım
+quota.SharedQuota ile yapılır.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PRIORITY_INTERACTIVE = 'interactive'
+PRIORITY_BATCH = 'batch'
+PRIORITY_BACKGROUND = 'background'
+
+# Eşitlikte önce gelen sınıf seçilir
+PRIORITIES = (PRIORITY_INTERACTIVE, PRIORITY_BATCH, PRIORITY_BACKGROUND)
+
+DEFAULT_WEIGHTS = {
+    PRIORITY_INTERACTIVE: 16,
+    PRIORITY_BATCH: 4,
+    PRIORITY_BACKGROUND: 1
+}
+
+
+class _Ticket:
+    """Kuyrukta bekleyen tek istek"""
+
+    __slots__ = ('priority', 'enqueued', 'granted')
+
+    def __init__(self, priority: str):
+        self.priority = priority
+        self.enqueued = time.monotonic()
+        self.granted = False
+
+
+class RequestScheduler:
+    """İş parçacığı güvenli, ağırlıklı adil paylaşımlı istek zamanlayıcı"""
+
+    def __init__(self, capacity: Callable[[], int], weights: Optional[Dict[str, int]] = None,
+                 reserved_interactive: int = 1, window: int = 1000):
+        """
+        Args:
+            capacity: Aynı anda backend'e gidebilecek istek sayısını döndüren
+                fonksiyon (uyarlanır sınırlayıcıyla değişebilir)
+            weights: Sınıf ağırlıkları (varsayılan: DEFAULT_WEIGHTS)
+            reserved_interactive: interactive dışındaki sınıfların
+                kullanamayacağı yer sayısı (kapasite 1 ise uygulanmaz)
+            window: Yüzdelikler için sınıf başına saklanan son bekleme sayısı
+        """
+        self.logger = get_logger(__name__)
+        self.capacity = capacity
+        self.weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        self.reserved_interactive = max(0, reserved_interactive)
+        self._condition = threading.Condition()
+        self._queues = {priority: deque() for priority in PRIORITIES}
+        self._pass = {priority: 0.0 for priority in PRIORITIES}
+        self._virtual_time = 0.0
+        self.in_flight = 0
+        self._waits = {priority: deque(maxlen=window) for priority in PRIORITIES}
+        self._requests = {priority: 0 for priority in PRIORITIES}
+        self._total_wait = {priority: 0.0 for priority in PRIORITIES}
+        self._max_wait = {priority: 0.0 for priority in PRIORITIES}
+
+    def acquire(self, priority: str = PRIORITY_BATCH) -> float:
+        """
+        Sıra gelene kadar bekle ve yer al
+
+        Args:
+            priority: PRIORITIES sınıflarından biri
+
+        Returns:
+            Kuyrukta beklenen süre (saniye)
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Geçersiz öncelik sınıfı: {priority} (geçerli: {', '.join(PRIORITIES)})")
+
+        ticket = _Ticket(priority)
+        with self._condition:
+            queue = self._queues[priority]
+            if not queue:
+                if priority == PRIORITY_INTERACTIVE:
+                    # Yeni gelen interactive istek önceki isteklerin payını taşımaz,
+                    # kuyruktakilerin önüne geçer; birikmiş interactive istekler ağırlıkla paylaşır
+                    self._pass[priority] = self._virtual_time
+                else:
+                    # Boşta kalan sınıf geçmişten hak biriktirmez
+                    self._pass[priority] = max(self._pass[priority], self._virtual_time)
+            queue.append(ticket)
+            self._dispatch()
+
+            while not ticket.granted:
+                self._condition.wait()
+
+            wait = time.monotonic() - ticket.enqueued
+            self._requests[priority] += 1
+            self._total_wait[priority] += wait
+            self._max_wait[priority] = max(self._max_wait[priority], wait)
+            self._waits[priority].append(wait)
+
+        if wait >= 1.0:
+            self.logger.debug(f"{priority} isteği kuyrukta {wait:.2f} sn bekledi")
+        return wait
+
+    def try_acquire(self, priority: str = PRIORITY_BATCH) -> bool:
+        """
+        Kuyrukta bekleyen istek yoksa ve boş yer varsa beklemeden yer al
+
+        Kuyruk istatistiklerine eklenmez; kopya (hedge) istekler gibi yalnızca
+        boş kapasiteyi kullanması gereken istekler içindir.
+
+        Args:
+            priority: PRIORITIES sınıflarından biri
+
+        Returns:
+            Yer alındıysa True (release ile bırakılmalı)
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Geçersiz öncelik sınıfı: {priority} (geçerli: {', '.join(PRIORITIES)})")
+
+        with self._condition:
+            if any(self._queues.values()):
+                return False
+
+            capacity = max(1, self.capacity())
+            limit = capacity if priority == PRIORITY_INTERACTIVE else max(1, capacity - self.reserved_interactive)
+            if self.in_flight >= limit:
+                return False
+
+            self.in_flight += 1
+            return True
+
+    def release(self) -> None:
+        """Biten isteğin yerini sıradaki isteğe ver"""
+        with self._condition:
+            self.in_flight -= 1
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, priority: str = PRIORITY_BATCH):
+        """acquire/release çifti"""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _dispatch(self) -> None:
+        """Boş yerleri ağırlıklara göre sıradaki isteklere ver (kilit tutulurken çağrılmalı)"""
+        capacity = max(1, self.capacity())
+        shared = max(1, capacity - self.reserved_interactive)
+        granted = False
+
+        while self.in_flight < capacity:
+            candidates = [
+                priority for priority in PRIORITIES
+                if self._queues[priority] and (priority == PRIORITY_INTERACTIVE or self.in_flight < shared)
+            ]
+            if not candidates:
+                break
+
+            priority = min(candidates, key=lambda name: (self._pass[name], PRIORITIES.index(name)))
+            ticket = self._queues[priority].popleft()
+            self._virtual_time = self._pass[priority]
+            self._pass[priority] += 1.0 / self.weights[priority]
+            ticket.granted = True
+            self.in_flight += 1
+            granted = True
+
+        if granted:
+            self._condition.notify_all()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Zamanlayıcının anlık özeti
+
+        Returns:
+            capacity, in_flight ve sınıf başına istek sayısı, kuyrukta bekleyen
+            sayısı ve ortalama/p50/p95/en yüksek bekleme süresi
+        """
+        with self._condition:
+            classes = {}
+            for priority in PRIORITIES:
+                waits = sorted(self._waits[priority])
+                requests = self._requests[priority]
+
+                def pct(fraction: float) -> float:
+                    if not waits:
+                        return 0.0
+                    return waits[min(len(waits) - 1, int(fraction * len(waits)))]
+
+                classes[priority] = {
+                    'requests': requests,
+                    'queued': len(self._queues[priority]),
+                    'mean_wait': self._total_wait[priority] / requests if requests else 0.0,
+                    'p50_wait': pct(0.50),
+                    'p95_wait': pct(0.95),
+                    'max_wait': self._max_wait[priority]
+                }
+
+            return {
+                'capacity': self.capacity(),
+                'in_flight': self.in_flight,
+                'classes': classes
+            }
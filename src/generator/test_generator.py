@@ -134,43 +134,8 @@ class TestGenerator:
         
         try:
             analysis = analyzer.analyze_function(function)
-            
-            # EP testleri üret
-            ep_tests = []
-            if include_ep:
-                ep_tests = self.ep_generator.generate_ep_tests(analysis.parameters)
-            
-            # BVA testleri üret
-            bva_tests = []
-            if include_bva:
-                bva_tests = self.bva_generator.generate_bva_tests(analysis.parameters)
-            
-            # Test fonksiyonlarını oluştur
-            test_functions = self._create_test_functions(analysis, ep_tests, bva_tests)
-            
-            # Test suite oluştur
-            test_suite = GeneratedTestSuite(
-                function_name=function.name,
-                test_functions=test_functions,
-                includes=self._get_includes(analysis),
-                setup_code=self._get_setup_code(analysis),
-                teardown_code=self._get_teardown_code(analysis),
-                ep_tests=ep_tests,
-                bva_tests=bva_tests
-            )
-            
-            # LLM'den gelen test kodu varsa onu kullan, yoksa generate_c_code ile üret
-            llm_test_code = None
-            if analysis.test_scenarios:
-                for scenario in analysis.test_scenarios:
-                    if scenario.get('type') == 'llm_generated' and scenario.get('code'):
-                        llm_test_code = scenario['code']
-                        break
-            
-            test_suite.test_code = self.generate_c_code(test_suite, framework=framework, llm_response=llm_test_code)
-            
-            self.logger.info(f"Test suite başarıyla üretildi: {len(test_functions)} test fonksiyonu")
-            return test_suite
+            return self.generate_from_analysis(analysis, framework=framework,
+                                               include_ep=include_ep, include_bva=include_bva)
             
         except Exception as e:
             self.logger.error(f"Test suite üretimi hatası: {e}")
@@ -183,6 +148,66 @@ class TestGenerator:
                 teardown_code=""
             )
     
+    def generate_from_analysis(self, analysis: FunctionAnalysis, framework: str = 'custom',
+                               include_ep: bool = True, include_bva: bool = True) -> GeneratedTestSuite:
+        """
+        Fonksiyon analizinden test suite üret
+        
+        Analizde LLM tarafından üretilmiş test kodu varsa o kullanılır; yoksa
+        (ör. yerel aralık çıkarımıyla analiz edilmiş fonksiyonlar) test kodu
+        EP ve BVA senaryolarından framework şablonuyla üretilir.
+        
+        Args:
+            analysis: Fonksiyon analizi
+            framework: Test framework'ü ('unity', 'cmocka', 'custom')
+            include_ep: EP testlerini dahil et
+            include_bva: BVA testlerini dahil et
+            
+        Returns:
+            Üretilen test suite
+        """
+        # EP testleri üret
+        ep_tests = []
+        if include_ep:
+            ep_tests = self.ep_generator.generate_ep_tests(analysis.parameters)
+        
+        # BVA testleri üret
+        bva_tests = []
+        if include_bva:
+            bva_tests = self.bva_generator.generate_bva_tests(analysis.parameters)
+        
+        # Test fonksiyonlarını oluştur
+        test_functions = self._create_test_functions(analysis, ep_tests, bva_tests)
+        
+        # Test suite oluştur
+        test_suite = GeneratedTestSuite(
+            function_name=analysis.name,
+            test_functions=test_functions,
+            includes=self._get_includes(analysis),
+            setup_code=self._get_setup_code(analysis),
+            teardown_code=self._get_teardown_code(analysis),
+            ep_tests=ep_tests,
+            bva_tests=bva_tests
+        )
+        
+        # LLM'den gelen test kodu varsa onu kullan, yoksa generate_c_code ile üret
+        llm_test_code = None
+        if analysis.test_scenarios:
+            for scenario in analysis.test_scenarios:
+                if scenario.get('type') == 'llm_generated' and scenario.get('code'):
+                    llm_test_code = scenario['code']
+                    break
+        
+        test_suite.test_code = self.generate_c_code(test_suite, framework=framework, llm_response=llm_test_code)
+        
+        # LLM'e ulaşılamadan üretilen testler sonradan yeniden üretilebilsin diye işaretlenir
+        if analysis.needs_regeneration:
+            test_suite.test_code = (f"// NEEDS-REGENERATION: {analysis.name} - LLM analizi yapılamadı, "
+                                    f"testler yerel/varsayılan analizden üretildi\n" + test_suite.test_code)
+        
+        self.logger.info(f"Test suite başarıyla üretildi: {len(test_functions)} test fonksiyonu")
+        return test_suite
+    
     def generate_c_code(self, test_suite: GeneratedTestSuite, llm_response: str = None, framework: str = 'custom') -> str:
         """
         Test suite'i C kodu olarak üret
@@ -3,5 +3,7 @@ Parser modülü - C fonksiyonlarını parse eden araçlar
 """
 
 from .doxygen_parser import DoxygenParser, DoxygenFunction
+from .parse_cache import ParseCache
+from .symbol_index import SymbolIndex, SymbolEntry
 
-__all__ = ['DoxygenParser', 'DoxygenFunction'] 
\ No newline at end of file
+__all__ = ['DoxygenParser', 'DoxygenFunction', 'ParseCache', 'SymbolIndex', 'SymbolEntry'] 
\ No newline at end of file
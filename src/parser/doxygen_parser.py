@@ -2,17 +2,58 @@
 Doxygen formatındaki C fonksiyonlarını parse eden modül
 """
 
+import mmap
+import os
 import re
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from .parse_cache import ParseCache
+    from .symbol_index import SymbolIndex
+
 logger = get_logger(__name__)
 
 
-@dataclass
+# Python 3.10+ üzerinde örnekler __dict__ yerine __slots__ ile saklanır
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+class SourceBuffer:
+    """Fonksiyon kodlarının okunduğu paylaşılan kaynak (metin veya dosya)"""
+    
+    __slots__ = ('text', 'path')
+    
+    def __init__(self, text: Optional[str] = None, path: Optional[Path] = None):
+        self.text = text
+        self.path = path
+    
+    def read(self, offset: int, length: int) -> str:
+        """
+        Kaynaktaki aralığı oku
+        
+        Args:
+            offset: Başlangıç konumu (metinde karakter, dosyada byte)
+            length: Uzunluk
+            
+        Returns:
+            Okunan metin
+        """
+        if self.text is not None:
+            return self.text[offset:offset + length]
+        
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return f.read(length).decode('utf-8', errors='replace')
+
+
+@dataclass(**_SLOTS)
 class DoxygenParam:
     """Doxygen parametre bilgisi"""
     name: str
@@ -21,84 +62,166 @@ class DoxygenParam:
     direction: Optional[str] = None  # in, out, inout
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DoxygenReturn:
     """Doxygen return bilgisi"""
     description: str
     type: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DoxygenPrecondition:
     """Doxygen önkoşul bilgisi"""
     description: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DoxygenPostcondition:
     """Doxygen sonkoşul bilgisi"""
     description: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DoxygenFunction:
-    """Doxygen fonksiyon bilgisi"""
+    """
+    Doxygen fonksiyon bilgisi
+    
+    Liste alanları tuple olarak saklanır (boşlar tek bir paylaşılan
+    tuple'dır). Fonksiyon kodu kopyalanmaz; code_span ile paylaşılan
+    kaynaktan (source) istendiğinde okunur.
+    """
     name: str
     signature: str
     brief: str
     details: Optional[str] = None
-    params: List[DoxygenParam] = None
+    params: Tuple[DoxygenParam, ...] = ()
     return_info: Optional[DoxygenReturn] = None
-    preconditions: List[DoxygenPrecondition] = None
-    postconditions: List[DoxygenPostcondition] = None
-    notes: List[str] = None
-    warnings: List[str] = None
-    throws: List[str] = None
-    code: Optional[str] = None
+    preconditions: Tuple[DoxygenPrecondition, ...] = ()
+    postconditions: Tuple[DoxygenPostcondition, ...] = ()
+    notes: Tuple[str, ...] = ()
+    warnings: Tuple[str, ...] = ()
+    throws: Tuple[str, ...] = ()
+    code_span: Optional[Tuple[int, int]] = None  # (offset, length)
+    source: Optional[SourceBuffer] = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
-        if self.params is None:
-            self.params = []
-        if self.preconditions is None:
-            self.preconditions = []
-        if self.postconditions is None:
-            self.postconditions = []
-        if self.notes is None:
-            self.notes = []
-        if self.warnings is None:
-            self.warnings = []
-        if self.throws is None:
-            self.throws = []
+        self.params = tuple(self.params or ())
+        self.preconditions = tuple(self.preconditions or ())
+        self.postconditions = tuple(self.postconditions or ())
+        self.notes = tuple(self.notes or ())
+        self.warnings = tuple(self.warnings or ())
+        self.throws = tuple(self.throws or ())
+    
+    @property
+    def code(self) -> str:
+        """Fonksiyon kodu (paylaşılan kaynaktan okunur)"""
+        if self.code_span is None or self.source is None:
+            return ""
+        return self.source.read(*self.code_span)
+
+
+@dataclass
+class DoxygenBlock:
+    """Dosyadaki Doxygen bloğu ve ardından gelen fonksiyon imzası"""
+    comment: str
+    start: int
+    end: int
+    signature: Optional[str] = None
+    signature_start: int = -1
+    name: Optional[str] = None
+    code_end: int = -1
+
+
+# Yorumlar, string/karakter sabitleri ve süslü parantezler;
+# 1. grup Doxygen blokları (/** ... */), 2. grup parantezler
+_TOKEN_PATTERN = re.compile(
+    r'(/\*\*(?!/).*?\*/)|/\*.*?\*/|//[^\n]*|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|([{}])',
+    re.DOTALL
+)
+
+# Satır başındaki Doxygen tag'i (@tag veya \\tag) ve kalan metin
+_TAG_PATTERN = re.compile(r'[@\\](\w+)(.*)$')
+
+# @param [yön] isim açıklama
+_PARAM_PATTERN = re.compile(r'(?:\[(in|out|inout)\]\s*)?(\w+)\s+(.+)$', re.IGNORECASE)
+
+# Tek satırlık fonksiyon imzası (gövde başlangıcı '{' veya prototip ';' ile);
+# '{' ile aynı satırda devam eden tek satırlık gövde imzaya dahil edilmez
+_SIGNATURE_PATTERN = re.compile(
+    r'^[ \t]*(?P<signature>(?:const[ \t]+)?(?:char[ \t]*\*|int|void|float|double|long|short|unsigned|signed)'
+    r'[ \t]+(?P<name>\w+)[ \t]*\([^)\n]*\)[ \t]*[{;]?)(?:(?<=\{)[^\n]*)?[ \t\r]*$',
+    re.MULTILINE
+)
+
+# Bloğun ardındaki bildirimin sonu: ilk '{' veya parantez dışındaki ilk ';';
+# 1. grup Doxygen blokları, 2. grup '(', 3. grup ')', 4. grup '{', 5. grup ';'
+_DECLARATION_END_PATTERN = re.compile(
+    r'(/\*\*(?!/).*?\*/)|/\*.*?\*/|//[^\n]*|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|(\()|(\))|(\{)|(;)',
+    re.DOTALL
+)
+
+# mmap ile okunan dosyalar için aynı pattern'lerin bytes karşılıkları
+_TOKEN_PATTERN_BYTES = re.compile(_TOKEN_PATTERN.pattern.encode(), re.DOTALL)
+_SIGNATURE_PATTERN_BYTES = re.compile(_SIGNATURE_PATTERN.pattern.encode(), re.MULTILINE)
+_DECLARATION_END_PATTERN_BYTES = re.compile(_DECLARATION_END_PATTERN.pattern.encode(), re.DOTALL)
+
+
+# Paralel ağaç parse'ında bir worker'a tek seferde verilecek en fazla dosya
+TREE_MAX_CHUNK_SIZE = 16
+
+# Worker process'lerindeki parser örneği
+_tree_worker_parser = None
+
+
+def _init_tree_worker(cache_dir: Optional[Path], index_path: Optional[Path]) -> None:
+    """Worker process'i için parser oluştur"""
+    global _tree_worker_parser
+    from .parse_cache import ParseCache
+    from .symbol_index import SymbolIndex
+    
+    _tree_worker_parser = DoxygenParser(
+        cache=ParseCache(cache_dir) if cache_dir else None,
+        index=SymbolIndex(index_path) if index_path else None
+    )
+
+
+def _parse_tree_file(file_path: Path) -> List['DoxygenFunction']:
+    """Worker process'inde tek dosyayı parse et"""
+    return _tree_worker_parser.parse_file(file_path)
+
+
+def _decode(buffer, start: int, end: int) -> str:
+    """Tampondaki (str, bytes veya mmap) aralığı metin olarak döndür"""
+    text = buffer[start:end]
+    if isinstance(text, str):
+        return text
+    return text.decode('utf-8', errors='replace')
 
 
 class DoxygenParser:
     """Doxygen formatındaki C fonksiyonlarını parse eden sınıf"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional['ParseCache'] = None, index: Optional['SymbolIndex'] = None):
+        """
+        Args:
+            cache: Dosya parse sonuçları için disk önbelleği (opsiyonel)
+            index: Parse edilen dosyalarla güncellenen sembol indeksi (opsiyonel)
+        """
         self.logger = get_logger(__name__)
+        self.cache = cache
+        self.index = index
         
-        # Doxygen tag regex pattern'leri
-        self.patterns = {
-            'function_start': r'/\*\*\s*$',
-            'function_end': r'\*/\s*$',
-            'brief': r'@brief\s+(.+)$',
-            'details': r'@details\s+(.+)$',
-            'param': r'@param\s+(\w+)\s+(.+)$',
-            'param_with_type': r'@param\s+\[(in|out|inout)\]\s+(\w+)\s+(.+)$',
-            'return': r'@return\s+(.+)$',
-            'pre': r'@pre\s+(.+)$',
-            'post': r'@post\s+(.+)$',
-            'note': r'@note\s+(.+)$',
-            'warning': r'@warning\s+(.+)$',
-            'throws': r'@throws\s+(.+)$',
-            'function_signature': r'(?:const\s+)?(?:char\s*\*|int|void|float|double|long|short|unsigned|signed)\s+(\w+(?:_\w+)*)\s*\([^)]*\)\s*;?\s*$',
-            'simple_function': r'(?:const\s+)?(?:char\s*\*|int|void|float|double|long|short|unsigned|signed)\s+(\w+(?:_\w+)*)\s*\([^)]*\)\s*\{'
-        }
-        
-        # Regex pattern'leri compile et
-        self.compiled_patterns = {
-            key: re.compile(pattern, re.MULTILINE | re.IGNORECASE)
-            for key, pattern in self.patterns.items()
+        # Doxygen tag'lerini işleyen fonksiyonlar (tag adı -> handler)
+        self.tag_handlers = {
+            'brief': self._handle_brief,
+            'details': self._handle_details,
+            'param': self._handle_param,
+            'return': self._handle_return,
+            'pre': self._handle_pre,
+            'post': self._handle_post,
+            'note': self._handle_note,
+            'warning': self._handle_warning,
+            'throws': self._handle_throws
         }
     
     def parse_file(self, file_path: Path) -> List[DoxygenFunction]:
@@ -111,16 +234,10 @@ class DoxygenParser:
         Returns:
             Parse edilmiş fonksiyon listesi
         """
-        self.logger.info(f"Dosya parse ediliyor: {file_path}")
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            self.logger.error(f"Dosya okunamadı: {e}")
-            return []
+        functions = list(self.iter_file(file_path))
         
-        return self.parse_content(content)
+        self.logger.info(f"{len(functions)} fonksiyon parse edildi")
+        return functions
     
     def parse_content(self, content: str) -> List[DoxygenFunction]:
         """
@@ -132,26 +249,220 @@ class DoxygenParser:
         Returns:
             Parse edilmiş fonksiyon listesi
         """
-        functions = []
+        functions = list(self.iter_content(content))
+        
+        self.logger.info(f"{len(functions)} fonksiyon parse edildi")
+        return functions
+    
+    def parse_tree(self, root: Path, pattern: str = "*.c",
+                   workers: Optional[int] = None) -> Dict[Path, List[DoxygenFunction]]:
+        """
+        Klasör ağacındaki tüm C dosyalarını paralel parse et
+        
+        Dosyalar CPU sayısı kadar process'e dağıtılır. Büyük dosyalar önce
+        gönderilir ve her worker'a küçük parçalar halinde iş verilir; böylece
+        tek bir büyük dosya diğer dosyaların işlenmesini bekletmez.
+        
+        Args:
+            root: Aranacak kök klasör (alt klasörler dahil)
+            pattern: Dosya adı deseni
+            workers: Process sayısı (varsayılan: CPU sayısı)
+            
+        Returns:
+            Dosya yolu -> fonksiyon listesi (yola göre sıralı)
+        """
+        files = sorted(path for path in Path(root).rglob(pattern) if path.is_file())
+        if not files:
+            return {}
         
-        # Doxygen bloklarını bul
-        doxygen_blocks = self._extract_doxygen_blocks(content)
+        workers = min(workers or os.cpu_count() or 1, len(files))
+        self.logger.info(f"{len(files)} dosya {workers} process ile parse ediliyor: {root}")
+        
+        if workers == 1:
+            return {path: self.parse_file(path) for path in files}
+        
+        scheduled = sorted(files, key=lambda path: path.stat().st_size, reverse=True)
+        chunk_size = max(1, min(TREE_MAX_CHUNK_SIZE, len(files) // (workers * 4)))
+        cache_dir = self.cache.cache_dir if self.cache is not None else None
+        index_path = self.index.db_path if self.index is not None else None
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_tree_worker,
+                                 initargs=(cache_dir, index_path)) as executor:
+            parsed = dict(zip(scheduled, executor.map(_parse_tree_file, scheduled, chunksize=chunk_size)))
+        
+        return {path: parsed[path] for path in files}
+    
+    def iter_file(self, file_path: Path) -> Iterator[DoxygenFunction]:
+        """
+        Dosyadaki Doxygen fonksiyonlarını bulundukça döndür
+        
+        Dosya mmap ile okunur; bellekte aynı anda yalnızca işlenen
+        fonksiyonun metni tutulur. Sembol indeksi fonksiyonlar bulundukça
+        sabit boyutlu parçalarla yazılır ve dosyanın sonuna gelindiğinde
+        tek işlemde değiştirilir.
+        
+        Args:
+            file_path: C dosyası yolu
+            
+        Yields:
+            Parse edilmiş fonksiyonlar (dosyadaki sırayla)
+        """
+        self.logger.info(f"Dosya parse ediliyor: {file_path}")
         
-        for block in doxygen_blocks:
+        try:
+            with open(file_path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                
+                # Sembol indeksi yalnızca değişen dosyalar için güncellenir
+                stale = self.index is not None and not self.index.is_current(file_path, stat)
+                
+                # Boş dosyalar mmap edilemez
+                if stat.st_size == 0:
+                    if stale:
+                        self.index.update_file(file_path, stat, [], b'')
+                    return
+                
+                # Fonksiyon kodları gerektiğinde dosyadan okunur
+                source = SourceBuffer(path=Path(file_path))
+                
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    writer = self.index.begin_file(file_path, stat, buffer) if stale else None
+                    if self.cache is not None:
+                        functions = self._iter_functions_cached(file_path, buffer, source, stat)
+                    else:
+                        functions = self._iter_functions(buffer, source)
+                    try:
+                        for function in functions:
+                            if writer is not None:
+                                writer.add(function)
+                            yield function
+                        
+                        if writer is not None:
+                            writer.commit()
+                            writer = None
+                    finally:
+                        # Yarıda bırakılan tarama indeksi değiştirmez
+                        if writer is not None:
+                            writer.discard()
+                        
+                        # mmap kapanmadan önce taramadaki referansları bırak
+                        functions.close()
+                        del functions
+        except OSError as e:
+            self.logger.error(f"Dosya okunamadı: {e}")
+    
+    def iter_content(self, content: str) -> Iterator[DoxygenFunction]:
+        """
+        İçerikteki Doxygen fonksiyonlarını bulundukça döndür
+        
+        Args:
+            content: C dosyası içeriği
+            
+        Yields:
+            Parse edilmiş fonksiyonlar (içerikteki sırayla)
+        """
+        return self._iter_functions(content, SourceBuffer(text=content))
+    
+    def _iter_functions(self, buffer, source: SourceBuffer) -> Iterator[DoxygenFunction]:
+        """
+        Tampondaki Doxygen bloklarını fonksiyonlara çevir
+        
+        Args:
+            buffer: C dosyası içeriği (str veya mmap)
+            source: Fonksiyon kodlarının okunacağı paylaşılan kaynak
+            
+        Yields:
+            Parse edilmiş fonksiyonlar
+        """
+        for block in self._iter_doxygen_blocks(buffer):
             try:
-                function = self._parse_doxygen_block(block, content)
-                if function:
-                    functions.append(function)
+                function = self._parse_doxygen_block(block, source)
             except Exception as e:
                 self.logger.warning(f"Doxygen bloğu parse edilemedi: {e}")
                 continue
+            
+            if function:
+                yield function
+    
+    def _iter_functions_cached(self, file_path: Path, buffer, source: SourceBuffer,
+                               stat) -> Iterator[DoxygenFunction]:
+        """
+        Dosyayı parse önbelleği üzerinden fonksiyonlara çevir
         
-        self.logger.info(f"{len(functions)} fonksiyon parse edildi")
-        return functions
+        Boyutu ve mtime değeri ya da içerik hash'i değişmemiş dosyalar
+        önbellekten okunur. Değişen dosyalarda yalnızca içeriği değişen
+        bloklar yeniden parse edilir.
+        
+        Args:
+            file_path: C dosyası yolu
+            buffer: Dosya içeriği (mmap)
+            source: Fonksiyon kodlarının okunacağı paylaşılan kaynak
+            stat: Dosyanın os.stat sonucu
+            
+        Yields:
+            Parse edilmiş fonksiyonlar
+        """
+        from .parse_cache import function_from_record, function_to_record
+        
+        entry = self.cache.load(file_path)
+        records = entry['blocks'] if entry else {}
+        
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            digest = entry['content_hash']
+        else:
+            digest = self.cache.content_hash(buffer)
+        
+        if entry and entry['content_hash'] == digest:
+            self.logger.debug(f"Parse önbelleğinden okundu: {file_path}")
+            for key in entry['order']:
+                yield function_from_record(records[key], source)
+            if entry['size'] != stat.st_size or entry['mtime_ns'] != stat.st_mtime_ns:
+                self.cache.store(file_path, dict(entry, size=stat.st_size, mtime_ns=stat.st_mtime_ns))
+            return
+        
+        order = []
+        new_records = {}
+        reused = 0
+        
+        for block in self._iter_doxygen_blocks(buffer):
+            if block.signature is None:
+                continue
+            
+            # Blok hash'i: yorum, imza ve gövde metni
+            key = self.cache.content_hash(
+                bytes(buffer[block.start:max(block.end, block.code_end)]) + block.signature.encode('utf-8')
+            )
+            
+            if key in records:
+                # Gövde aynı, yalnızca konumu değişmiş olabilir
+                function = function_from_record(records[key], source)
+                function.code_span = self._extract_function_code(block)
+                reused += 1
+            else:
+                try:
+                    function = self._parse_doxygen_block(block, source)
+                except Exception as e:
+                    self.logger.warning(f"Doxygen bloğu parse edilemedi: {e}")
+                    continue
+                if not function:
+                    continue
+            
+            new_records[key] = function_to_record(function)
+            order.append(key)
+            yield function
+        
+        self.logger.debug(f"Parse önbelleği: {reused}/{len(order)} blok yeniden kullanıldı ({file_path})")
+        self.cache.store(file_path, {
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'content_hash': digest,
+            'order': order,
+            'blocks': new_records
+        })
     
-    def _extract_doxygen_blocks(self, content: str) -> List[str]:
+    def _extract_doxygen_blocks(self, content: str) -> List[DoxygenBlock]:
         """
-        İçerikten Doxygen bloklarını çıkar
+        İçerikten Doxygen bloklarını ve ardından gelen fonksiyon imzalarını çıkar
         
         Args:
             content: C dosyası içeriği
@@ -159,226 +470,282 @@ class DoxygenParser:
         Returns:
             Doxygen blokları listesi
         """
-        blocks = []
+        return list(self._iter_doxygen_blocks(content))
+    
+    def _iter_doxygen_blocks(self, buffer) -> Iterator[DoxygenBlock]:
+        """
+        Doxygen bloklarını, imzalarını ve gövde sınırlarını tek geçişte bul
         
-        # /** ile başlayan ve */ ile biten blokları bul
-        pattern = r'/\*\*.*?\*/'
-        matches = re.findall(pattern, content, re.DOTALL)
+        Yorumlar, string/karakter sabitleri ve süslü parantezler sırayla
+        taranır. Her bloğun imzası bloğun ardındaki bildirim bitmeden (ilk
+        '{' veya ';') başlamalıdır; imza kalıbına uymayan bir bildirimin
+        bloğu sonraki fonksiyona bağlanmaz, atlanır. Gövde parantez
+        yığınıyla eşleştirilir. Bloklar gövdeleri kapandığı anda dosyadaki
+        sırayla döndürülür.
         
-        for match in matches:
-            # @file tag'i varsa bu bir dosya açıklaması, atla
-            if '@file' in match:
-                continue
-                
-            # Doxygen bloğunun bittiği yeri bul
-            match_start = content.find(match)
-            match_end = match_start + len(match)
-            remaining_content = content[match_end:]
+        Args:
+            buffer: C dosyası içeriği (str veya mmap)
             
-            # Kalan içerikte fonksiyon imzasını ara (daha geniş arama)
-            lines = remaining_content.split('\n')
-            function_found = False
+        Yields:
+            Doxygen blokları (konumlar tampon birimindedir)
+        """
+        if isinstance(buffer, str):
+            token_pattern, signature_pattern, open_brace = _TOKEN_PATTERN, _SIGNATURE_PATTERN, '{'
+            end_pattern = _DECLARATION_END_PATTERN
+        else:
+            token_pattern, signature_pattern, open_brace = _TOKEN_PATTERN_BYTES, _SIGNATURE_PATTERN_BYTES, b'{'
+            end_pattern = _DECLARATION_END_PATTERN_BYTES
+        
+        queue = deque()    # sırası gelmeyi bekleyen bloklar
+        depth = 0          # açık süslü parantez sayısı
+        bodies = []        # (blok, derinlik) gövdesi kapanmamış bloklar
+        awaiting = None    # imzası doğrulanmamış blok
+        limit = -1         # awaiting bloğunun imzasının başlaması gereken son konum
+        opening = None     # gövdesinin '{' karakteri beklenen blok
+        
+        # İlk imza adayı; sonraki aramalar yalnızca aday geride kaldığında yapılır
+        candidate = signature_pattern.search(buffer)
+        
+        for token in token_pattern.finditer(buffer):
+            start, end = token.span()
             
-            for i, line in enumerate(lines):
-                line = line.strip()
-                # Boş satırları atla
-                if not line:
+            # İmza adayı, kendisinden sonraki ilk token'a göre doğrulanır
+            while awaiting is not None:
+                if candidate is None or candidate.start('signature') > limit \
+                        or (token.group(1) is not None and start <= candidate.start('signature')):
+                    # Bloğun ardındaki bildirim imza kalıbına uymuyor
+                    awaiting = None
+                elif start > candidate.start('signature'):
+                    self._set_signature(awaiting, candidate, buffer)
+                    if not awaiting.signature.endswith(';'):
+                        opening = awaiting
+                    awaiting = None
+                elif end > candidate.start('signature'):
+                    # Aday bir yorumun veya sabitin içinde, sonrasında ara
+                    candidate = signature_pattern.search(buffer, end)
                     continue
+                break
+            
+            if token.group(1) is not None:
+                # Gövdesi başlamadan yeni blok geldiyse önceki bloğun gövdesi yok
+                opening = None
+                comment = _decode(buffer, start, end)
+                
+                # @file tag'i varsa bu bir dosya açıklaması, atla
+                if '@file' not in comment:
+                    awaiting = DoxygenBlock(comment=comment, start=start, end=end)
+                    queue.append(awaiting)
+                    limit = self._find_declaration_end(buffer, end, end_pattern)
                     
-                # Fonksiyon imzasını ara (daha esnek pattern)
-                if (re.search(r'^\s*(?:const\s+)?(?:char\s*\*|int|void|float|double|long|short|unsigned|signed)\s+\w+\s*\([^)]*\)\s*\{?\s*$', line) or
-                    re.search(r'^\s*(?:const\s+)?(?:char\s*\*|int|void|float|double|long|short|unsigned|signed)\s+\w+\s*\([^)]*\)\s*;?\s*$', line)):
-                    # Doxygen bloğu ile fonksiyon arasındaki tüm satırları dahil et
-                    block_with_signature = match + '\n' + '\n'.join(lines[:i+1])
-                    blocks.append(block_with_signature)
-                    function_found = True
-                    break
+                    # Önceki arama bu konumu kapsıyorsa sonucu yeniden kullan
+                    if candidate is not None and candidate.start() < end:
+                        candidate = signature_pattern.search(buffer, end)
+            elif token.group(2) == open_brace:
+                depth += 1
+                if opening is not None:
+                    bodies.append((opening, depth))
+                    opening = None
+            elif token.group(2) is not None and depth:
+                if bodies and bodies[-1][1] == depth:
+                    bodies.pop()[0].code_end = end
+                depth -= 1
             
-            # Eğer fonksiyon bulunamadıysa, sadece Doxygen bloğunu ekle
-            if not function_found:
-                blocks.append(match)
+            while queue and queue[0] is not awaiting and queue[0] is not opening \
+                    and not any(queue[0] is block for block, _ in bodies):
+                yield queue.popleft()
         
-        return blocks
+        if awaiting is not None and candidate is not None and candidate.start('signature') <= limit:
+            self._set_signature(awaiting, candidate, buffer)
+        
+        yield from queue
     
-    def _extract_function_code(self, content: str, signature: str) -> str:
+    def _find_declaration_end(self, buffer, position: int, pattern) -> int:
         """
-        Fonksiyon kodunu çıkar
+        Doxygen bloğunun ardındaki bildirimin bittiği konumu bul
+        
+        Bildirim ilk '{' (gövde) veya parantez dışındaki ilk ';' (prototip)
+        ile biter. Tarama sonraki Doxygen bloğunda durur.
         
         Args:
-            content: C dosyası içeriği
-            signature: Fonksiyon imzası
+            buffer: C dosyası içeriği (str veya mmap)
+            position: Bloğun bittiği konum
+            pattern: Tampon türüne uygun _DECLARATION_END_PATTERN
             
         Returns:
-            Fonksiyon kodu
+            Sonlandırıcının konumu veya bildirim yoksa -1
         """
-        # Fonksiyon imzasının başladığı yeri bul
-        start_pos = content.find(signature)
-        if start_pos == -1:
-            return ""
-        
-        # Fonksiyonun başladığı yeri bul
-        brace_start = content.find('{', start_pos)
-        if brace_start == -1:
-            return ""
+        parens = 0
+        for token in pattern.finditer(buffer, position):
+            if token.group(1) is not None:
+                break
+            if token.group(2) is not None:
+                parens += 1
+            elif token.group(3) is not None:
+                parens = max(0, parens - 1)
+            elif token.group(4) is not None or (token.group(5) is not None and not parens):
+                return token.start()
+        return -1
+    
+    def _set_signature(self, block: DoxygenBlock, match, buffer) -> None:
+        """
+        Doğrulanan imza eşleşmesini bloğa işle
         
-        # Fonksiyonun bittiği yeri bul (parantez sayarak)
-        brace_count = 0
-        end_pos = brace_start
+        Args:
+            block: Doxygen bloğu
+            match: İmza eşleşmesi
+            buffer: C dosyası içeriği (str veya mmap)
+        """
+        block.signature = _decode(buffer, *match.span('signature'))
+        block.signature_start = match.start('signature')
+        block.name = _decode(buffer, *match.span('name'))
+    
+    def _extract_function_code(self, block: DoxygenBlock) -> Optional[Tuple[int, int]]:
+        """
+        Fonksiyon kodunun kaynaktaki konumunu çıkar
         
-        for i in range(brace_start, len(content)):
-            if content[i] == '{':
-                brace_count += 1
-            elif content[i] == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    end_pos = i + 1
-                    break
+        Args:
+            block: İmza ve gövde konumlarını içeren Doxygen bloğu
+            
+        Returns:
+            (offset, uzunluk) veya kodu olmayan fonksiyonlar için None
+        """
+        # Prototiplerin ve gövdesi bulunamayanların kodu yoktur
+        if block.signature_start < 0 or block.code_end < 0:
+            return None
         
-        return content[start_pos:end_pos]
+        return block.signature_start, block.code_end - block.signature_start
     
-    def _parse_doxygen_block(self, block: str, content: str) -> Optional[DoxygenFunction]:
+    def _parse_doxygen_block(self, block: DoxygenBlock, source: SourceBuffer) -> Optional[DoxygenFunction]:
         """
         Doxygen bloğunu parse et
         
         Args:
-            block: Doxygen bloğu
-            content: Orijinal dosya içeriği
+            block: Doxygen bloğu ve imza bilgisi
+            source: Fonksiyon kodlarının okunacağı paylaşılan kaynak
             
         Returns:
             Parse edilmiş fonksiyon veya None
         """
-        lines = block.split('\n')
+        if not block.signature:
+            return None
         
-        # Fonksiyon imzasını bul
-        signature = None
-        for line in lines:
-            line = line.strip()
-            # Daha esnek fonksiyon imzası arama
-            if (re.search(r'^\s*(?:const\s+)?(?:char\s*\*|int|void|float|double|long|short|unsigned|signed)\s+\w+\s*\([^)]*\)\s*\{?\s*$', line) or
-                re.search(r'^\s*(?:const\s+)?(?:char\s*\*|int|void|float|double|long|short|unsigned|signed)\s+\w+\s*\([^)]*\)\s*;?\s*$', line)):
-                signature = line.strip()
-                break
+        signature = block.signature
+        function_name = sys.intern(block.name)
         
-        if not signature:
-            return None
+        # Doxygen bilgilerini parse et
+        fields = {
+            'brief': "",
+            'details': "",
+            'params': [],
+            'return_info': None,
+            'preconditions': [],
+            'postconditions': [],
+            'notes': [],
+            'warnings': [],
+            'throws': []
+        }
         
-        # Fonksiyon adını çıkar
-        # Önce return type'ı temizle
-        signature_clean = re.sub(r'^\s*(?:const\s+)?(?:char\s*\*|int|void|float|double|long|short|unsigned|signed)\s+', '', signature)
-        name_match = re.search(r'(\w+(?:_\w+)*)\s*\(', signature_clean)
-        if not name_match:
-            return None
+        for tag, text in self._collect_tags(block.comment):
+            self.tag_handlers[tag](fields, text)
         
-        function_name = name_match.group(1)
+        return DoxygenFunction(
+            name=function_name,
+            signature=signature,
+            code_span=self._extract_function_code(block),
+            source=source,
+            **fields
+        )
+    
+    def _collect_tags(self, comment: str) -> List[Tuple[str, str]]:
+        """
+        Doxygen yorumundaki tag'leri metinleriyle birlikte topla
         
-        # Doxygen bilgilerini parse et
-        brief = ""
-        details = ""
-        params = []
-        return_info = None
-        preconditions = []
-        postconditions = []
-        notes = []
-        warnings = []
-        throws = []
-        
-        for line in lines:
-            line = line.strip()
-            
-            # @brief
-            match = self.compiled_patterns['brief'].search(line)
-            if match:
-                brief = match.group(1).strip()
-                continue
-            
-            # @details
-            match = self.compiled_patterns['details'].search(line)
-            if match:
-                details = match.group(1).strip()
-                continue
-            
-            # @param with direction (önce bunu kontrol et)
-            match = self.compiled_patterns['param_with_type'].search(line)
-            if match:
-                direction = match.group(1)
-                param_name = match.group(2)
-                param_desc = match.group(3).strip()
-                params.append(DoxygenParam(
-                    name=param_name, 
-                    description=param_desc,
-                    direction=direction
-                ))
-                continue
-            
-            # @param (basit format)
-            match = self.compiled_patterns['param'].search(line)
-            if match:
-                param_name = match.group(1)
-                param_desc = match.group(2).strip()
-                # Aynı parametre zaten eklenmiş mi kontrol et
-                if not any(p.name == param_name for p in params):
-                    params.append(DoxygenParam(name=param_name, description=param_desc))
-                continue
-            
-            # @return
-            match = self.compiled_patterns['return'].search(line)
-            if match:
-                return_desc = match.group(1).strip()
-                return_info = DoxygenReturn(description=return_desc)
-                continue
-            
-            # @pre
-            match = self.compiled_patterns['pre'].search(line)
-            if match:
-                pre_desc = match.group(1).strip()
-                preconditions.append(DoxygenPrecondition(description=pre_desc))
-                continue
+        Tag'i izleyen satırlar boş satıra veya bir sonraki tag'e kadar
+        aynı tag'in devamı sayılır.
+        
+        Args:
+            comment: Doxygen yorumu (/** ... */)
             
-            # @post
-            match = self.compiled_patterns['post'].search(line)
-            if match:
-                post_desc = match.group(1).strip()
-                postconditions.append(DoxygenPostcondition(description=post_desc))
-                continue
+        Returns:
+            (tag, metin) listesi
+        """
+        tags = []
+        current = None
+        
+        for line in comment[3:-2].split('\n'):
+            line = line.strip().lstrip('*').strip()
             
-            # @note
-            match = self.compiled_patterns['note'].search(line)
-            if match:
-                note = match.group(1).strip()
-                notes.append(note)
+            if not line:
+                current = None
                 continue
             
-            # @warning
-            match = self.compiled_patterns['warning'].search(line)
+            match = _TAG_PATTERN.match(line)
             if match:
-                warning = match.group(1).strip()
-                warnings.append(warning)
+                tag = match.group(1).lower()
+                if tag in self.tag_handlers:
+                    current = [tag, match.group(2).strip()]
+                    tags.append(current)
+                else:
+                    current = None
                 continue
             
-            # @throws
-            match = self.compiled_patterns['throws'].search(line)
-            if match:
-                throw = match.group(1).strip()
-                throws.append(throw)
-                continue
+            # Önceki tag'in devam satırı
+            if current is not None:
+                current[1] = f"{current[1]} {line}" if current[1] else line
         
-        # Fonksiyon kodunu al
-        function_code = self._extract_function_code(content, signature)
+        return [(tag, text) for tag, text in tags if text]
+    
+    def _handle_brief(self, fields: Dict[str, Any], text: str) -> None:
+        """@brief tag'ini işle"""
+        fields['brief'] = text
+    
+    def _handle_details(self, fields: Dict[str, Any], text: str) -> None:
+        """@details tag'ini işle"""
+        fields['details'] = text
+    
+    def _handle_param(self, fields: Dict[str, Any], text: str) -> None:
+        """@param tag'ini işle"""
+        match = _PARAM_PATTERN.match(text)
+        if not match:
+            return
         
-        return DoxygenFunction(
-            name=function_name,
-            signature=signature,
-            brief=brief,
-            details=details,
-            params=params,
-            return_info=return_info,
-            preconditions=preconditions,
-            postconditions=postconditions,
-            notes=notes,
-            warnings=warnings,
-            throws=throws,
-            code=function_code
-        )
+        direction, param_name, param_desc = match.groups()
+        param_name = sys.intern(param_name)
+        params = fields['params']
+        
+        if direction:
+            params.append(DoxygenParam(
+                name=param_name,
+                description=param_desc,
+                direction=sys.intern(direction.lower())
+            ))
+        # Aynı parametre zaten eklenmiş mi kontrol et
+        elif not any(p.name == param_name for p in params):
+            params.append(DoxygenParam(name=param_name, description=param_desc))
+    
+    def _handle_return(self, fields: Dict[str, Any], text: str) -> None:
+        """@return tag'ini işle"""
+        fields['return_info'] = DoxygenReturn(description=text)
+    
+    def _handle_pre(self, fields: Dict[str, Any], text: str) -> None:
+        """@pre tag'ini işle"""
+        fields['preconditions'].append(DoxygenPrecondition(description=text))
+    
+    def _handle_post(self, fields: Dict[str, Any], text: str) -> None:
+        """@post tag'ini işle"""
+        fields['postconditions'].append(DoxygenPostcondition(description=text))
+    
+    def _handle_note(self, fields: Dict[str, Any], text: str) -> None:
+        """@note tag'ini işle"""
+        fields['notes'].append(text)
+    
+    def _handle_warning(self, fields: Dict[str, Any], text: str) -> None:
+        """@warning tag'ini işle"""
+        fields['warnings'].append(text)
+    
+    def _handle_throws(self, fields: Dict[str, Any], text: str) -> None:
+        """@throws tag'ini işle"""
+        fields['throws'].append(text)
     
     def get_function_info(self, function: DoxygenFunction) -> Dict[str, Any]:
         """
@@ -410,8 +777,8 @@ class DoxygenParser:
             },
             'preconditions': [pre.description for pre in function.preconditions],
             'postconditions': [post.description for post in function.postconditions],
-            'notes': function.notes,
-            'warnings': function.warnings,
-            'throws': function.throws,
+            'notes': list(function.notes),
+            'warnings': list(function.warnings),
+            'throws': list(function.throws),
             'code': function.code
         } 
\ No newline at end of file
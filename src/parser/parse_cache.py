@@ -0,0 +1,171 @@
+"""
+Parse sonuçlarını diskte saklayan artımlı önbellek modülü
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .doxygen_parser import (
+    DoxygenFunction, DoxygenParam, DoxygenReturn,
+    DoxygenPrecondition, DoxygenPostcondition, SourceBuffer
+)
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Kayıt formatı veya parser davranışı değiştiğinde artırılmalı
+CACHE_VERSION = 3
+
+
+def function_to_record(function: DoxygenFunction) -> Dict[str, Any]:
+    """
+    Fonksiyonu JSON'a yazılabilir kayda çevir
+
+    Fonksiyon kodu kayda yazılmaz; yalnızca kaynaktaki konumu saklanır.
+
+    Args:
+        function: Doxygen fonksiyonu
+
+    Returns:
+        Fonksiyon kaydı
+    """
+    return {
+        'name': function.name,
+        'signature': function.signature,
+        'brief': function.brief,
+        'details': function.details,
+        'params': [[param.name, param.description, param.type, param.direction] for param in function.params],
+        'return_info': [function.return_info.description, function.return_info.type] if function.return_info else None,
+        'preconditions': [pre.description for pre in function.preconditions],
+        'postconditions': [post.description for post in function.postconditions],
+        'notes': list(function.notes),
+        'warnings': list(function.warnings),
+        'throws': list(function.throws),
+        'code_span': list(function.code_span) if function.code_span else None
+    }
+
+
+def function_from_record(record: Dict[str, Any], source: Optional[SourceBuffer] = None) -> DoxygenFunction:
+    """
+    Kayıttan fonksiyonu yeniden oluştur
+
+    Args:
+        record: function_to_record ile üretilmiş kayıt
+        source: Fonksiyon kodunun okunacağı kaynak
+
+    Returns:
+        Doxygen fonksiyonu
+    """
+    return DoxygenFunction(
+        name=sys.intern(record['name']),
+        signature=record['signature'],
+        brief=record['brief'],
+        details=record['details'],
+        params=[
+            DoxygenParam(
+                name=sys.intern(name),
+                description=description,
+                type=sys.intern(param_type) if param_type else None,
+                direction=sys.intern(direction) if direction else None
+            )
+            for name, description, param_type, direction in record['params']
+        ],
+        return_info=DoxygenReturn(*record['return_info']) if record['return_info'] else None,
+        preconditions=[DoxygenPrecondition(pre) for pre in record['preconditions']],
+        postconditions=[DoxygenPostcondition(post) for post in record['postconditions']],
+        notes=record['notes'],
+        warnings=record['warnings'],
+        throws=record['throws'],
+        code_span=tuple(record['code_span']) if record['code_span'] else None,
+        source=source
+    )
+
+
+class ParseCache:
+    """
+    Dosya bazında parse önbelleği
+
+    Her kaynak dosya için tek bir JSON girdisi tutulur. Girdi; dosyanın
+    boyutu/mtime değeri, içerik hash'i ve blok hash'i -> fonksiyon kaydı
+    eşlemesini içerir. Dosya değişmemişse kayıtlar doğrudan kullanılır,
+    değiştiyse yalnızca hash'i değişen bloklar yeniden parse edilir.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.logger = get_logger(__name__)
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def content_hash(data) -> str:
+        """
+        İçerik hash'i hesapla
+
+        Args:
+            data: bytes, mmap veya str içerik
+
+        Returns:
+            SHA-256 hex özeti
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        return hashlib.sha256(data).hexdigest()
+
+    def load(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Dosyanın önbellek girdisini oku
+
+        Args:
+            file_path: Kaynak dosya yolu
+
+        Returns:
+            Önbellek girdisi veya None
+        """
+        entry_path = self._entry_path(file_path)
+
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Parse önbelleği okunamadı: {entry_path} - {e}")
+            return None
+
+        if entry.get('version') != CACHE_VERSION:
+            return None
+
+        return entry
+
+    def store(self, file_path: Path, entry: Dict[str, Any]) -> None:
+        """
+        Dosyanın önbellek girdisini atomik olarak yaz
+
+        Args:
+            file_path: Kaynak dosya yolu
+            entry: Önbellek girdisi
+        """
+        entry_path = self._entry_path(file_path)
+        entry = dict(entry, version=CACHE_VERSION, path=str(file_path))
+
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(entry, f, ensure_ascii=False)
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self.logger.warning(f"Parse önbelleği yazılamadı: {entry_path} - {e}")
+
+    def _entry_path(self, file_path: Path) -> Path:
+        """Kaynak dosyanın önbellek girdisinin yolu"""
+        key = hashlib.sha1(str(Path(file_path).resolve()).encode('utf-8')).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
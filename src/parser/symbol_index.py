@@ -0,0 +1,375 @@
+"""
+Dosyalar arası kalıcı fonksiyon sembol indeksi modülü
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from .doxygen_parser import DoxygenFunction, DoxygenParser, SourceBuffer
+from .parse_cache import function_from_record, function_to_record
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS symbols (
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    code_offset INTEGER,
+    code_length INTEGER,
+    signature TEXT NOT NULL,
+    doc_hash TEXT NOT NULL,
+    code_hash TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS symbols_name ON symbols (name);
+CREATE INDEX IF NOT EXISTS symbols_path ON symbols (path);
+"""
+
+# Yazımı tamamlanmamış dosyaların kayıtları; bağlantıya özel geçici tablo
+_PENDING_SCHEMA = """
+CREATE TEMP TABLE IF NOT EXISTS pending_symbols (
+    writer INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    code_offset INTEGER,
+    code_length INTEGER,
+    signature TEXT NOT NULL,
+    doc_hash TEXT NOT NULL,
+    code_hash TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS temp.pending_symbols_writer ON pending_symbols (writer);
+"""
+
+# Dosya taranırken indekse tek seferde yazılan en fazla fonksiyon
+INDEX_BATCH_SIZE = 256
+
+
+@dataclass
+class SymbolEntry:
+    """İndeksteki fonksiyon kaydı"""
+    name: str
+    path: str
+    code_offset: Optional[int]
+    code_length: Optional[int]
+    signature: str
+    doc_hash: str
+    code_hash: str
+
+
+class SymbolIndex:
+    """
+    Fonksiyon adı -> dosya, konum, imza ve hash eşlemesi tutan SQLite indeksi
+
+    İndeks parser tarafından dosya parse edildikçe güncellenir; değişmemiş
+    dosyalar (boyut ve mtime aynı) yeniden yazılmaz. Sorgular dosyaları
+    parse etmeden, ad üzerindeki indeksle yapılır; sorgulanan dosya indekslendikten
+    sonra değiştiyse önce yeniden parse edilir.
+    """
+
+    def __init__(self, db_path: Path):
+        self.logger = get_logger(__name__)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+        self._connection.executescript(_PENDING_SCHEMA)
+        self._writer_ids = itertools.count(1)
+
+    def is_current(self, file_path: Path, stat: os.stat_result) -> bool:
+        """
+        Dosyanın indeksteki hali güncel mi
+
+        Args:
+            file_path: Kaynak dosya yolu
+            stat: Dosyanın os.stat sonucu
+
+        Returns:
+            Boyut ve mtime değişmemişse True
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size, mtime_ns FROM files WHERE path = ?", (self._key(file_path),)
+            ).fetchone()
+        return row == (stat.st_size, stat.st_mtime_ns)
+
+    def update_file(self, file_path: Path, stat: os.stat_result,
+                    functions: List[DoxygenFunction], buffer) -> None:
+        """
+        Dosyanın sembollerini yenile
+
+        Args:
+            file_path: Kaynak dosya yolu
+            stat: Dosyanın os.stat sonucu
+            functions: Dosyadan parse edilen fonksiyonlar (sırayla)
+            buffer: Dosya içeriği (mmap); kod hash'leri buradan hesaplanır
+        """
+        writer = self.begin_file(file_path, stat, buffer)
+        for function in functions:
+            writer.add(function)
+        writer.commit()
+
+    def begin_file(self, file_path: Path, stat: os.stat_result, buffer,
+                   batch_size: int = INDEX_BATCH_SIZE) -> 'FileIndexWriter':
+        """
+        Dosyanın sembollerini fonksiyonlar bulundukça yazmaya başla
+
+        Args:
+            file_path: Kaynak dosya yolu
+            stat: Dosyanın os.stat sonucu
+            buffer: Dosya içeriği (mmap); kod hash'leri buradan hesaplanır
+            batch_size: Geçici tabloya tek seferde yazılan en fazla fonksiyon
+
+        Returns:
+            commit ile dosyanın kayıtlarını değiştiren, discard ile bırakılan yazıcı
+        """
+        return FileIndexWriter(self, self._key(file_path), stat, buffer, next(self._writer_ids), batch_size)
+
+    def lookup(self, name: str) -> List[SymbolEntry]:
+        """
+        Fonksiyonun tanımlandığı yerleri bul
+
+        Args:
+            name: Fonksiyon adı
+
+        Returns:
+            Sembol kayıtları (dosya yoluna göre sıralı)
+        """
+        def query():
+            with self._lock:
+                return self._connection.execute(
+                    "SELECT name, path, code_offset, code_length, signature, doc_hash, code_hash "
+                    "FROM symbols WHERE name = ? ORDER BY path, position",
+                    (name,)
+                ).fetchall()
+
+        rows = query()
+        if self._refresh_stale({row[1] for row in rows}):
+            rows = query()
+        return [SymbolEntry(*row) for row in rows]
+
+    def get_function(self, name: str, file_path: Optional[Path] = None) -> Optional[DoxygenFunction]:
+        """
+        Fonksiyonu dosyayı parse etmeden indeksten oluştur
+
+        Args:
+            name: Fonksiyon adı
+            file_path: Aynı ad birden fazla dosyada varsa aranacak dosya
+
+        Returns:
+            Doxygen fonksiyonu (kodu dosyadan istendiğinde okunur) veya None
+        """
+        query = "SELECT path, record FROM symbols WHERE name = ?"
+        params = [name]
+        if file_path is not None:
+            query += " AND path = ?"
+            params.append(self._key(file_path))
+
+        query += " ORDER BY path, position LIMIT 1"
+
+        with self._lock:
+            row = self._connection.execute(query, params).fetchone()
+
+        if row is not None and self._refresh_stale({row[0]}):
+            with self._lock:
+                row = self._connection.execute(query, params).fetchone()
+
+        if row is None:
+            return None
+
+        path, record = row
+        return function_from_record(json.loads(record), SourceBuffer(path=Path(path)))
+
+    def _refresh_stale(self, paths) -> bool:
+        """
+        İndekslendikten sonra değişen dosyaları yeniden parse et, silinenlerin
+        sembollerini kaldır
+
+        Saklanan kod konumları (code_span) yalnızca indekslenen dosya içeriği
+        için geçerlidir; değişmiş dosyadan bu konumlarla kod okunmamalıdır.
+
+        Args:
+            paths: İndeksteki dosya yolları
+
+        Returns:
+            Herhangi bir dosyanın kayıtları değiştiyse True
+        """
+        refreshed = False
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                with self._lock, self._connection:
+                    self._connection.execute("DELETE FROM symbols WHERE path = ?", (path,))
+                    self._connection.execute("DELETE FROM files WHERE path = ?", (path,))
+                self.logger.debug(f"Sembol indeksinden silinen dosya kaldırıldı: {path}")
+                refreshed = True
+                continue
+
+            if not self.is_current(Path(path), stat):
+                self.logger.debug(f"Değişen dosya yeniden indeksleniyor: {path}")
+                DoxygenParser(index=self).parse_file(Path(path))
+                refreshed = True
+
+        return refreshed
+
+    def prune(self) -> int:
+        """
+        Artık var olmayan dosyaların sembollerini sil
+
+        Returns:
+            Silinen dosya sayısı
+        """
+        with self._lock:
+            paths = [row[0] for row in self._connection.execute("SELECT path FROM files")]
+            missing = [(path,) for path in paths if not os.path.exists(path)]
+
+            with self._connection:
+                self._connection.executemany("DELETE FROM symbols WHERE path = ?", missing)
+                self._connection.executemany("DELETE FROM files WHERE path = ?", missing)
+
+        return len(missing)
+
+    def close(self) -> None:
+        """Veritabanı bağlantısını kapat"""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _symbol_row(path: str, position: int, function: DoxygenFunction, buffer) -> tuple:
+        """Fonksiyonun symbols tablosundaki satırı"""
+        record = function_to_record(function)
+        code_offset, code_length = function.code_span or (None, None)
+        code = buffer[code_offset:code_offset + code_length] if function.code_span else b''
+
+        doc = dict(record, code_span=None)
+        return (
+            function.name,
+            path,
+            position,
+            code_offset,
+            code_length,
+            function.signature,
+            hashlib.sha256(json.dumps(doc, sort_keys=True).encode('utf-8')).hexdigest(),
+            hashlib.sha256(code).hexdigest(),
+            json.dumps(record, ensure_ascii=False)
+        )
+
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        """Dosyanın indeksteki anahtarı (mutlak yol)"""
+        return str(Path(file_path).resolve())
+
+
+class FileIndexWriter:
+    """
+    Tek dosyanın sembollerini sabit boyutlu parçalar halinde yazan yardımcı
+
+    Parçalar bağlantıya özel geçici tabloda bekler; bellekte en fazla bir
+    parça tutulur. Dosyanın eski kayıtları commit ile tek işlemde
+    değiştirilir, bu yüzden sorgular yarım yazılmış dosya görmez ve yarıda
+    bırakılan tarama indeksi değiştirmez.
+    """
+
+    def __init__(self, index: SymbolIndex, path: str, stat: os.stat_result, buffer,
+                 writer_id: int, batch_size: int):
+        self.index = index
+        self.path = path
+        self.stat = stat
+        self.count = 0
+        self._buffer = buffer
+        self._writer_id = writer_id
+        self._batch_size = max(1, batch_size)
+        self._rows = []
+        self._failed = False
+
+    def add(self, function: DoxygenFunction) -> None:
+        """
+        Fonksiyonu dosyadaki sırasıyla ekle
+
+        Args:
+            function: Dosyadan parse edilen fonksiyon
+        """
+        if self._failed:
+            return
+
+        self._rows.append(self.index._symbol_row(self.path, self.count, function, self._buffer))
+        self.count += 1
+        if len(self._rows) >= self._batch_size:
+            self._flush()
+
+    def commit(self) -> None:
+        """Bekleyen kayıtlarla dosyanın indeksteki kayıtlarını değiştir"""
+        self._flush()
+        self._buffer = None
+        if self._failed:
+            self.discard()
+            return
+
+        connection = self.index._connection
+        try:
+            with self.index._lock, connection:
+                connection.execute("DELETE FROM symbols WHERE path = ?", (self.path,))
+                connection.execute(
+                    "INSERT INTO symbols SELECT name, path, position, code_offset, code_length, signature, "
+                    "doc_hash, code_hash, record FROM pending_symbols WHERE writer = ?",
+                    (self._writer_id,)
+                )
+                connection.execute("DELETE FROM pending_symbols WHERE writer = ?", (self._writer_id,))
+                connection.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?)",
+                    (self.path, self.stat.st_size, self.stat.st_mtime_ns)
+                )
+        except sqlite3.Error as e:
+            self.index.logger.warning(f"Sembol indeksi güncellenemedi: {self.path} - {e}")
+            self.discard()
+            return
+
+        self.index.logger.debug(f"Sembol indeksi güncellendi: {self.path} ({self.count} fonksiyon)")
+
+    def discard(self) -> None:
+        """Bekleyen kayıtları indekse yazmadan bırak"""
+        self._rows = []
+        self._buffer = None
+        connection = self.index._connection
+        try:
+            with self.index._lock, connection:
+                connection.execute("DELETE FROM pending_symbols WHERE writer = ?", (self._writer_id,))
+        except sqlite3.Error:
+            # Geçici tablo bağlantı kapanınca zaten silinir
+            pass
+
+    def _flush(self) -> None:
+        """Biriken parçayı geçici tabloya yaz"""
+        if not self._rows or self._failed:
+            return
+
+        connection = self.index._connection
+        try:
+            with self.index._lock, connection:
+                connection.executemany(
+                    "INSERT INTO pending_symbols VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(self._writer_id,) + row for row in self._rows]
+                )
+        except sqlite3.Error as e:
+            self.index.logger.warning(f"Sembol indeksi güncellenemedi: {self.path} - {e}")
+            self._failed = True
+        self._rows = []
@@ -14,10 +14,54 @@ load_dotenv()
 @dataclass
 class LLMConfig:
     """LLM konfigürasyonu"""
-    api_key: str = "OPENAI_API_KEY"
+    api_key: str = "OPENAI_API_KEY"  # API anahtarının okunacağı ortam değişkeni
+    backend: str = os.getenv("LLM_BACKEND", "openrouter")  # openrouter, openai (OpenAI uyumlu sunucular)
     model: str = "deepseek/deepseek-chat-v3-0324:free"
     temperature: float = 0.1
     max_tokens: int = 2000
+    small_model: str = os.getenv("LLM_SMALL_MODEL", "")  # basit fonksiyonlar için hızlı model (boşsa yönlendirme kapalı)
+    route_threshold: float = 6.0  # karmaşıklık puanı bu değere kadar olan fonksiyonlar small_model'e gider
+    local_ranges: bool = False  # @param açıklamaları yeterliyse LLM'i atla (--local-ranges)
+    deduplicate: bool = True  # aynı (normalize) fonksiyon kopyalarını bir kez analiz et
+    use_cache: bool = True
+    cache_dir: str = ".cache/llm"
+    cache_max_mb: int = 256
+    cache_ttl_hours: int = 24 * 30  # 0: süresiz
+    pool_size: int = 10
+    connect_timeout: float = 10.0
+    read_timeout: float = 120.0
+    prewarm_connections: int = 0  # başlangıçta önceden açılacak bağlantı sayısı
+    concurrency: int = 4  # aynı anda yapılacak en fazla analiz
+    adaptive_concurrency: bool = False  # eşzamanlı istek sınırını 429/gecikmeye göre uyarla (AIMD)
+    min_concurrency: int = 1
+    max_concurrency: int = 32
+    latency_tolerance: float = 3.0  # medyan gecikmenin bu katı gecikme artışı sayılır
+    priority: str = "batch"  # komut satırı çalıştırmalarının öncelik sınıfı: interactive, batch, background
+    weight_interactive: int = 16  # öncelik sınıflarının adil paylaşım ağırlıkları
+    weight_batch: int = 4
+    weight_background: int = 1
+    interactive_reserved: int = 0  # yalnızca interactive isteklerin kullanabileceği yer sayısı
+    shared_quota: int = int(os.getenv("LLM_SHARED_QUOTA", "0"))  # süreçler arası toplam eşzamanlı istek (0: kapalı)
+    shared_quota_reserved: int = 1  # süreçler arası kotada yalnızca interactive isteklerin kullanabileceği yer sayısı
+    shared_quota_dir: str = os.getenv("LLM_SHARED_QUOTA_DIR", ".cache/llm-quota")
+    max_retries: int = 4
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 30.0
+    call_deadline: float = 300.0  # yeniden denemeler dahil çağrı başına süre sınırı (saniye)
+    hedge: bool = False  # yavaş kalan isteğin kopyasını gönder, ilk geçerli yanıtı kullan
+    hedge_percentile: float = 0.95  # kopya, gecikme bu yüzdeliği aştığında gönderilir
+    hedge_model: str = ""  # kopyanın gönderileceği model (boşsa aynı model)
+    hedge_budget: float = 0.05  # kopya isteklerin toplam isteklere oranı için üst sınır
+    hedge_min_samples: int = 20  # yüzdelik hesaplanmadan önce gereken en az gecikme ölçümü
+    breaker_threshold: int = 5  # devre kesiciyi açan art arda hata sayısı (0: kapalı)
+    breaker_reset_timeout: float = 30.0  # devre açıkken deneme isteğine kadar beklenecek süre (saniye)
+    batch_size: int = 1  # tek istekte analiz edilecek en fazla fonksiyon (1: toplu analiz kapalı)
+    batch_token_budget: int = 6000  # toplu prompt'taki fonksiyon bölümleri için yaklaşık token sınırı
+    stream: bool = False  # yanıtı SSE akışı olarak al, çıkış dosyasına geldikçe yaz
+    api_url: str = os.getenv("LLM_API_URL", "")  # boşsa backend'in varsayılan uç noktası
+    mode: str = os.getenv("LLM_MODE", "live")  # live, record, replay
+    cassette_dir: str = os.getenv("LLM_CASSETTE_DIR", "cassettes")
+    replay_latency: str = os.getenv("LLM_REPLAY_LATENCY", "none")  # none, recorded, fixed:S, lognormal:MEDYAN,SIGMA ...
 
 
 @dataclass
@@ -36,6 +80,10 @@ class ParserConfig:
     doxygen_tags: list = None
     c_standard: str = "c99"
     include_paths: list = None
+    use_cache: bool = True
+    cache_dir: str = ".cache/parser"
+    use_index: bool = True
+    index_path: str = ".cache/symbols.db"
     
     def __post_init__(self):
         if self.doxygen_tags is None:
@@ -73,9 +121,53 @@ class Config:
         """Konfigürasyonu dictionary'e çevir"""
         return {
             "llm": {
+                "backend": self.llm.backend,
                 "model": self.llm.model,
                 "temperature": self.llm.temperature,
-                "max_tokens": self.llm.max_tokens
+                "max_tokens": self.llm.max_tokens,
+                "small_model": self.llm.small_model,
+                "route_threshold": self.llm.route_threshold,
+                "local_ranges": self.llm.local_ranges,
+                "deduplicate": self.llm.deduplicate,
+                "use_cache": self.llm.use_cache,
+                "cache_dir": self.llm.cache_dir,
+                "cache_max_mb": self.llm.cache_max_mb,
+                "cache_ttl_hours": self.llm.cache_ttl_hours,
+                "pool_size": self.llm.pool_size,
+                "connect_timeout": self.llm.connect_timeout,
+                "read_timeout": self.llm.read_timeout,
+                "prewarm_connections": self.llm.prewarm_connections,
+                "concurrency": self.llm.concurrency,
+                "adaptive_concurrency": self.llm.adaptive_concurrency,
+                "min_concurrency": self.llm.min_concurrency,
+                "max_concurrency": self.llm.max_concurrency,
+                "latency_tolerance": self.llm.latency_tolerance,
+                "priority": self.llm.priority,
+                "weight_interactive": self.llm.weight_interactive,
+                "weight_batch": self.llm.weight_batch,
+                "weight_background": self.llm.weight_background,
+                "interactive_reserved": self.llm.interactive_reserved,
+                "shared_quota": self.llm.shared_quota,
+                "shared_quota_reserved": self.llm.shared_quota_reserved,
+                "shared_quota_dir": self.llm.shared_quota_dir,
+                "max_retries": self.llm.max_retries,
+                "retry_base_delay": self.llm.retry_base_delay,
+                "retry_max_delay": self.llm.retry_max_delay,
+                "call_deadline": self.llm.call_deadline,
+                "hedge": self.llm.hedge,
+                "hedge_percentile": self.llm.hedge_percentile,
+                "hedge_model": self.llm.hedge_model,
+                "hedge_budget": self.llm.hedge_budget,
+                "hedge_min_samples": self.llm.hedge_min_samples,
+                "breaker_threshold": self.llm.breaker_threshold,
+                "breaker_reset_timeout": self.llm.breaker_reset_timeout,
+                "batch_size": self.llm.batch_size,
+                "batch_token_budget": self.llm.batch_token_budget,
+                "stream": self.llm.stream,
+                "api_url": self.llm.api_url,
+                "mode": self.llm.mode,
+                "cassette_dir": self.llm.cassette_dir,
+                "replay_latency": self.llm.replay_latency
             },
             "test": {
                 "framework": self.test.framework,
@@ -87,7 +179,11 @@ class Config:
             "parser": {
                 "c_standard": self.parser.c_standard,
                 "doxygen_tags": self.parser.doxygen_tags,
-                "include_paths": self.parser.include_paths
+                "include_paths": self.parser.include_paths,
+                "use_cache": self.parser.use_cache,
+                "cache_dir": self.parser.cache_dir,
+                "use_index": self.parser.use_index,
+                "index_path": self.parser.index_path
             }
         }
 
@@ -0,0 +1,121 @@
+"""
+Toplu LLM yanıtının ayraçlara göre bölünmesi ve eksik bloklarda tekli analize dönüş
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.analyzer.llm_analyzer import LLMAnalyzer, _BATCH_BEGIN, _BATCH_END
+from src.utils.config import config
+
+NAMES = ['add_numbers', 'sub_numbers', 'mul_numbers']
+
+
+@pytest.fixture
+def analyzer(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(config.llm, 'mode', 'replay')
+    monkeypatch.setattr(config.llm, 'cassette_dir', str(tmp_path / 'cassettes'))
+    monkeypatch.setattr(config.llm, 'use_cache', False)
+    instance = LLMAnalyzer()
+    yield instance
+    instance.close()
+
+
+def block(index: int, name: str, begin: bool = True, end: bool = True) -> str:
+    lines = []
+    if begin:
+        lines.append(_BATCH_BEGIN.format(index=index, name=name))
+    lines.append(f"void test_{name}(void) {{ }}")
+    if end:
+        lines.append(_BATCH_END.format(index=index, name=name))
+    return '\n'.join(lines) + '\n'
+
+
+def function_dict(name: str):
+    return {
+        'name': name,
+        'signature': f'int {name}(int a, int b)',
+        'brief': 'İki sayıyla işlem yapar',
+        'detailed': '',
+        'params': [{'name': 'a', 'type': 'int', 'description': ''},
+                   {'name': 'b', 'type': 'int', 'description': ''}],
+        'return_type': 'int',
+        'code': f'int {name}(int a, int b) {{ return a + b; }}'
+    }
+
+
+def test_split_all_blocks(analyzer: LLMAnalyzer):
+    response = ''.join(block(index, name) for index, name in enumerate(NAMES, 1))
+    blocks = analyzer._split_batch_response(response, NAMES)
+    assert sorted(blocks) == [0, 1, 2]
+    assert blocks[1] == 'void test_sub_numbers(void) { }'
+
+
+def test_split_out_of_order_blocks(analyzer: LLMAnalyzer):
+    response = block(3, NAMES[2]) + block(1, NAMES[0]) + block(2, NAMES[1])
+    blocks = analyzer._split_batch_response(response, NAMES)
+    assert {index: code.split('(')[0] for index, code in blocks.items()} == {
+        0: 'void test_add_numbers', 1: 'void test_sub_numbers', 2: 'void test_mul_numbers'
+    }
+
+
+@pytest.mark.parametrize('response, expected', [
+    # Bitiş ayracı eksik blok sonrakini yutmamalı
+    (block(1, NAMES[0], end=False) + block(2, NAMES[1]) + block(3, NAMES[2]), [1, 2]),
+    (block(1, NAMES[0]) + block(2, NAMES[1], end=False) + block(3, NAMES[2]), [0, 2]),
+    # Başlangıç ayracı eksik
+    (block(1, NAMES[0]) + block(2, NAMES[1], begin=False) + block(3, NAMES[2]), [0, 2]),
+    # Son blok yarıda kesilmiş
+    (block(1, NAMES[0]) + block(2, NAMES[1]) + block(3, NAMES[2], end=False), [0, 1]),
+    # Bitiş ayracı başka bloğun içinde kalmış
+    (block(1, NAMES[0], end=False) + block(2, NAMES[1]) + _BATCH_END.format(index=1, name=NAMES[0]), [1]),
+])
+def test_split_missing_markers(analyzer: LLMAnalyzer, response, expected):
+    assert sorted(analyzer._split_batch_response(response, NAMES)) == expected
+
+
+def test_split_rejects_mismatched_name_and_index(analyzer: LLMAnalyzer):
+    response = (block(1, NAMES[1]) + block(2, NAMES[1]) + block(7, NAMES[2])
+                + _BATCH_BEGIN.format(index=3, name=NAMES[2]) + '\nx\n' + _BATCH_END.format(index=2, name=NAMES[2]))
+    assert sorted(analyzer._split_batch_response(response, NAMES)) == [1]
+
+
+def test_split_ignores_empty_block(analyzer: LLMAnalyzer):
+    response = (block(1, NAMES[0]) + _BATCH_BEGIN.format(index=2, name=NAMES[1]) + '\n```c\n```\n'
+                + _BATCH_END.format(index=2, name=NAMES[1]))
+    assert sorted(analyzer._split_batch_response(response, NAMES[:2])) == [0]
+
+
+def test_missing_blocks_fall_back_individually(analyzer: LLMAnalyzer, monkeypatch):
+    response = block(3, NAMES[2]) + block(1, NAMES[0], end=False) + block(2, NAMES[1])
+    monkeypatch.setattr(analyzer, '_get_llm_analysis', lambda *args, **kwargs: response)
+
+    single = []
+
+    def analyze_single(function_dict, priority=None):
+        single.append(function_dict['name'])
+        return analyzer._create_default_analysis(function_dict)
+
+    monkeypatch.setattr(analyzer, '_analyze_with_llm', analyze_single)
+
+    results = analyzer._analyze_batch_with_llm([function_dict(name) for name in NAMES])
+
+    assert single == [NAMES[0]]
+    assert [result.name for result in results] == NAMES
+    assert 'test_sub_numbers' in results[1].test_scenarios[0]['code']
+    assert 'test_mul_numbers' in results[2].test_scenarios[0]['code']
+
+
+def test_failed_batch_falls_back_for_every_function(analyzer: LLMAnalyzer, monkeypatch):
+    def fail(*args, **kwargs):
+        raise RuntimeError('bağlantı koptu')
+
+    monkeypatch.setattr(analyzer, '_get_llm_analysis', fail)
+    single = []
+    monkeypatch.setattr(analyzer, '_analyze_with_llm',
+                        lambda function_dict, priority=None: single.append(function_dict['name'])
+                        or analyzer._create_default_analysis(function_dict))
+
+    analyzer._analyze_batch_with_llm([function_dict(name) for name in NAMES])
+    assert single == NAMES
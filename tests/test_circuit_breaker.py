@@ -0,0 +1,162 @@
+"""
+Devre kesici durum geçişleri ve backend'e ulaşılamadığında yerel analize dönüş
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.analyzer import circuit_breaker
+from src.analyzer.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError
+from src.analyzer.llm_analyzer import LLMAnalyzer
+from src.generator.test_generator import TestGenerator as Generator
+from src.utils.config import config
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def analyzer(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(config.llm, 'mode', 'replay')
+    monkeypatch.setattr(config.llm, 'cassette_dir', str(tmp_path / 'cassettes'))
+    monkeypatch.setattr(config.llm, 'use_cache', False)
+    instance = LLMAnalyzer()
+    yield instance
+    instance.close()
+
+
+def open_breaker(failure_threshold: int = 3, reset_timeout: float = 30.0) -> CircuitBreaker:
+    breaker = CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=reset_timeout)
+    for _ in range(failure_threshold):
+        assert breaker.allow()
+        breaker.record_failure()
+    return breaker
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    # Araya giren başarı sayacı sıfırlar
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.check()
+    assert breaker.snapshot()['opened'] == 1
+
+
+def test_half_open_probe_success_closes(clock):
+    breaker = open_breaker()
+
+    clock[0] += 29.9
+    assert not breaker.allow()
+
+    clock[0] += 0.1
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    # Deneme sürerken diğer istekler reddedilir
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+    assert breaker.snapshot()['probes'] == 1
+    assert breaker.snapshot()['closed'] == 1
+
+
+def test_half_open_probe_failure_reopens(clock):
+    breaker = open_breaker()
+
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    # Bekleme süresi denemenin başarısız olduğu andan yeniden başlar
+    clock[0] += 29
+    assert not breaker.allow()
+    clock[0] += 1
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+
+
+def test_released_probe_lets_next_request_retry(clock):
+    breaker = open_breaker()
+
+    clock[0] += 30
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == OPEN
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+
+
+def test_reject_if_open_does_not_take_probe(clock):
+    breaker = open_breaker()
+    with pytest.raises(CircuitOpenError):
+        breaker.reject_if_open()
+
+    clock[0] += 30
+    breaker.reject_if_open()
+    assert breaker.state == OPEN
+
+    assert breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.reject_if_open()
+
+
+def test_disabled_breaker_never_opens(clock):
+    breaker = CircuitBreaker(failure_threshold=0)
+    for _ in range(10):
+        breaker.record_failure()
+    assert breaker.allow()
+    breaker.reject_if_open()
+    assert breaker.state == CLOSED
+
+
+def test_open_circuit_rejected_before_scheduling(analyzer: LLMAnalyzer, monkeypatch):
+    analyzer.breaker = open_breaker(failure_threshold=1)
+    acquired = []
+    monkeypatch.setattr(analyzer.scheduler, 'acquire', lambda priority: acquired.append(priority))
+
+    with pytest.raises(CircuitOpenError):
+        with analyzer._backend_call():
+            pass
+
+    assert acquired == []
+    assert analyzer.scheduler.snapshot()['in_flight'] == 0
+
+
+def test_open_circuit_marks_tests_for_regeneration(analyzer: LLMAnalyzer):
+    analyzer.breaker = open_breaker(failure_threshold=1)
+    function = {
+        'name': 'clamp_percent',
+        'signature': 'int clamp_percent(int value)',
+        'brief': 'Yüzdeyi sınırlar',
+        'detailed': '',
+        'params': [{'name': 'value', 'type': 'int', 'description': 'Yüzde değeri'}],
+        'return_type': 'int',
+        'code': 'int clamp_percent(int value) { return value; }'
+    }
+
+    analysis = analyzer.analyze_function(function)
+    assert analysis.needs_regeneration
+
+    suite = Generator().generate_from_analysis(analysis)
+    assert suite.test_code.startswith('// NEEDS-REGENERATION: clamp_percent')
+
+    analysis.needs_regeneration = False
+    assert 'NEEDS-REGENERATION' not in Generator().generate_from_analysis(analysis).test_code
@@ -0,0 +1,174 @@
+"""
+Uyarlanır eşzamanlılık sınırlayıcının (AIMD) artırma/azaltma kuralları
+"""
+
+from pathlib import Path
+
+import pytest
+import requests
+
+from src.analyzer import concurrency, retry
+from src.analyzer.concurrency import AdaptiveLimiter
+from src.analyzer.llm_analyzer import LLMAnalyzer
+from src.analyzer.retry import RetryPolicy
+from src.utils.config import config
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(concurrency.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def busy_limiter(**kwargs) -> AdaptiveLimiter:
+    limiter = AdaptiveLimiter(**kwargs)
+    for _ in range(limiter.limit):
+        limiter.acquire()
+    return limiter
+
+
+def test_additive_increase_about_one_per_round():
+    limiter = busy_limiter(initial=4, max_limit=8)
+
+    for _ in range(4):
+        limiter.on_success(0.1)
+    assert limiter.limit == 4
+
+    limiter.on_success(0.1)
+    assert limiter.limit == 5
+    assert limiter.snapshot()['increases'] == 1
+
+
+def test_increase_capped_at_max_limit():
+    limiter = busy_limiter(initial=3, max_limit=3)
+    for _ in range(20):
+        limiter.on_success(0.1)
+    assert limiter.limit == 3
+    assert limiter.snapshot()['increases'] == 0
+
+
+def test_no_increase_when_under_utilized():
+    limiter = AdaptiveLimiter(initial=4, max_limit=8)
+    limiter.acquire()
+
+    for _ in range(20):
+        limiter.on_success(0.1)
+    assert limiter.limit == 4
+
+    # Sınırın yarısı kullanılıyorsa artış ölçüme dayanır
+    limiter.acquire()
+    for _ in range(5):
+        limiter.on_success(0.1)
+    assert limiter.limit == 5
+
+
+def test_overload_halves_limit(clock):
+    limiter = AdaptiveLimiter(initial=8, min_limit=1)
+    limiter.on_overload('http_429')
+    assert limiter.limit == 4
+    assert limiter.snapshot()['decreases'] == 1
+    assert limiter.snapshot()['lowest_limit'] == 4
+
+
+def test_decrease_floored_at_min_limit(clock):
+    limiter = AdaptiveLimiter(initial=3, min_limit=2)
+    for _ in range(3):
+        limiter.on_overload('timeout')
+        clock[0] += 10
+    assert limiter.limit == 2
+
+
+def test_decrease_cooldown(clock):
+    limiter = busy_limiter(initial=16, max_limit=16)
+    for _ in range(5):
+        limiter.on_success(2.0)
+
+    # Aynı aşırı yük dalgası sınırı bir kez düşürür
+    limiter.on_overload('http_429')
+    limiter.on_overload('http_429')
+    clock[0] += 1.9
+    limiter.on_overload('timeout')
+    assert limiter.limit == 8
+    assert limiter.snapshot()['decreases'] == 1
+
+    # Medyan gecikme kadar süre geçince yeniden düşürülebilir
+    clock[0] += 0.1
+    limiter.on_overload('timeout')
+    assert limiter.limit == 4
+    assert limiter.snapshot()['decreases'] == 2
+
+
+def test_latency_spike_decreases(clock):
+    limiter = busy_limiter(initial=8, max_limit=8, latency_tolerance=3.0, min_samples=5)
+    for _ in range(5):
+        limiter.on_success(0.1)
+
+    limiter.on_success(0.29)
+    assert limiter.limit == 8
+
+    limiter.on_success(0.31)
+    assert limiter.limit == 4
+
+
+def test_spike_ignored_before_min_samples(clock):
+    limiter = busy_limiter(initial=8, max_limit=8, min_samples=5)
+    for _ in range(4):
+        limiter.on_success(0.1)
+    limiter.on_success(10.0)
+    assert limiter.limit == 8
+
+
+def test_try_acquire_and_release_accounting():
+    limiter = AdaptiveLimiter(initial=2, max_limit=2)
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    assert limiter.snapshot()['in_flight'] == 2
+
+    limiter.release()
+    assert limiter.try_acquire()
+    limiter.release()
+    limiter.release()
+    assert limiter.snapshot()['in_flight'] == 0
+    assert limiter.snapshot()['peak_in_flight'] == 2
+
+
+@pytest.fixture
+def analyzer(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(config.llm, 'mode', 'replay')
+    monkeypatch.setattr(config.llm, 'cassette_dir', str(tmp_path / 'cassettes'))
+    monkeypatch.setattr(config.llm, 'use_cache', False)
+    instance = LLMAnalyzer()
+    yield instance
+    instance.close()
+
+
+def test_backend_call_reports_only_final_attempt_latency(analyzer: LLMAnalyzer, monkeypatch):
+    analyzer.limiter = AdaptiveLimiter(initial=2, max_limit=2)
+    analyzer.retry_policy = RetryPolicy(max_retries=2, base_delay=0.3, max_delay=0.3)
+    monkeypatch.setattr(retry.random, 'uniform', lambda low, high: high)
+
+    latencies = []
+    monkeypatch.setattr(analyzer.limiter, 'on_success', latencies.append)
+
+    calls = []
+
+    def post(*args, **kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            raise requests.exceptions.ConnectionError('bağlantı reddedildi')
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"choices": [{"message": {"content": "ok"}}]}'
+        return response
+
+    monkeypatch.setattr(analyzer.session, 'post', post)
+
+    with analyzer._backend_call() as mark_attempt:
+        analyzer._post_with_retry({'model': 'test', 'messages': []}, on_attempt=mark_attempt)
+
+    assert len(calls) == 2
+    assert len(latencies) == 1
+    assert latencies[0] < 0.2
+    assert analyzer.limiter.snapshot()['in_flight'] == 0
@@ -0,0 +1,52 @@
+"""
+Kopya fonksiyon tekilleştirmesinin fingerprint kapsamı
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.analyzer.dedup import function_fingerprint
+from src.analyzer.llm_analyzer import LLMAnalyzer
+from src.parser import DoxygenParser
+from src.utils.config import config
+
+TEMPLATE = """/**
+ * @brief Sayının karesini hesaplar
+ * @param x Hesaplanacak sayı
+ * @pre {pre}
+ * @return Sayının karesi
+ */
+int {name}(int x) {{
+    return x * x;
+}}
+"""
+
+
+@pytest.fixture
+def analyzer(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(config.llm, 'mode', 'replay')
+    monkeypatch.setattr(config.llm, 'cassette_dir', str(tmp_path / 'cassettes'))
+    monkeypatch.setattr(config.llm, 'use_cache', False)
+    instance = LLMAnalyzer()
+    yield instance
+    instance.close()
+
+
+def fingerprints(analyzer: LLMAnalyzer, content: str):
+    functions = DoxygenParser().parse_content(content)
+    return [function_fingerprint(analyzer._to_function_dict(function)) for function in functions]
+
+
+def test_renamed_copies_share_fingerprint(analyzer):
+    content = (TEMPLATE.format(pre='x >= 0', name='square_a')
+               + TEMPLATE.format(pre='x >= 0', name='square_b'))
+    first, second = fingerprints(analyzer, content)
+    assert first == second
+
+
+def test_functions_differing_only_in_pre_are_not_deduplicated(analyzer):
+    content = (TEMPLATE.format(pre='x >= 0', name='square_a')
+               + TEMPLATE.format(pre='x <= 100', name='square_b'))
+    first, second = fingerprints(analyzer, content)
+    assert first != second
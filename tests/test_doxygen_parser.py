@@ -0,0 +1,132 @@
+"""
+Doxygen bloklarının imzalara bağlanması: imza kalıbına uymayan bildirimler
+sonraki fonksiyonun imzasını almaz
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.parser import DoxygenParser
+
+SOURCE = """/**
+ * @brief Tek satırlık gövde
+ * @param x Sayı
+ * @return Sayının iki katı
+ */
+int double_value(int x) { return x * 2; }
+
+/**
+ * @brief Satır içi yardımcı, imza kalıbına uymaz
+ */
+static inline int helper(int x) {
+    return x + 1;
+}
+
+int undocumented(int x) {
+    return helper(x);
+}
+
+/**
+ * @brief Birden çok satıra yayılan imza
+ */
+int multi_line(int first,
+               int second) {
+    return first + second;
+}
+
+int also_undocumented(void) {
+    return 0;
+}
+
+/**
+ * @brief Yapı açıklaması
+ */
+struct point {
+    int x;
+    int y;
+};
+
+/**
+ * @brief Fonksiyon işaretçisi tipi
+ */
+typedef int (*callback_t)(int value);
+
+int after_typedef(int value) {
+    return value;
+}
+
+/**
+ * @brief Parantezi sonraki satırda olan imza
+ * @return Sıfır
+ */
+int brace_on_next_line(void)
+{
+    return 0;
+}
+
+/**
+ * @brief Prototip
+ * @param value Değer
+ */
+int prototype_only(int value);
+
+/**
+ * @brief Dosyanın sonunda, ardında bildirim yok
+ */
+"""
+
+
+def names(functions):
+    return [(function.name, function.signature) for function in functions]
+
+
+EXPECTED = [
+    ('double_value', 'int double_value(int x) {'),
+    ('brace_on_next_line', 'int brace_on_next_line(void)'),
+    ('prototype_only', 'int prototype_only(int value);')
+]
+
+
+def test_unmatched_declaration_does_not_take_next_signature():
+    functions = DoxygenParser().parse_content(SOURCE)
+    assert names(functions) == EXPECTED
+
+    assert functions[0].code == 'int double_value(int x) { return x * 2; }'
+    assert functions[1].code.endswith('return 0;\n}')
+    assert not functions[2].code
+
+
+def test_mmap_scan_matches_text_scan(tmp_path: Path):
+    source = tmp_path / "mixed.c"
+    source.write_text(SOURCE, encoding='utf-8')
+    assert names(DoxygenParser().iter_file(source)) == EXPECTED
+
+
+@pytest.mark.parametrize('declaration', [
+    'static int helper(int x);',
+    'extern const struct ops *table_for(int id);',
+    'int (*resolve(int id))(void);',
+    '#define LIMIT(x) ((x) > 10 ? 10 : (x))\nstatic int limited;'
+])
+def test_block_without_matching_signature_is_skipped(declaration: str):
+    content = f"""/**
+ * @brief Eşleşmeyen bildirim
+ */
+{declaration}
+
+int next_function(int x) {{
+    return x;
+}}
+"""
+    assert DoxygenParser().parse_content(content) == []
+
+
+def test_terminator_inside_comment_or_string_is_ignored():
+    content = """/**
+ * @brief Sabitler ve yorumlar bildirim sonu sayılmaz
+ */
+// bir { yorum ;
+int with_noise(void) { return ";{"[0]; }
+"""
+    assert names(DoxygenParser().parse_content(content)) == [('with_noise', 'int with_noise(void) {')]
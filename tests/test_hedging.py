@@ -0,0 +1,211 @@
+"""
+Kopya (hedge) istekler: akışsız asıl istek, bütçe sınırı ve kaybeden isteğin iptali
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.analyzer.circuit_breaker import CLOSED
+from src.analyzer.llm_analyzer import LLMAnalyzer
+from src.utils.config import config
+
+# Model adına göre sunucu davranışı: (başlıklardan önce bekleme, gövdeden önce bekleme)
+DELAYS = {
+    'quick': (0.0, 0.0),
+    'slow': (0.0, 3.0),
+    'stalled': (1.0, 0.0),
+    'medium': (0.0, 0.3),
+    'fast': (0.0, 0.0)
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.requests.append(request)
+        before_headers, before_body = DELAYS[request['model']]
+        time.sleep(before_headers)
+
+        if request.get('stream'):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            chunked = self.protocol_version == 'HTTP/1.1'
+            if chunked:
+                self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            self.wfile.flush()
+            time.sleep(before_body)
+            event = {'choices': [{'delta': {'content': f"{request['model']} yanıtı"}}]}
+            payload = f"data: {json.dumps(event)}\n\ndata: [DONE]\n\n".encode()
+            try:
+                if chunked:
+                    payload = f"{len(payload):x}\r\n".encode() + payload + b"\r\n0\r\n\r\n"
+                self.wfile.write(payload)
+            except OSError:
+                pass
+            return
+
+        body = json.dumps({'choices': [{'message': {'role': 'assistant',
+                                                    'content': f"{request['model']} yanıtı"}}]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.flush()
+        time.sleep(before_body)
+        try:
+            self.wfile.write(body)
+        except OSError:
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(params=['HTTP/1.0', 'HTTP/1.1'])
+def server(request):
+    # HTTP/1.0'da soket yanıtın, keep-alive bağlantıda bağlantının üzerindedir
+    handler = type('Handler', (_Handler,), {'protocol_version': request.param})
+    instance = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    instance.daemon_threads = True
+    instance.requests = []
+    thread = threading.Thread(target=instance.serve_forever, daemon=True)
+    thread.start()
+    yield instance
+    instance.shutdown()
+    instance.server_close()
+
+
+@pytest.fixture
+def analyzer(server, monkeypatch):
+    monkeypatch.setattr(config.llm, 'mode', 'live')
+    monkeypatch.setattr(config.llm, 'backend', 'openai')
+    monkeypatch.setattr(config.llm, 'api_url', f"http://127.0.0.1:{server.server_port}/v1/chat/completions")
+    monkeypatch.setattr(config.llm, 'use_cache', False)
+    monkeypatch.setattr(config.llm, 'prewarm_connections', 0)
+    monkeypatch.setattr(config.llm, 'adaptive_concurrency', False)
+    monkeypatch.setattr(config.llm, 'concurrency', 4)
+    monkeypatch.setattr(config.llm, 'hedge', True)
+    monkeypatch.setattr(config.llm, 'hedge_model', 'fast')
+    monkeypatch.setattr(config.llm, 'hedge_budget', 1.0)
+    monkeypatch.setattr(config.llm, 'hedge_min_samples', 5)
+    monkeypatch.setattr(config.llm, 'hedge_percentile', 0.95)
+    instance = LLMAnalyzer()
+    yield instance
+    instance.close()
+
+
+def observe(analyzer: LLMAnalyzer, latency: float, count: int = 10) -> None:
+    for _ in range(count):
+        analyzer.backend.metrics.record(latency)
+
+
+def request(model: str):
+    return {'model': model, 'messages': [{'role': 'user', 'content': 'test'}]}
+
+
+def content(result) -> str:
+    return result['choices'][0]['message']['content']
+
+
+def wait_idle(analyzer: LLMAnalyzer, timeout: float) -> float:
+    started = time.perf_counter()
+    while analyzer.scheduler.snapshot()['in_flight'] and time.perf_counter() - started < timeout:
+        time.sleep(0.01)
+    return time.perf_counter() - started
+
+
+def test_primary_not_streamed_before_enough_samples(analyzer: LLMAnalyzer, server):
+    observe(analyzer, 0.01, count=4)
+    assert content(analyzer._complete_hedged(request('quick'))) == 'quick yanıtı'
+    assert [req.get('stream') for req in server.requests] == [None]
+
+
+def test_primary_not_streamed_when_no_hedge_fires(analyzer: LLMAnalyzer, server):
+    observe(analyzer, 5.0)
+    assert content(analyzer._complete_hedged(request('quick'))) == 'quick yanıtı'
+
+    assert [req.get('stream') for req in server.requests] == [None]
+    assert analyzer.hedge_stats.snapshot().get('hedged', 0) == 0
+    assert analyzer.scheduler.snapshot()['in_flight'] == 0
+
+
+def test_hedge_wins_and_loser_is_closed(analyzer: LLMAnalyzer, server):
+    observe(analyzer, 0.05)
+    started = time.perf_counter()
+    result = analyzer._complete_hedged(request('slow'))
+
+    assert content(result) == 'fast yanıtı'
+    assert time.perf_counter() - started < 1.0
+    assert [(req['model'], req.get('stream')) for req in server.requests] == [('slow', None), ('fast', True)]
+
+    stats = analyzer.hedge_stats.snapshot()
+    assert stats['hedged'] == 1
+    assert stats['hedge_wins'] == 1
+    assert stats['cancelled'] == 1
+
+    # Kaybeden asıl isteğin soketi kapatılır; yanıtın gelmesi (3 sn) beklenmez
+    assert wait_idle(analyzer, 2.0) < 1.0
+    assert analyzer.scheduler.snapshot()['in_flight'] == 0
+
+    # İptal, backend hatası sayılmaz
+    assert analyzer.breaker.snapshot()['consecutive_failures'] == 0
+    assert analyzer.breaker.state == CLOSED
+    assert analyzer.backend.metrics.failures == 0
+
+
+def test_loser_keeps_its_slot_until_connection_closes(analyzer: LLMAnalyzer, server):
+    observe(analyzer, 0.05)
+    result = analyzer._complete_hedged(request('stalled'))
+    assert content(result) == 'fast yanıtı'
+
+    # Asıl isteğin başlıkları henüz gelmedi; bağlantı kapanana kadar yeri dolu kalır
+    assert analyzer.scheduler.snapshot()['in_flight'] == 1
+    assert wait_idle(analyzer, 3.0) > 0.5
+    assert analyzer.scheduler.snapshot()['in_flight'] == 0
+
+
+def test_primary_wins_when_hedge_is_slower(analyzer: LLMAnalyzer, server, monkeypatch):
+    monkeypatch.setattr(config.llm, 'hedge_model', 'slow')
+    observe(analyzer, 0.05)
+    result = analyzer._complete_hedged(request('medium'))
+
+    assert content(result) == 'medium yanıtı'
+    stats = analyzer.hedge_stats.snapshot()
+    assert stats['hedged'] == 1
+    assert stats.get('hedge_wins', 0) == 0
+    assert stats['cancelled'] == 1
+    assert wait_idle(analyzer, 2.0) < 1.0
+
+
+def test_budget_caps_hedged_requests(analyzer: LLMAnalyzer, server, monkeypatch):
+    monkeypatch.setattr(config.llm, 'hedge_budget', 0.5)
+    # Asıl isteklerin gecikmeleri yüzdeliği kaydırmasın
+    observe(analyzer, 0.05, count=200)
+
+    for _ in range(4):
+        analyzer._complete_hedged(request('medium'))
+        wait_idle(analyzer, 2.0)
+
+    # hedged + 1 > budget * requests ise kopya gönderilmez: 1. ve 3. istek reddedilir
+    stats = analyzer.hedge_stats.snapshot()
+    assert stats['requests'] == 4
+    assert stats['hedged'] == 2
+    assert stats['budget_denied'] == 2
+    assert [req['model'] for req in server.requests].count('fast') == 2
+
+
+def test_hedge_needs_free_capacity(analyzer: LLMAnalyzer, server, monkeypatch):
+    monkeypatch.setattr(config.llm, 'concurrency', 1)
+    observe(analyzer, 0.05)
+
+    assert content(analyzer._complete_hedged(request('medium'))) == 'medium yanıtı'
+    stats = analyzer.hedge_stats.snapshot()
+    assert stats['capacity_denied'] == 1
+    assert stats.get('hedged', 0) == 0
+    assert [req['model'] for req in server.requests] == ['medium']
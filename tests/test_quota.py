@@ -0,0 +1,169 @@
+"""
+Süreçler arası paylaşılan kota: ayrılmış interactive yerler, başka süreçteki
+kilitler ve analizörün backend çağrılarıyla birlikte çalışması
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.analyzer.llm_analyzer import LLMAnalyzer
+from src.analyzer.quota import SharedQuota
+from src.analyzer.scheduler import PRIORITY_BACKGROUND, PRIORITY_BATCH, PRIORITY_INTERACTIVE
+from src.utils.config import config
+
+pytestmark = pytest.mark.skipif(not SharedQuota.available(), reason="fcntl yok")
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Kotadan bir batch yeri alıp stdin kapanana kadar tutan ayrı süreç
+HOLDER = """
+import sys
+from src.analyzer.quota import SharedQuota
+quota = SharedQuota(sys.argv[1], int(sys.argv[2]), reserved_interactive=1)
+quota.acquire(sys.argv[3])
+print('held', flush=True)
+sys.stdin.read()
+"""
+
+
+@pytest.fixture
+def holder(tmp_path: Path):
+    processes = []
+
+    def start(slots: int, priority: str = PRIORITY_BATCH) -> subprocess.Popen:
+        process = subprocess.Popen([sys.executable, '-c', HOLDER, str(tmp_path / 'quota'), str(slots), priority],
+                                   cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        processes.append(process)
+        assert process.stdout.readline().strip() == 'held'
+        return process
+
+    yield start
+    for process in processes:
+        process.kill()
+        process.wait()
+
+
+def test_reserved_slot_only_for_interactive(tmp_path: Path):
+    first = SharedQuota(tmp_path, slots=2, reserved_interactive=1)
+    second = SharedQuota(tmp_path, slots=2, reserved_interactive=1)
+
+    token = first.try_acquire(PRIORITY_BATCH)
+    assert token is not None
+    assert second.try_acquire(PRIORITY_BATCH) is None
+    assert second.try_acquire(PRIORITY_BACKGROUND) is None
+
+    interactive = second.try_acquire(PRIORITY_INTERACTIVE)
+    assert interactive is not None
+    assert second.try_acquire(PRIORITY_INTERACTIVE) is None
+
+    first.release(token)
+    batch = second.try_acquire(PRIORITY_BATCH)
+    assert batch is not None
+    assert second.snapshot()['held'] == 2
+    assert first.snapshot()['held'] == 0
+
+    second.release(batch)
+    second.release(interactive)
+    assert second.snapshot()['held'] == 0
+
+
+def test_interactive_prefers_reserved_slot(tmp_path: Path):
+    quota = SharedQuota(tmp_path, slots=3, reserved_interactive=1)
+    interactive = quota.try_acquire(PRIORITY_INTERACTIVE)
+
+    # interactive ayrılmış yeri aldığı için paylaşımlı iki yer toplu işlere kalır
+    first = quota.try_acquire(PRIORITY_BATCH)
+    second = quota.try_acquire(PRIORITY_BATCH)
+    assert first is not None and second is not None
+    assert quota.try_acquire(PRIORITY_BATCH) is None
+
+    for token in (interactive, first, second):
+        quota.release(token)
+
+
+def test_at_least_one_shared_slot(tmp_path: Path):
+    quota = SharedQuota(tmp_path, slots=1, reserved_interactive=3)
+    assert quota.reserved_interactive == 0
+    token = quota.try_acquire(PRIORITY_BATCH)
+    assert token is not None
+    quota.release(token)
+
+
+def test_other_process_blocks_batch_but_not_interactive(tmp_path: Path, holder):
+    process = holder(slots=2)
+    quota = SharedQuota(tmp_path / 'quota', slots=2, reserved_interactive=1)
+
+    assert quota.try_acquire(PRIORITY_BATCH) is None
+    token = quota.try_acquire(PRIORITY_INTERACTIVE)
+    assert token is not None
+    quota.release(token)
+
+    # Süreç kapanınca (çökse bile) kilidi işletim sistemi bırakır
+    process.kill()
+    process.wait()
+    token = quota.try_acquire(PRIORITY_BATCH)
+    assert token is not None
+    quota.release(token)
+
+
+def test_acquire_waits_and_records_per_class(tmp_path: Path, holder):
+    process = holder(slots=2)
+    quota = SharedQuota(tmp_path / 'quota', slots=2, reserved_interactive=1, poll_interval=0.01)
+
+    quota.release(quota.acquire(PRIORITY_INTERACTIVE))
+
+    threading.Timer(0.3, process.stdin.close).start()
+    started = time.monotonic()
+    quota.release(quota.acquire(PRIORITY_BATCH))
+    assert time.monotonic() - started >= 0.25
+
+    classes = quota.snapshot()['classes']
+    assert classes[PRIORITY_INTERACTIVE]['requests'] == 1
+    assert classes[PRIORITY_INTERACTIVE]['max_wait'] < 0.1
+    assert classes[PRIORITY_BATCH]['requests'] == 1
+    assert classes[PRIORITY_BATCH]['max_wait'] >= 0.25
+    assert classes[PRIORITY_BACKGROUND]['requests'] == 0
+
+
+def test_invalid_priority(tmp_path: Path):
+    quota = SharedQuota(tmp_path, slots=1)
+    with pytest.raises(ValueError):
+        quota.try_acquire('urgent')
+
+
+@pytest.fixture
+def analyzer(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(config.llm, 'mode', 'replay')
+    monkeypatch.setattr(config.llm, 'cassette_dir', str(tmp_path / 'cassettes'))
+    monkeypatch.setattr(config.llm, 'use_cache', False)
+    monkeypatch.setattr(config.llm, 'shared_quota', 2)
+    monkeypatch.setattr(config.llm, 'shared_quota_reserved', 1)
+    monkeypatch.setattr(config.llm, 'shared_quota_dir', str(tmp_path / 'quota'))
+    instance = LLMAnalyzer()
+    yield instance
+    instance.close()
+
+
+def test_backend_call_holds_shared_slot(analyzer: LLMAnalyzer, holder):
+    assert analyzer.quota is not None
+
+    with analyzer._backend_call(PRIORITY_INTERACTIVE):
+        assert analyzer.quota.snapshot()['held'] == 1
+    assert analyzer.quota.snapshot()['held'] == 0
+
+    # Başka süreç paylaşımlı yeri tutarken kopya istek için yer ayrılmaz
+    holder(slots=2)
+    assert analyzer._acquire_hedge_slot(PRIORITY_BATCH) is None
+    assert analyzer.scheduler.snapshot()['in_flight'] == 0
+
+    slot = analyzer._acquire_hedge_slot(PRIORITY_INTERACTIVE)
+    assert slot is not None
+    assert analyzer.quota.snapshot()['held'] == 1
+    slot.close()
+    assert analyzer.quota.snapshot()['held'] == 0
+    assert analyzer.scheduler.snapshot()['in_flight'] == 0
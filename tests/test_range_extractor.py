@@ -0,0 +1,76 @@
+"""
+@param açıklamalarından yerel aralık çıkarımı
+"""
+
+import pytest
+
+from src.analyzer.range_extractor import RangeExtractor
+
+INT_MIN = -2147483648
+INT_MAX = 2147483647
+
+
+@pytest.fixture
+def extractor():
+    return RangeExtractor()
+
+
+@pytest.mark.parametrize('description, expected', [
+    ("must not exceed 255", {'min': INT_MIN, 'max': 255}),
+    ("must not be less than 0", {'min': 0, 'max': INT_MAX}),
+    ("cannot be negative", {'min': 0, 'max': INT_MAX}),
+    ("should not be greater than 10", {'min': INT_MIN, 'max': 10}),
+    ("0 dan büyük olmamalı", {'min': INT_MIN, 'max': 0}),
+    ("should not exceed 100 but > 0", {'min': 1, 'max': 100}),
+    ("no more than 10", {'min': INT_MIN, 'max': 10}),
+    ("negatif olmamalı", {'min': 0, 'max': INT_MAX}),
+])
+def test_negated_bounds_are_inverted(extractor, description, expected):
+    assert extractor.extract('x', description, 'int').valid_range == expected
+
+
+@pytest.mark.parametrize('description, expected', [
+    ("0 to 100", {'min': 0, 'max': 100}),
+    ("must be > 0", {'min': 1, 'max': INT_MAX}),
+    ("must be >= 0 and < 10", {'min': 0, 'max': 9}),
+    ("en az 1, en fazla 10", {'min': 1, 'max': 10}),
+    ("[0, 255]", {'min': 0, 'max': 255}),
+    ("Must be between 1 and 10 (see RFC 1234)", {'min': 1, 'max': 10}),
+])
+def test_plain_bounds(extractor, description, expected):
+    assert extractor.extract('x', description, 'int').valid_range == expected
+
+
+@pytest.mark.parametrize('description', [
+    "value < 0 means error",
+    "see RFC 1234-5678",
+    "must not be between 1 and 10",
+    "size < 10",
+    "positive and negative",
+])
+def test_ambiguous_or_conflicting_text_is_not_covered(extractor, description):
+    assert extractor.extract('x', description, 'int') is None
+
+
+def test_plain_words_are_not_enum_values(extractor):
+    assert extractor.extract('mode', "values: fast or slow", 'int') is None
+
+
+def test_symbolic_values_need_an_enum_type(extractor):
+    assert extractor.extract('color', "one of RED, GREEN", 'int') is None
+
+    analysis = extractor.extract('color', "one of RED, GREEN", 'color_t')
+    assert analysis.invalid_values == ['(color_t)-1']
+    assert [cls['representative_value'] for cls in analysis.equivalence_classes[:2]] == ['RED', 'GREEN']
+
+
+def test_function_with_negated_bound_is_not_analyzed_as_opposite_range(extractor):
+    function_dict = {
+        'name': 'set_level',
+        'signature': 'int set_level(int level)',
+        'params': [{'name': 'level', 'description': 'must not exceed 255', 'type': 'int'}],
+        'brief': 'Seviye ayarlar'
+    }
+    analysis = extractor.analyze_function(function_dict)
+    assert analysis.parameters[0].valid_range['max'] == 255
+    assert 256 in analysis.parameters[0].invalid_values
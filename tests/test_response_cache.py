@@ -0,0 +1,100 @@
+"""
+LLM yanıt önbelleğinin TTL, LRU ve sayaç davranışı
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.analyzer import response_cache
+from src.analyzer.response_cache import ResponseCache
+
+
+def request(n: int):
+    return {'model': 'test', 'messages': [{'role': 'user', 'content': f'istek {n}'}]}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(response_cache.time, 'time', lambda: now[0])
+    return now
+
+
+def test_entry_expires_after_ttl(tmp_path: Path, clock):
+    cache = ResponseCache(tmp_path, ttl=60)
+    key = cache.make_key(request(1))
+    cache.put(key, 'yanıt')
+
+    clock[0] += 59
+    assert cache.get(key) == 'yanıt'
+
+    clock[0] += 2
+    assert cache.get(key) is None
+    assert not cache._entry_path(key).exists()
+    assert cache.stats() == {'hits': 1, 'misses': 1}
+
+
+def test_entry_without_ttl_never_expires(tmp_path: Path, clock):
+    cache = ResponseCache(tmp_path)
+    key = cache.make_key(request(1))
+    cache.put(key, 'yanıt')
+
+    clock[0] += 10 * 365 * 24 * 3600
+    assert cache.get(key) == 'yanıt'
+
+
+def test_evict_removes_least_recently_used(tmp_path: Path):
+    cache = ResponseCache(tmp_path)
+    keys = [cache.make_key(request(n)) for n in range(3)]
+    for n, key in enumerate(keys):
+        cache.put(key, 'x' * 100)
+        os.utime(cache._entry_path(key), (1000 + n, 1000 + n))
+
+    # En eski kayda erişmek onu en yeni yapar
+    assert cache.get(keys[0]) is not None
+
+    entry_size = cache._entry_path(keys[0]).stat().st_size
+    cache.max_bytes = 2 * entry_size + 50
+    assert cache.evict() == 1
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_put_over_limit_triggers_eviction(tmp_path: Path):
+    cache = ResponseCache(tmp_path)
+    first = cache.make_key(request(1))
+    cache.put(first, 'x' * 100)
+    os.utime(cache._entry_path(first), (1000, 1000))
+
+    # Kayıt boyutu created alanının uzunluğuna göre birkaç bayt değişebilir
+    cache.max_bytes = cache._entry_path(first).stat().st_size + 50
+    second = cache.make_key(request(2))
+    cache.put(second, 'x' * 100)
+
+    assert not cache._entry_path(first).exists()
+    assert cache._entry_path(second).exists()
+
+
+def test_counters_are_thread_safe(tmp_path: Path):
+    cache = ResponseCache(tmp_path)
+    hit_key = cache.make_key(request(1))
+    miss_key = cache.make_key(request(2))
+    cache.put(hit_key, 'yanıt')
+
+    def worker():
+        for _ in range(200):
+            cache.get(hit_key)
+            cache.get(miss_key)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.stats() == {'hits': 1600, 'misses': 1600}
@@ -0,0 +1,92 @@
+"""
+Yeniden deneme politikası: Retry-After, full jitter ve hata sınıflandırması
+"""
+
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from src.analyzer import retry
+from src.analyzer.retry import RETRYABLE_STATUS, RetryPolicy, classify_error, parse_retry_after
+
+
+def response(status: int = 429, **headers) -> requests.Response:
+    result = requests.Response()
+    result.status_code = status
+    result.headers.update(headers)
+    return result
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('5', 5.0),
+    ('0', 0.0),
+    ('2.5', 2.5),
+    ('-3', 0.0),
+])
+def test_retry_after_seconds(value, expected):
+    assert parse_retry_after(response(**{'Retry-After': value})) == expected
+
+
+def test_retry_after_http_date(monkeypatch):
+    now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    monkeypatch.setattr(retry.time, 'time', lambda: now.timestamp())
+
+    later = now.replace(second=30)
+    assert parse_retry_after(response(**{'Retry-After': format_datetime(later, usegmt=True)})) == pytest.approx(30.0)
+
+    earlier = now.replace(hour=11)
+    assert parse_retry_after(response(**{'Retry-After': format_datetime(earlier, usegmt=True)})) == 0.0
+
+
+@pytest.mark.parametrize('headers', [{}, {'Retry-After': ''}, {'Retry-After': 'yakında'}])
+def test_retry_after_missing_or_invalid(headers):
+    assert parse_retry_after(response(**headers)) is None
+
+
+def test_retry_after_without_response():
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.parametrize('attempt, cap', [(0, 1.0), (1, 2.0), (3, 8.0), (5, 30.0), (20, 30.0)])
+def test_backoff_full_jitter_bounds(monkeypatch, attempt, cap):
+    policy = RetryPolicy(base_delay=1.0, max_delay=30.0)
+    calls = []
+    monkeypatch.setattr(retry.random, 'uniform', lambda low, high: calls.append((low, high)) or high)
+
+    assert policy.backoff(attempt) == cap
+    assert calls == [(0, cap)]
+
+
+def test_backoff_samples_stay_in_range():
+    policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+    for attempt in range(8):
+        cap = min(4.0, 0.5 * 2 ** attempt)
+        samples = [policy.backoff(attempt) for _ in range(200)]
+        assert all(0 <= sample <= cap for sample in samples)
+
+
+@pytest.mark.parametrize('status', sorted(RETRYABLE_STATUS))
+def test_retryable_status(status):
+    error = requests.exceptions.HTTPError(response=response(status))
+    assert classify_error(error) == f"http_{status}"
+
+
+@pytest.mark.parametrize('status', [400, 401, 403, 404, 413, 422, 501])
+def test_permanent_status(status):
+    error = requests.exceptions.HTTPError(response=response(status))
+    assert classify_error(error) is None
+
+
+@pytest.mark.parametrize('error, expected', [
+    (requests.exceptions.ReadTimeout(), 'timeout'),
+    (requests.exceptions.ConnectTimeout(), 'timeout'),
+    (requests.exceptions.ConnectionError(), 'connection'),
+    (requests.exceptions.ChunkedEncodingError(), 'connection'),
+    (requests.exceptions.HTTPError(), None),
+    (requests.exceptions.InvalidURL(), None),
+    (ValueError(), None),
+])
+def test_classify_transport_errors(error, expected):
+    assert classify_error(error) == expected
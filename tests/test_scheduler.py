@@ -0,0 +1,191 @@
+"""
+Öncelik zamanlayıcısı: ağırlıklı sıralama, interactive ayrılmış yerler ve yer sayımı
+"""
+
+import threading
+import time
+
+import pytest
+
+from src.analyzer.scheduler import (PRIORITY_BACKGROUND, PRIORITY_BATCH, PRIORITY_INTERACTIVE,
+                                    RequestScheduler)
+
+
+def queue_and_drain(scheduler: RequestScheduler, priorities):
+    """
+    Tek yer doluyken istekleri sırayla kuyruğa al, sonra yeri bırakıp
+    isteklerin yer alma sırasını döndür
+    """
+    order = []
+    threads = []
+
+    def worker(label, priority):
+        scheduler.acquire(priority)
+        order.append(label)
+        scheduler.release()
+
+    scheduler.acquire(PRIORITY_INTERACTIVE)
+    for index, priority in enumerate(priorities):
+        thread = threading.Thread(target=worker, args=(f"{priority}{index}", priority))
+        thread.start()
+        threads.append(thread)
+        # Kuyruğa girme sırası belirli olsun
+        while sum(waits['queued'] for waits in scheduler.snapshot()['classes'].values()) < index + 1:
+            time.sleep(0.001)
+
+    scheduler.release()
+    for thread in threads:
+        thread.join(5)
+    return [label.rstrip('0123456789') for label in order]
+
+
+def test_stride_order_follows_weights():
+    scheduler = RequestScheduler(capacity=lambda: 1, reserved_interactive=0)
+    order = queue_and_drain(scheduler, [PRIORITY_BACKGROUND] * 3 + [PRIORITY_BATCH] * 6)
+
+    # batch ağırlığı 4, background 1: her background isteğine karşılık dört batch isteği
+    assert order == [
+        PRIORITY_BATCH, PRIORITY_BACKGROUND,
+        PRIORITY_BATCH, PRIORITY_BATCH, PRIORITY_BATCH, PRIORITY_BATCH, PRIORITY_BACKGROUND,
+        PRIORITY_BATCH, PRIORITY_BACKGROUND
+    ]
+
+
+def test_custom_weights():
+    scheduler = RequestScheduler(capacity=lambda: 1, reserved_interactive=0,
+                                 weights={PRIORITY_BATCH: 1, PRIORITY_BACKGROUND: 1})
+    order = queue_and_drain(scheduler, [PRIORITY_BACKGROUND] * 3 + [PRIORITY_BATCH] * 3)
+    assert order == [PRIORITY_BATCH, PRIORITY_BACKGROUND] * 3
+
+
+def test_interactive_jumps_queue():
+    scheduler = RequestScheduler(capacity=lambda: 1, reserved_interactive=0)
+    order = queue_and_drain(scheduler, [PRIORITY_BATCH] * 4 + [PRIORITY_INTERACTIVE])
+    assert order[0] == PRIORITY_INTERACTIVE
+
+
+def test_interactive_backlog_shares_by_weight():
+    scheduler = RequestScheduler(capacity=lambda: 1, reserved_interactive=0)
+    order = queue_and_drain(scheduler, [PRIORITY_BATCH] * 2 + [PRIORITY_INTERACTIVE] * 6)
+
+    # Biriken interactive istekler batch'i tamamen durdurmaz (16'ya 4)
+    assert order == [
+        PRIORITY_INTERACTIVE, PRIORITY_BATCH,
+        PRIORITY_INTERACTIVE, PRIORITY_INTERACTIVE, PRIORITY_INTERACTIVE, PRIORITY_INTERACTIVE,
+        PRIORITY_BATCH, PRIORITY_INTERACTIVE
+    ]
+
+
+def test_idle_class_does_not_bank_credit():
+    scheduler = RequestScheduler(capacity=lambda: 1, reserved_interactive=0)
+    queue_and_drain(scheduler, [PRIORITY_BATCH] * 8)
+
+    # Uzun süre boşta kalan background birikmiş hakla batch'in önüne yığılmaz
+    order = queue_and_drain(scheduler, [PRIORITY_BATCH] * 4 + [PRIORITY_BACKGROUND] * 3)
+    assert order.index(PRIORITY_BACKGROUND) <= 1
+    assert order[2:6].count(PRIORITY_BACKGROUND) == 1
+
+
+def test_reserved_slot_only_for_interactive():
+    scheduler = RequestScheduler(capacity=lambda: 3, reserved_interactive=1)
+    assert scheduler.try_acquire(PRIORITY_BATCH)
+    assert scheduler.try_acquire(PRIORITY_BACKGROUND)
+    assert not scheduler.try_acquire(PRIORITY_BATCH)
+
+    # Toplu işler paylaşımlı yerleri doldurduğunda batch kuyrukta bekler
+    granted = threading.Event()
+
+    def batch():
+        scheduler.acquire(PRIORITY_BATCH)
+        granted.set()
+
+    thread = threading.Thread(target=batch)
+    thread.start()
+    assert not granted.wait(0.1)
+
+    # interactive istek ayrılmış yeri beklemeden alır
+    started = time.monotonic()
+    scheduler.acquire(PRIORITY_INTERACTIVE)
+    assert time.monotonic() - started < 0.1
+    assert scheduler.snapshot()['in_flight'] == 3
+
+    scheduler.release()
+    assert not granted.wait(0.1)
+
+    # Paylaşımlı yer boşalınca batch isteği devam eder
+    scheduler.release()
+    assert granted.wait(1)
+    thread.join(1)
+    assert scheduler.snapshot()['in_flight'] == 2
+
+
+def test_reservation_ignored_when_capacity_is_one():
+    scheduler = RequestScheduler(capacity=lambda: 1, reserved_interactive=1)
+    assert scheduler.try_acquire(PRIORITY_BATCH)
+    assert not scheduler.try_acquire(PRIORITY_INTERACTIVE)
+    scheduler.release()
+
+
+def test_try_acquire_and_release_accounting():
+    scheduler = RequestScheduler(capacity=lambda: 2, reserved_interactive=0)
+    assert scheduler.try_acquire(PRIORITY_BATCH)
+    assert scheduler.try_acquire(PRIORITY_BATCH)
+    assert not scheduler.try_acquire(PRIORITY_INTERACTIVE)
+    assert scheduler.snapshot()['in_flight'] == 2
+
+    scheduler.release()
+    scheduler.release()
+    assert scheduler.snapshot()['in_flight'] == 0
+
+    # try_acquire kuyruk istatistiklerine eklenmez
+    assert scheduler.snapshot()['classes'][PRIORITY_BATCH]['requests'] == 0
+
+    with scheduler.slot(PRIORITY_BATCH):
+        assert scheduler.snapshot()['in_flight'] == 1
+    assert scheduler.snapshot()['in_flight'] == 0
+    assert scheduler.snapshot()['classes'][PRIORITY_BATCH]['requests'] == 1
+
+
+def test_try_acquire_does_not_overtake_queue():
+    scheduler = RequestScheduler(capacity=lambda: 2, reserved_interactive=1)
+    scheduler.acquire(PRIORITY_BATCH)
+    thread = threading.Thread(target=lambda: (scheduler.acquire(PRIORITY_BATCH), scheduler.release()))
+    thread.start()
+    while scheduler.snapshot()['classes'][PRIORITY_BATCH]['queued'] == 0:
+        time.sleep(0.001)
+
+    # Ayrılmış yer boş olsa da kuyrukta bekleyen varken kopya istek araya girmez
+    assert not scheduler.try_acquire(PRIORITY_INTERACTIVE)
+    assert scheduler.snapshot()['in_flight'] == 1
+
+    scheduler.release()
+    thread.join(1)
+    assert scheduler.snapshot()['in_flight'] == 0
+    assert scheduler.try_acquire(PRIORITY_INTERACTIVE)
+    scheduler.release()
+
+
+def test_wait_recorded_per_class():
+    scheduler = RequestScheduler(capacity=lambda: 1, reserved_interactive=0)
+    scheduler.acquire(PRIORITY_INTERACTIVE)
+    thread = threading.Thread(target=lambda: (scheduler.acquire(PRIORITY_BACKGROUND), scheduler.release()))
+    thread.start()
+    while scheduler.snapshot()['classes'][PRIORITY_BACKGROUND]['queued'] == 0:
+        time.sleep(0.001)
+    time.sleep(0.2)
+    scheduler.release()
+    thread.join(1)
+
+    classes = scheduler.snapshot()['classes']
+    assert classes[PRIORITY_INTERACTIVE]['requests'] == 1
+    assert classes[PRIORITY_INTERACTIVE]['max_wait'] < 0.1
+    assert classes[PRIORITY_BACKGROUND]['requests'] == 1
+    assert classes[PRIORITY_BACKGROUND]['max_wait'] >= 0.2
+
+
+def test_invalid_priority():
+    scheduler = RequestScheduler(capacity=lambda: 1)
+    with pytest.raises(ValueError):
+        scheduler.acquire('urgent')
+    with pytest.raises(ValueError):
+        scheduler.try_acquire('urgent')
@@ -0,0 +1,113 @@
+"""
+Sembol indeksinin değişen dosyalarla tutarlılığı
+"""
+
+from pathlib import Path
+
+from src.parser import DoxygenParser, SymbolIndex
+
+SOURCE = """/**
+ * @brief Sayının karesini hesaplar
+ * @param x Hesaplanacak sayı
+ * @return Sayının karesi
+ */
+int square_number(int x) {
+    return x * x;
+}
+"""
+
+
+def test_get_function_after_file_edit(tmp_path: Path):
+    source = tmp_path / "square.c"
+    source.write_text(SOURCE, encoding='utf-8')
+
+    index = SymbolIndex(tmp_path / "symbols.db")
+    DoxygenParser(index=index).parse_file(source)
+    assert index.get_function('square_number').code.startswith('int square_number(int x)')
+
+    # Dosyanın başına satır eklenince saklanan kod konumu kayar
+    source.write_text('#include <stdio.h>\n' + SOURCE, encoding='utf-8')
+
+    function = index.get_function('square_number')
+    assert function.code.startswith('int square_number(int x)')
+    assert function.code.rstrip().endswith('}')
+    assert index.lookup('square_number')[0].code_offset == SOURCE.encode('utf-8').find(b'int square') + len('#include <stdio.h>\n')
+    index.close()
+
+
+def test_lookup_after_file_removed(tmp_path: Path):
+    source = tmp_path / "square.c"
+    source.write_text(SOURCE, encoding='utf-8')
+
+    index = SymbolIndex(tmp_path / "symbols.db")
+    DoxygenParser(index=index).parse_file(source)
+    source.unlink()
+
+    assert index.lookup('square_number') == []
+    assert index.get_function('square_number') is None
+    index.close()
+
+
+def many_functions(count: int) -> str:
+    return ''.join(SOURCE.replace('square_number', f'square_{index}') for index in range(count))
+
+
+def row_counts(index: SymbolIndex):
+    connection = index._connection
+    return (connection.execute("SELECT COUNT(*) FROM symbols").fetchone()[0],
+            connection.execute("SELECT COUNT(*) FROM pending_symbols").fetchone()[0])
+
+
+def test_iter_file_writes_index_in_batches(tmp_path: Path):
+    source = tmp_path / "many.c"
+    source.write_text(many_functions(600), encoding='utf-8')
+    index = SymbolIndex(tmp_path / "symbols.db")
+
+    functions = DoxygenParser(index=index).iter_file(source)
+    for _ in range(300):
+        next(functions)
+
+    # Bulunan fonksiyonlar parçalar halinde geçici tabloda bekler; sorgular
+    # dosyanın yarım halini görmez
+    assert row_counts(index) == (0, 256)
+
+    assert len(list(functions)) == 300
+    assert row_counts(index) == (600, 0)
+    assert [entry.name for entry in index.lookup('square_599')] == ['square_599']
+    assert index.is_current(source, source.stat())
+    index.close()
+
+
+def test_abandoned_iteration_leaves_index_unchanged(tmp_path: Path):
+    source = tmp_path / "many.c"
+    source.write_text(many_functions(3), encoding='utf-8')
+    index = SymbolIndex(tmp_path / "symbols.db")
+    DoxygenParser(index=index).parse_file(source)
+
+    source.write_text(many_functions(600), encoding='utf-8')
+    functions = DoxygenParser(index=index).iter_file(source)
+    for _ in range(300):
+        next(functions)
+    functions.close()
+
+    assert row_counts(index) == (3, 0)
+    assert not index.is_current(source, source.stat())
+    index.close()
+
+
+def test_writer_replaces_file_rows_on_commit(tmp_path: Path):
+    source = tmp_path / "many.c"
+    source.write_text(many_functions(5), encoding='utf-8')
+    index = SymbolIndex(tmp_path / "symbols.db")
+    functions = DoxygenParser().parse_file(source)
+
+    index.update_file(source, source.stat(), functions[:1], source.read_bytes())
+    writer = index.begin_file(source, source.stat(), source.read_bytes(), batch_size=2)
+    for function in functions:
+        writer.add(function)
+    assert row_counts(index) == (1, 4)
+
+    writer.commit()
+    assert row_counts(index) == (5, 0)
+    assert [entry.name for entry in index.lookup('square_4')] == ['square_4']
+    index.close()